@@ -7,6 +7,9 @@ various sources.
 
 __version__ = "0.1.4"
 
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING
+
 # Import casts
 from superconf.casts import (  # as_option,
     as_boolean,
@@ -76,29 +79,68 @@ from superconf.fields import (  # FieldOption,
     FieldTuple,
 )
 
-# Import anchors
-from superconf.lib.anchors import (
-    ABS,
-    ABSOLUTE,
-    REL,
-    RELATIVE,
-    FileAnchor,
-    PathAnchor,
-)
+# Anchors, sources, views and 12-factor helpers load on first access (PEP 562):
+# they pull parsers and helpers that plain ConfigurationObj users never need.
+_LAZY_ATTRS = {
+    "ABS": "superconf.lib.anchors",
+    "ABSOLUTE": "superconf.lib.anchors",
+    "REL": "superconf.lib.anchors",
+    "RELATIVE": "superconf.lib.anchors",
+    "FileAnchor": "superconf.lib.anchors",
+    "PathAnchor": "superconf.lib.anchors",
+    "ConfigSource": "superconf.sources",
+    "DictSource": "superconf.sources",
+    "EnvSource": "superconf.sources",
+    "JsonSource": "superconf.sources",
+    "TomlSource": "superconf.sources",
+    "YamlSource": "superconf.sources",
+    "TwelveFactorError": "superconf.twelve_factor",
+    "build_12factor_view": "superconf.twelve_factor",
+    "from_12factor": "superconf.twelve_factor",
+    "load_12factor": "superconf.twelve_factor",
+    "TWELVE_FACTOR_ORDER": "superconf.views",
+    "View": "superconf.views",
+}
 
-# Multi-source views / converters (optional API)
-from superconf.sources import (
-    ConfigSource,
-    DictSource,
-    EnvSource,
-    JsonSource,
-    TomlSource,
-    YamlSource,
-)
-from superconf.twelve_factor import (
-    TwelveFactorError,
-    build_12factor_view,
-    from_12factor,
-    load_12factor,
-)
-from superconf.views import TWELVE_FACTOR_ORDER, View
+if TYPE_CHECKING:
+    from superconf.lib.anchors import (
+        ABS,
+        ABSOLUTE,
+        REL,
+        RELATIVE,
+        FileAnchor,
+        PathAnchor,
+    )
+    from superconf.sources import (
+        ConfigSource,
+        DictSource,
+        EnvSource,
+        JsonSource,
+        TomlSource,
+        YamlSource,
+    )
+    from superconf.twelve_factor import (
+        TwelveFactorError,
+        build_12factor_view,
+        from_12factor,
+        load_12factor,
+    )
+    from superconf.views import TWELVE_FACTOR_ORDER, View
+
+__all__ = [
+    name for name in globals() if not name.startswith("_") and name != "TYPE_CHECKING"
+] + list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    "Import lazy public names on first access"
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -4,8 +4,9 @@
 import json
 import logging
 import os
+from collections.abc import Mapping
 
-import yaml
+from superconf.lib.frozen import FrozenDict, FrozenList
 
 # pylint: disable=unused-import
 from superconf.lib.sentinels import (
@@ -69,20 +70,75 @@ def to_json(obj, nice=True):
     return json.dumps(obj, cls=CustomJSONEncoder)
 
 
+# (module, loader, dumper, backend name), set on first YAML use
+_YAML = None
+
+
+def _yaml():
+    "Import PyYAML on first use and pick the libyaml classes when built in"
+    global _YAML  # pylint: disable=global-statement
+    if _YAML is None:
+        import yaml  # pylint: disable=import-outside-toplevel
+
+        loader = getattr(yaml, "CSafeLoader", None)
+        dumper = getattr(yaml, "CDumper", None)
+        backend = "libyaml"
+        if loader is None or dumper is None:
+            loader, dumper, backend = yaml.SafeLoader, yaml.Dumper, "python"
+
+        # Frozen (cached) data dumps like plain dicts and lists
+        for _dumper in (yaml.Dumper, yaml.SafeDumper, dumper):
+            _dumper.add_representer(FrozenDict, yaml.SafeDumper.represent_dict)
+            _dumper.add_representer(FrozenList, yaml.SafeDumper.represent_list)
+        _YAML = (yaml, loader, dumper, backend)
+    return _YAML
+
+
+def yaml_module():
+    "Import PyYAML on first use, keeps it out of the package import time"
+    return _yaml()[0]
+
+
+def yaml_backend():
+    "Return the YAML backend in use: ``libyaml`` (C) or ``python``"
+    return _yaml()[3]
+
+
 def from_yaml(string):
     "Transform YAML string to python dict"
-    return yaml.safe_load(string)
+    yaml, loader, _, _ = _yaml()
+    return yaml.load(string, Loader=loader)
+
+
+def from_yaml_all(stream):
+    "Iterate over the documents of a YAML string or file stream, one at a time"
+    yaml, loader, _, _ = _yaml()
+    yield from yaml.load_all(stream, Loader=loader)
 
 
 def to_yaml(obj):
     "Transform obj to YAML"
-    return yaml.dump(obj)
+    yaml, _, dumper, _ = _yaml()
+    return yaml.dump(obj, Dumper=dumper)
+
+
+def read_file_bytes(file):
+    "Read whole file content as bytes, in one call"
+    with open(file, "rb") as _file:
+        return _file.read()
+
+
+def decode_text(data):
+    "Decode UTF-8 bytes like a text mode read, with universal newlines"
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def read_file(file):
     "Read file content"
-    with open(file, encoding="utf-8") as _file:
-        return "".join(_file.readlines())
+    return decode_text(read_file_bytes(file))
 
 
 def write_file(file, content, create_dirs=True):
@@ -129,6 +185,41 @@ def unique(seq):
     return [x for x in seq if not (x in seen or seen_add(x))]
 
 
+def build_path_index(data, sep=".", skip_unset=True, index_lists=False):
+    """Flatten nested mappings into a dotted path to value index.
+
+    Keys containing ``sep`` or that are not strings are not addressable by
+    path and are skipped along with their subtree.
+
+    Args:
+        data: Nested mapping.
+        sep: Path separator.
+        skip_unset: Skip NOT_SET values and their subtree when True.
+        index_lists: Also index list items by position (``items.0.name``).
+
+    Returns:
+        Dict of path to value, containing every nesting level.
+    """
+    index = {}
+    pending = [("", data)]
+    while pending:
+        prefix, node = pending.pop()
+        if isinstance(node, list):
+            items = ((str(pos), val) for pos, val in enumerate(node))
+        else:
+            items = node.items()
+        for key, value in items:
+            if not isinstance(key, str) or sep in key:
+                continue
+            if skip_unset and is_not_set(value):
+                continue
+            path = prefix + key
+            index[path] = value
+            if isinstance(value, Mapping) or (index_lists and isinstance(value, list)):
+                pending.append((path + sep, value))
+    return index
+
+
 # Re-export merge API (implementation lives in merge.py)
 from superconf.merge import (  # noqa: E402  pylint: disable=wrong-import-position
     MERGE_APPEND,
@@ -147,9 +238,13 @@ from superconf.merge import (  # noqa: E402  pylint: disable=wrong-import-positi
     MERGE_REPLACE,
     MergeKind,
     MergeStrategy,
+    compile_merge,
     ensure_merge_strategy,
     infer_merge_kind,
     is_merge_value_set,
+    merge_all,
+    merge_all_data,
+    merge_all_maps,
     merge_data,
     merge_dict_data,
     merge_list_data,
@@ -3,8 +3,11 @@
 import inspect
 import logging
 from collections import OrderedDict
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
-from superconf import exceptions
+from superconf import exceptions, nodes
 from superconf.casts import as_dict, as_is, as_list
 from superconf.common import (
     MERGE_DICT_DEFAULT,
@@ -13,8 +16,13 @@ from superconf.common import (
     NOT_SET_DICT,
     NOT_SET_LIST,
     UNSET_ARG,
+    build_path_index,
+    ensure_merge_strategy,
+    is_not_set,
+    merge_all_maps,
     merge_data,
     merge_maps,
+    normalize_merge_strategy,
     truncate,
     unique,
 )
@@ -25,10 +33,121 @@ from superconf.leaf import (
     LeafObjConfig,
     PublicField,
 )
-from superconf.merge import MergeKind
+from superconf.lib.frozen import FrozenDict, FrozenList, freeze, thaw
+from superconf.lib.projection import Projection
+from superconf.merge import MergeKind, MergeStrategy
+from superconf.nodes import NodeMeta, node_class_plan, query_class_config
 
 logger = logging.getLogger(__name__)
 
+_NO_KWARGS = MappingProxyType({})
+
+# Snapshot cache slot of the dotted path index
+_PATH_INDEX = "path_index"
+
+
+class _DictSnapshot(dict):
+    "Cached dict value of a container, copied before being returned"
+
+    __slots__ = ()
+
+
+class _ListSnapshot(list):
+    "Cached list value of a container, copied before being returned"
+
+    __slots__ = ()
+
+
+def _thaw_snapshot(value):
+    """Copy container levels of a cached snapshot into plain dicts/lists.
+
+    Leaf values are returned as-is, like ``Leaf.get_value`` does, except
+    read-only values of frozen leafs that are copied.
+
+    Args:
+        value: Snapshot or leaf value.
+
+    Returns:
+        Plain value safe to hand over to callers.
+    """
+    kind = type(value)
+    if kind is _DictSnapshot:
+        return {key: _thaw_snapshot(val) for key, val in value.items()}
+    if kind is _ListSnapshot:
+        return [_thaw_snapshot(val) for val in value]
+    if kind is FrozenDict or kind is FrozenList:
+        return thaw(value)
+    return value
+
+
+class _PendingChild:
+    "Recipe of a child node not instanciated yet"
+
+    __slots__ = ("cls", "kwargs")
+
+    def __init__(self, cls, kwargs):
+        self.cls = cls
+        self.kwargs = kwargs
+
+    def build(self):
+        "Instanciate the child node"
+        return self.cls(**self.kwargs)
+
+
+class LazyChildren(MutableMapping):
+    """Children mapping that instanciates child nodes on first access.
+
+    Keys are known upfront and keep their order; each child is built from
+    its recipe the first time it is read through ``[]``, ``get``, ``values``
+    or ``items``. Iterating keys, ``len`` and ``in`` never build children.
+    """
+
+    __slots__ = ("_slots",)
+
+    def __init__(self):
+        self._slots = {}
+
+    def defer(self, child_key, cls, kwargs):
+        "Register a child to build later with ``cls(**kwargs)``"
+        self._slots[child_key] = _PendingChild(cls, kwargs)
+
+    def is_built(self, key):
+        "Return True if child has already been instanciated"
+        return not isinstance(self._slots[key], _PendingChild)
+
+    def __getitem__(self, key):
+        child = self._slots[key]
+        if isinstance(child, _PendingChild):
+            child = child.build()
+            self._slots[key] = child
+        return child
+
+    def __setitem__(self, key, value):
+        self._slots[key] = value
+
+    def __delitem__(self, key):
+        del self._slots[key]
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __iter__(self):
+        return iter(self._slots)
+
+    def __len__(self):
+        return len(self._slots)
+
+    def update(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        "Update children, keeping pending children of other LazyChildren lazy"
+        if len(args) == 1 and not kwargs and isinstance(args[0], LazyChildren):
+            self._slots.update(args[0]._slots)  # pylint: disable=protected-access
+            return
+        super().update(*args, **kwargs)
+
+    def __repr__(self):
+        built = [key for key in self._slots if self.is_built(key)]
+        return f"{self.__class__.__name__}(keys={list(self._slots)}, built={built})"
+
 
 class _ContainerInstance(Leaf):
     "Container instance, either a dict or a list"
@@ -42,6 +161,11 @@ class _ContainerInstance(Leaf):
         help=None,
         children_class=Leaf,
     )
+    __node_lazy__ = False
+    __node_cache_attrs__ = Leaf.__node_cache_attrs__ + (
+        "__node_value_cache__",
+        "__node_frozen_value__",
+    )
 
     def __node_init__(self, **kwargs):
         "Prepare Container instance"
@@ -50,8 +174,17 @@ class _ContainerInstance(Leaf):
         children_class = kwargs.pop("children_class", UNSET_ARG)
         super().__node_init__(**kwargs)
 
+        # Fetch lazy children settings
+        self.__node_lazy__ = self.__node_get_self_config__(
+            "lazy",
+            overrides=[
+                self.__node_field__.query("lazy"),
+            ],
+            default=self.__node_config__.query("lazy"),
+        )
+
         # Configure instance
-        self.__node_children__ = {}
+        self.__node_children__ = self._new_children()
 
         # Fetch node_children_class settings
         _report = []
@@ -66,6 +199,12 @@ class _ContainerInstance(Leaf):
         )
         self.__node_children_class__ = _children_class
 
+    def _new_children(self):
+        "Return an empty children mapping, lazy or not"
+        if self.__node_lazy__ is True:
+            return LazyChildren()
+        return {}
+
     def _resolve_children_class(self):
         """Return children class when it is a real class, else None.
 
@@ -78,6 +217,106 @@ class _ContainerInstance(Leaf):
             return None
         return children_class
 
+    def _node_snapshot(self, nodefaults=False):
+        """Return the cached value snapshot, building it when dirty.
+
+        Snapshots are cached per ``nodefaults`` variant and dropped by
+        ``_node_mark_dirty`` when the container or a descendant changes.
+        Subtrees with volatile values are rebuilt on every call.
+
+        Args:
+            nodefaults: Same as ``get_value`` nodefaults.
+
+        Returns:
+            Tuple of ``(snapshot, volatile)``.
+        """
+        if type(self).get_value not in _SNAPSHOT_GET_VALUES:
+            return self.get_value(nodefaults=nodefaults), True
+
+        cache = self.__dict__.get("__node_value_cache__")
+        if cache is not None and nodefaults in cache:
+            return cache[nodefaults], False
+
+        snapshot, volatile = self._node_build_snapshot(nodefaults)
+        if not volatile:
+            self.__dict__.setdefault("__node_value_cache__", {})[nodefaults] = snapshot
+        return snapshot, volatile
+
+    def _node_build_snapshot(self, nodefaults):
+        "Build snapshot from children, return (snapshot, volatile)"
+        raise NotImplementedError("Subclass must implement this method")
+
+    def _node_value_view(self, nodefaults):
+        """Return the container value for ``get_value``.
+
+        Args:
+            nodefaults: Same as ``get_value`` nodefaults.
+
+        Returns:
+            Plain copy of the snapshot, or a cached read-only ``FrozenDict``
+            or ``FrozenList`` when the container is frozen.
+        """
+        if not self.__node_frozen__:
+            return _thaw_snapshot(self._node_snapshot(nodefaults)[0])
+
+        cache = self.__dict__.get("__node_frozen_value__")
+        if cache is not None and nodefaults in cache:
+            return cache[nodefaults]
+        snapshot, volatile = self._node_build_snapshot(nodefaults)
+        value = freeze(snapshot)
+        if not volatile:
+            self.__dict__.setdefault("__node_frozen_value__", {})[nodefaults] = value
+        return value
+
+    def freeze(self):
+        """Lock the container and all its children against changes.
+
+        Lazy children are built first. Frozen containers return read-only
+        values from ``get_value`` and can be hashed and compared by value.
+
+        Returns:
+            The container itself.
+        """
+        if self.__node_children__:
+            for child in self.__node_children__.values():
+                if not child.__node_frozen__:
+                    child.freeze()
+        self.__dict__.pop("__node_frozen_value__", None)
+        return super().freeze()
+
+    def get_path_value(self, path, default=UNSET_ARG):
+        """Return the value at a dotted path of children (``db.pool.size``).
+
+        Paths are served from an index built on the cached value snapshot,
+        dropped along with it when the tree changes.
+
+        Args:
+            path: Dotted path, list items are addressed by position.
+            default: Returned when the path is missing.
+
+        Returns:
+            Value at path.
+
+        Raises:
+            KeyError: If the path is missing and no default is given.
+        """
+        snapshot, volatile = self._node_snapshot(False)
+        if volatile:
+            index = build_path_index(snapshot, skip_unset=False, index_lists=True)
+        else:
+            cache = self.__dict__["__node_value_cache__"]
+            index = cache.get(_PATH_INDEX)
+            if index is None:
+                index = build_path_index(snapshot, skip_unset=False, index_lists=True)
+                cache[_PATH_INDEX] = index
+
+        value = index.get(path, UNSET_ARG)
+        if value is not UNSET_ARG:
+            return _thaw_snapshot(value)
+        if default is not UNSET_ARG:
+            return default
+        raise KeyError(f"{self.__class__.__name__} has no path {path}")
+
     def deepcopy(self):
         "Deep copy the container and its children"
 
@@ -86,8 +325,12 @@ class _ContainerInstance(Leaf):
         if self.__node_children__ is not None:
             children = {}
             for key, val in self.__node_children__.items():
-                children[key] = val.deepcopy()
+                child = val.deepcopy()
+                child.__node_parent__ = inst
+                children[key] = child
             inst.__node_children__ = children
+            if inst.__node_frozen__:
+                inst.freeze()
 
         return inst
 
@@ -116,7 +359,7 @@ class _ContainerInstance(Leaf):
 
         if len(args) == 1:
             value = args[0]
-            value = super().set_value(value)
+            value = self._apply_casted(value, "__node_value__", "value")
             self.__node__set_children__(value)
             return value
         if len(args) == 2:
@@ -163,8 +406,14 @@ class ConfigurationDict(_ContainerInstance):
         ), f"Expected a dict for {self.__node_fname__}, got: {type(value)}={value}"
 
         # Instanciate children
-        children = {}
+        children = self._new_children()
         for key, val in value.items():
+            if self.__node_lazy__ is True:
+                children.defer(
+                    key, children_class, {"parent": self, "key": key, "value": val}
+                )
+                continue
+
             logger.info(
                 "Instanciate ConfigurationDict child %s: %s(%s)",
                 key,
@@ -181,6 +430,7 @@ class ConfigurationDict(_ContainerInstance):
             self.__node_children__.update(children)
         else:
             assert False, f"Invalid mode {mode}"
+        self._node_mark_dirty()
 
     def get_children(self):
         "Get children as key/value dict"
@@ -207,17 +457,23 @@ class ConfigurationDict(_ContainerInstance):
             return self.get_key_value(key, default=default, nodefaults=nodefaults)
 
         if self.__node_children__ is not NOT_SET:
-            ret = {}
-            for _key, child in self.__node_children__.items():
-                ret[_key] = child.get_value(nodefaults=nodefaults)
-
-            return ret
+            return self._node_value_view(nodefaults)
 
         if default == UNSET_ARG:
             default = super().get_default()
 
         return default
 
+    def _node_build_snapshot(self, nodefaults):
+        "Build dict snapshot from children, return (snapshot, volatile)"
+        out = _DictSnapshot()
+        volatile = False
+        for _key, child in self.__node_children__.items():
+            value, child_volatile = child._node_snapshot(nodefaults)
+            out[_key] = value
+            volatile = volatile or child_volatile
+        return out, volatile
+
     def get_key_value(self, key, default=UNSET_ARG, nodefaults=False):
         "Get parsed value for a given key (ask children first, then defaults or unset)"
 
@@ -258,8 +514,10 @@ class ConfigurationDict(_ContainerInstance):
         return self.get(key, mode="node")
 
     def __getitem__(self, key):
-        "Get item. always return value"
+        "Get item. always return value, dotted keys are looked up as paths"
 
+        if isinstance(key, str) and "." in key and key not in self.get_children():
+            return self.get_path_value(key)
         try:
             return self.get(key, mode="value")
         except exceptions.UnknownChild:
@@ -279,6 +537,10 @@ class ConfigurationDict(_ContainerInstance):
         "Set attribute"
         if self.__node_children__ and key in self.__node_children__:
             self.__node_children__[key].set_value(value)
+        elif self.__node_frozen__ and not key.startswith("_"):
+            raise exceptions.FrozenConfiguration(
+                f"Can't set attribute {key} of frozen {self.__node_fname__ or self}"
+            )
         else:
             super().__setattr__(key, value)
 
@@ -341,11 +603,351 @@ class ConfigurationDict(_ContainerInstance):
             strategy,
             merge_both=lambda left, right: left.merge(right),
         )
-        out = {key: child.get_value() for key, child in merged_children.items()}
-        return type(self)(value=out, key=self.__node_key__)
+        if not self._node_merge_compatible(other):
+            out = {key: child.get_value() for key, child in merged_children.items()}
+            return type(self)(value=out, key=self.__node_key__)
+
+        children = self._new_children()
+        children.update(merged_children)
+        return self._node_merged(children)
+
+    def merge_all(self, others):
+        """Merge many containers in one pass, same as chained ``merge`` calls.
+
+        Children are gathered per key across all inputs and merged once,
+        only the final tree is built.
+
+        Args:
+            others: Containers to merge over this one, by increasing precedence.
+
+        Returns:
+            Merged container, this node when there is nothing to merge.
+        """
+        others = list(others)
+        if not others:
+            return self
+        if not all(self._node_merge_compatible(other) for other in others):
+            return super().merge_all(others)
+
+        strategy = self._merge_strategy_for(others[0], MERGE_DICT_DEFAULT)
+        logger.info(
+            "Merge Container %s(%s) with %s nodes strategy=%s",
+            self.__class__.__name__,
+            self.__node_fname__,
+            len(others),
+            strategy,
+        )
+
+        merged_children = merge_all_maps(
+            [self.get_children()] + [other.get_children() for other in others],
+            strategy,
+            merge_many=lambda nodes: nodes[0].merge_all(nodes[1:]),
+        )
+        children = self._new_children()
+        children.update(merged_children)
+        return self._node_merged(children)
+
+    def _node_merge_compatible(self, other):
+        "Return True when other children can be reused in a merge result"
+        return (
+            type(other) is type(self)
+            and other.__node_children_class__ is self.__node_children_class__
+        )
+
+    def _node_merged(self, children):
+        """Return a detached clone of this container holding ``children``.
+
+        Nodes built by the merge (without parent) are adopted, input nodes
+        are cloned without re-casting so the result never shares nodes with
+        its inputs.
+
+        Args:
+            children: Children mapping of the merge result.
+
+        Returns:
+            The merged container.
+        """
+        inst = self._node_clone(
+            __node_parent__=None, __node_value__=NOT_SET, __node_children__=children
+        )
+        for key, child in list(children.items()):
+            if child.__node_parent__ is None:
+                child.__node_parent__ = inst
+                child.__node_key__ = key
+            else:
+                children[key] = child._node_detached(inst, key)
+        return inst
 
+    def _node_detached(self, parent, key):
+        """Return a clone of this container and its children, owned by parent.
 
-class DeclarativeValuesMetaclass(type):
+        Args:
+            parent: Container owning the clone.
+            key: Key of the clone in ``parent``.
+
+        Returns:
+            The cloned container.
+        """
+        inst = super()._node_detached(parent, key)
+        own = self.__node_children__
+        if own is not None and not is_not_set(own):
+            # Empty mappings too, the clone must not share them
+            children = self._new_children()
+            for child_key, child in own.items():
+                children[child_key] = child._node_detached(inst, child_key)
+            inst.__dict__["__node_children__"] = children
+        return inst
+
+
+class SchemaEntry(NamedTuple):
+    "Compiled declared field of a ConfigurationObj schema"
+
+    attr: str
+    key: str
+    field: GenericField
+    instance_class: type
+    default: Any
+    init_kwargs: Mapping[str, Any]
+
+
+class ConfigurationSchema:
+    """Immutable table of declared fields for a ConfigurationObj.
+
+    Holds for each declared field its resolved key, instance class, field
+    default and the child settings (cast, merge, children_class) that can be
+    resolved from classes alone. Instances only read this table.
+    """
+
+    __slots__ = ("entries", "keys", "fields", "by_key", "by_attr")
+
+    def __init__(self, entries):
+        entries = tuple(entries)
+        by_key = {}
+        by_attr = {}
+        for entry in entries:
+            by_key.setdefault(entry.key, []).append(entry)
+            by_attr.setdefault(entry.attr, []).append(entry)
+
+        object.__setattr__(self, "entries", entries)
+        object.__setattr__(self, "keys", tuple(entry.key for entry in entries))
+        object.__setattr__(self, "fields", tuple(e.field for e in entries))
+        object.__setattr__(
+            self, "by_key", MappingProxyType({k: tuple(v) for k, v in by_key.items()})
+        )
+        object.__setattr__(
+            self,
+            "by_attr",
+            MappingProxyType({k: tuple(v) for k, v in by_attr.items()}),
+        )
+
+    def lookup(self, key=None, attr=None):
+        """Return entries matching key or attr, in declaration order.
+
+        Args:
+            key: Child key to look up.
+            attr: Child attribute name to look up.
+
+        Returns:
+            Tuple of matching ``SchemaEntry``.
+        """
+        by_key = self.by_key.get(key, ()) if key else ()
+        by_attr = self.by_attr.get(attr, ()) if attr else ()
+        if not by_attr:
+            return by_key
+        if not by_key:
+            return by_attr
+        matched = {id(entry) for entry in by_key + by_attr}
+        return tuple(entry for entry in self.entries if id(entry) in matched)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self.keys)})"
+
+
+def _child_init_kwargs(field, instance_class):
+    """Resolve child settings that only depend on classes.
+
+    Mirrors the lookups done by ``Leaf.__node_init__`` and
+    ``_ContainerInstance.__node_init__``: field override, then child class
+    Meta, then child class config default.
+
+    Args:
+        field: Declared field of the child.
+        instance_class: Class the child is instantiated from.
+
+    Returns:
+        Read-only mapping of keyword arguments for the child constructor.
+    """
+    out = {}
+    if not inspect.isclass(instance_class) or not issubclass(instance_class, Leaf):
+        return MappingProxyType(out)
+
+    cast = query_class_config(instance_class, "cast", [field.query("cast")])
+    if cast is not UNSET_ARG:
+        out["cast"] = cast
+
+    merge = query_class_config(instance_class, "merge", [field.query("merge")])
+    if merge is not UNSET_ARG:
+        out["merge"] = normalize_merge_strategy(merge)
+
+    if issubclass(instance_class, _ContainerInstance):
+        children_class = query_class_config(
+            instance_class, "children_class", [field.query("children_class")]
+        )
+        if children_class is not UNSET_ARG:
+            out["children_class"] = children_class
+
+    return MappingProxyType(out)
+
+
+def compile_schema(children_classes):
+    """Compile declared fields into a ``ConfigurationSchema``.
+
+    Args:
+        children_classes: Ordered mapping of attribute name to field.
+
+    Returns:
+        The compiled schema.
+
+    Raises:
+        TypeError: If a declared child is not a GenericField.
+    """
+    entries = []
+    # A field instance reused under several names keeps its first key
+    seen_keys = {}
+    for attr, field in children_classes.items():
+        if not isinstance(field, GenericField):
+            raise TypeError(
+                f"Expected a GenericField for {attr}, got {type(field).__name__}"
+            )
+        key = seen_keys.get(id(field)) or field.key or attr
+        seen_keys[id(field)] = key
+        entries.append(
+            SchemaEntry(
+                attr=attr,
+                key=key,
+                field=field,
+                instance_class=field.instance_class,
+                default=field.query("default"),
+                init_kwargs=_child_init_kwargs(field, field.instance_class),
+            )
+        )
+    return ConfigurationSchema(entries)
+
+
+# Field attribute access
+# ----------------------------
+# Declared fields get a non-data descriptor on their class, so reading
+# ``config.field`` skips the failed attribute lookup, ``__getattr__`` and
+# ``get``. Instance attributes still win, and misses fall back to
+# ``__getattr__``, so results are the same as without descriptors. Classes
+# overriding the lookup methods, even after creation, read through them.
+
+# Leaf types whose value reads skip get_value, keyed by type: (epoch, flag)
+_PLAIN_LEAF_READS = {}
+
+
+def _plain_leaf_read(cls):
+    "Return True when cls reads values with the library Leaf methods"
+    epoch = nodes.node_plan_epoch()
+    hit = _PLAIN_LEAF_READS.get(cls)
+    if hit is None or hit[0] != epoch:
+        hit = (
+            epoch,
+            cls.get_value is Leaf.get_value
+            and cls.get_default is Leaf.get_default
+            and cls.post_dump is Leaf.post_dump,
+        )
+        _PLAIN_LEAF_READS[cls] = hit
+    return hit[1]
+
+
+# ConfigurationDict methods resolving attribute reads
+_ATTR_READ_METHODS = ("__getattr__", "get", "get_child")
+
+# Classes whose field reads skip the lookup methods, keyed by type: (epoch, flag)
+_FAST_FIELD_ATTRS = {}
+
+
+def _fast_field_attrs(cls):
+    "Return True when cls resolves attribute reads with the library methods"
+    epoch = nodes.node_plan_epoch()
+    hit = _FAST_FIELD_ATTRS.get(cls)
+    if hit is None or hit[0] != epoch:
+        hit = (
+            epoch,
+            all(
+                getattr(cls, method) is getattr(ConfigurationDict, method)
+                for method in _ATTR_READ_METHODS
+            ),
+        )
+        _FAST_FIELD_ATTRS[cls] = hit
+    return hit[1]
+
+
+class _FieldAttr:
+    """Non-data descriptor reading a declared child of a ConfigurationObj.
+
+    Returns the child node for containers and the child value for leafs,
+    like ``ConfigurationDict.__getattr__``. On the class, returns the
+    declared field. Other attributes are read from the declared field.
+    """
+
+    __slots__ = ("name", "field")
+
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self.field
+        children = obj.__node_children__
+        child = children.get(self.name) if children else None
+        if child is None or not _fast_field_attrs(type(obj)):
+            return obj.__getattr__(self.name)
+        if isinstance(child, _ContainerInstance):
+            return child
+
+        if not _plain_leaf_read(type(child)):
+            return child.get_value()
+        value = child.__node_value__
+        if value is NOT_SET:
+            value = child.__node_default__
+            if callable(value):
+                return child.get_value()
+        return value
+
+    def __getattr__(self, name):
+        if name in _FieldAttr.__slots__:
+            raise AttributeError(name)
+        return getattr(self.field, name)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name}, {self.field!r})"
+
+
+def _install_field_attrs(attrs, bases, fields):
+    """Add a ``_FieldAttr`` to class attrs for each declared field.
+
+    Names already defined by the bases (methods, properties) are kept, they
+    shadowed the field before and still do.
+    """
+    for name, field in fields.items():
+        if name in attrs:
+            continue
+        inherited = UNSET_ARG
+        for klass in (klass for base in bases for klass in base.__mro__):
+            if name in klass.__dict__:
+                inherited = klass.__dict__[name]
+                break
+        if inherited is UNSET_ARG or isinstance(inherited, _FieldAttr):
+            attrs[name] = _FieldAttr(name, field)
+
+
+class DeclarativeValuesMetaclass(NodeMeta):
     """
     Collect Value objects declared on the base classes
     """
@@ -371,10 +973,13 @@ class DeclarativeValuesMetaclass(type):
         for key in list(all_values.keys()):
             if key in attrs:
                 del attrs[key]
+        _install_field_attrs(attrs, bases, all_values)
 
-        return super(DeclarativeValuesMetaclass, mcs).__new__(
+        cls = super(DeclarativeValuesMetaclass, mcs).__new__(
             mcs, class_name, bases, attrs
         )
+        cls._node_class_schema()
+        return cls
 
     @classmethod
     def __prepare__(mcs, *_):
@@ -394,8 +999,47 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
         children_class=Leaf,
         children_classes=NOT_SET_DICT,
         env_prefix=NOT_SET,
+        frozen=False,
     )
 
+    __node_schema__ = None
+
+    @classmethod
+    def _node_class_schema(cls):
+        """Return the class schema, compiling it when missing or stale.
+
+        The schema is compiled at class creation and recompiled when a node
+        class changed since (see ``superconf.nodes.invalidate_node_plans``).
+
+        Returns:
+            The class ``ConfigurationSchema``.
+        """
+        cached = cls.__dict__.get("__node_class_schema__")
+        epoch = nodes.node_plan_epoch()
+        if cached is not None and cached[0] == epoch:
+            return cached[1]
+
+        local_values = query_class_config(cls, "children_classes")
+        assert isinstance(
+            local_values, dict
+        ), f"Expected a dict for {cls.__name__}, got: {type(local_values)}={local_values}"
+        schema = compile_schema({**cls.__node_fields__, **local_values})
+        # Bypass NodeMeta.__setattr__, caching is not a class change
+        type.__setattr__(cls, "__node_class_schema__", (epoch, schema))
+        return schema
+
+    @classmethod
+    def validate(cls, data):
+        """Check plain data against the class schema without building nodes.
+
+        Args:
+            data: Candidate configuration data.
+
+        Returns:
+            List of ``ValidationIssue``, empty when data is valid.
+        """
+        return validate_data(cls, data)
+
     def __node_init__(self, **kwargs):
         "Prepare ConfigurationObj instance"
 
@@ -411,45 +1055,61 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
             report=_report,
         )
 
-        # Fetch children_classes field settings
-        local_values = self.__node_get_self_config__(
-            "children_classes",
-            default=self.__node_config__.query("children_classes"),
-            overrides=[
-                children_classes,
-            ],
+        # Fetch frozen settings, applied once the instance is built
+        self.__node_freeze__ = self.__node_get_self_config__(
+            "frozen",
+            default=self.__node_config__.query("frozen"),
             report=_report,
         )
-        assert isinstance(
-            local_values, dict
-        ), f"Expected a dict for {self.__node_fname__}, got: {type(local_values)}={local_values}"
 
-        # Merge local fields with global fields
-        _children_raw_classes = {}
-        _children_raw_classes.update(self.__node_fields__)
-        _children_raw_classes.update(
-            local_values,
+        # Use the class schema unless children are overriden on this instance
+        if children_classes is UNSET_ARG and not (
+            "__meta__" in self.__dict__
+            or "Meta" in self.__dict__
+            or "meta__children_classes" in self.__dict__
+        ):
+            schema = self._node_class_schema()
+        else:
+            # Fetch children_classes field settings
+            local_values = self.__node_get_self_config__(
+                "children_classes",
+                default=self.__node_config__.query("children_classes"),
+                overrides=[
+                    children_classes,
+                ],
+                report=_report,
+            )
+            assert isinstance(
+                local_values, dict
+            ), f"Expected a dict for {self.__node_fname__}, got: {type(local_values)}={local_values}"
+            schema = compile_schema({**self.__node_fields__, **local_values})
+
+        self.__node_schema__ = schema
+        self.__node_children_classes__ = schema.fields
+
+    def _node_merge_compatible(self, other):
+        "Return True when both sides share the same compiled schema"
+        return (
+            super()._node_merge_compatible(other)
+            and other.__node_schema__ is self.__node_schema__
+            and other.__node_extra_fields__ == self.__node_extra_fields__
         )
 
-        # Reprocess children fields
-        _children_classes = []
-        for attr, field in _children_raw_classes.items():
+    def _get_child_entry(self, key=None, attr=None):
+        """Get the compiled schema entry of a child.
 
-            if isinstance(field, GenericField):
-                field.key = field.key if field.key else attr
-                field.attr = attr
-                _children_classes.append(field)
-            else:
-                raise TypeError(
-                    f"Expected a GenericField for {attr}, got {type(field).__name__}"
-                )
+        Args:
+            key: Child key to look up.
+            attr: Child attribute name to look up.
 
-        self.__node_children_classes__ = _children_classes
+        Returns:
+            Matching ``SchemaEntry``, or a generated one for extra fields.
 
-    def _get_child_field(self, key=None, attr=None):
-        "Get child field"
+        Raises:
+            InvalidCastConfiguration: If several declared fields match.
+            UndeclaredField: If no field matches and extra fields are refused.
+        """
 
-        _children_classes = self.__node_children_classes__ or []
         _children_class = self.__node_children_class__ or None
         extra_fields = self.__node_extra_fields__
 
@@ -457,35 +1117,29 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
         assert child_key is not None, "Key or attr is required"
 
         # Search best match field
-        matches = []
-        for field in _children_classes:
-            if key and field.key == key:
-                matches.append(field)
-            elif attr and field.attr == attr:
-                matches.append(field)
-
-        field = None
+        matches = self.__node_schema__.lookup(key=key, attr=attr)
+
         if len(matches) == 1:
-            field = matches[0]
+            return matches[0]
         if len(matches) > 1:
             raise exceptions.InvalidCastConfiguration(
-                f"Multiple child fields found for {self.__node_fname__}: {matches}"
+                f"Multiple child fields found for {self.__node_fname__}: "
+                f"{[entry.field for entry in matches]}"
             )
 
         # Handle extra fields
-        if field is None:
-            if extra_fields is not True:
-                msg = (
-                    f"Key '{child_key}' is not declared in "
-                    f"'{self.__class__.__name__}({self.__node_fname__})', "
-                    "use extra_fields=True to allow unknown keys"
-                )
-                if extra_fields == "warn":
-                    logger.warning(msg)
-                elif extra_fields is False:
-                    raise exceptions.UndeclaredField(msg)
-            child_field_cls = _children_class.__node_config__.__class__
-            field = child_field_cls(key=key, attr=attr, instance_class=_children_class)
+        if extra_fields is not True:
+            msg = (
+                f"Key '{child_key}' is not declared in "
+                f"'{self.__class__.__name__}({self.__node_fname__})', "
+                "use extra_fields=True to allow unknown keys"
+            )
+            if extra_fields == "warn":
+                logger.warning(msg)
+            elif extra_fields is False:
+                raise exceptions.UndeclaredField(msg)
+        child_field_cls = _children_class.__node_config__.__class__
+        field = child_field_cls(key=key, attr=attr, instance_class=_children_class)
 
         # Check field result
         if not isinstance(field, GenericField):
@@ -495,7 +1149,18 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
             )
             raise exceptions.InvalidField(msg)
 
-        return field
+        return SchemaEntry(
+            attr=attr,
+            key=key,
+            field=field,
+            instance_class=_children_class,
+            default=field.query("default"),
+            init_kwargs=_NO_KWARGS,
+        )
+
+    def _get_child_field(self, key=None, attr=None):
+        "Get child field"
+        return self._get_child_entry(key=key, attr=attr).field
 
     def __node__set_children__(self, value, mode="define"):
         "Set children"
@@ -515,10 +1180,8 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
         # Build children keys
         # -----------------------
         available_fields = []
-        # Feed known fields from children_classes
-        available_fields.extend(
-            [field.key for field in self.__node_children_classes__ or []]
-        )
+        # Feed known fields from the schema
+        available_fields.extend(self.__node_schema__.keys)
         # Feed known fields from default node value
         node_default_dict = self.get_default() or {}
         available_fields.extend(list(node_default_dict.keys()))
@@ -529,12 +1192,14 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
 
         # Instanciate children
         # -----------------------
-        children = OrderedDict()
+        lazy = self.__node_lazy__ is True
+        children = LazyChildren() if lazy else OrderedDict()
         for child_key in available_fields:
 
-            # Fetch field config overrides
-            child_field = self._get_child_field(key=child_key)
-            child_cls = child_field.instance_class
+            # Fetch compiled field config
+            entry = self._get_child_entry(key=child_key)
+            child_field = entry.field
+            child_cls = entry.instance_class
 
             # Skip if field is not valid class
             if not inspect.isclass(child_cls):
@@ -545,11 +1210,24 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
                 assert False, msg
 
             # Build field default and value
-            child_default = node_default_dict.get(
-                child_key, child_field.query("default")
-            )
+            child_default = node_default_dict.get(child_key, entry.default)
             child_value = value.get(child_key, NOT_SET)
 
+            if lazy:
+                children.defer(
+                    child_key,
+                    child_cls,
+                    {
+                        "parent": self,
+                        "key": child_key,
+                        "default": child_default,
+                        "value": child_value,
+                        "field": child_field,
+                        **entry.init_kwargs,
+                    },
+                )
+                continue
+
             logger.info(
                 "Set child for ConfigurationObj %s(%s): %s",
                 child_cls,
@@ -564,10 +1242,12 @@ class ConfigurationObj(ConfigurationDict, metaclass=DeclarativeValuesMetaclass):
                 default=child_default,
                 value=child_value,
                 field=child_field,
+                **entry.init_kwargs,
             )
             children[child_key] = child
 
         self.__node_children__ = children
+        self._node_mark_dirty()
 
 
 class ConfigurationList(ConfigurationDict):
@@ -596,6 +1276,9 @@ class ConfigurationList(ConfigurationDict):
             strategy,
         )
 
+        if self._node_merge_compatible(other):
+            return self._node_merged_list([self, other], strategy)
+
         self_val = self.get_value()
         other_val = other.get_value()
         base = self_val if isinstance(self_val, list) else []
@@ -605,23 +1288,73 @@ class ConfigurationList(ConfigurationDict):
             key=self.__node_key__,
         )
 
+    def merge_all(self, others):
+        """Merge many list containers in one pass, same as chained ``merge``.
+
+        Args:
+            others: Containers to merge over this one, by increasing precedence.
+
+        Returns:
+            Merged container, this node when there is nothing to merge.
+        """
+        others = list(others)
+        if not others:
+            return self
+        if not all(self._node_merge_compatible(other) for other in others):
+            return Leaf.merge_all(self, others)
+
+        strategy = self._merge_strategy_for(others[0], MERGE_LIST_DEFAULT)
+        return self._node_merged_list([self] + others, strategy)
+
+    def _node_merged_list(self, layers, strategy):
+        """Return merged container from children of ``layers``.
+
+        Children are cloned under their new index.
+
+        Args:
+            layers: Compatible list containers, by increasing precedence.
+            strategy: List merge strategy.
+
+        Returns:
+            The merged container.
+        """
+        strategy = ensure_merge_strategy(strategy, MergeKind.LIST)
+        if strategy == MergeStrategy.REPLACE:
+            layers = layers[-1:]
+        elif strategy == MergeStrategy.KEEP:
+            layers = layers[:1]
+        elif strategy == MergeStrategy.PREPEND:
+            layers = layers[::-1]
+
+        children = {}
+        for layer in layers:
+            for child in layer.get_children().values():
+                children[len(children)] = child
+        return self._node_merged(children)
+
     def get_value(self, key=None, default=UNSET_ARG, nodefaults=False):
         "Get value"
         if key is not None:
             return self.get_key_value(key, nodefaults=nodefaults, default=default)
 
         if self.__node_children__ is not NOT_SET:
-            ret = []
-            for child in self.__node_children__.values():
-                ret.append(child.get_value(nodefaults=nodefaults))
-
-            return ret
+            return self._node_value_view(nodefaults)
 
         if default == UNSET_ARG:
             default = super().get_default()
 
         return default
 
+    def _node_build_snapshot(self, nodefaults):
+        "Build list snapshot from children, return (snapshot, volatile)"
+        out = _ListSnapshot()
+        volatile = False
+        for child in self.__node_children__.values():
+            value, child_volatile = child._node_snapshot(nodefaults)
+            out.append(value)
+            volatile = volatile or child_volatile
+        return out, volatile
+
     def __node__set_children__(self, value, mode="define"):
         "Set children from list"
 
@@ -663,3 +1396,361 @@ class ConfigurationList(ConfigurationDict):
             self.__node_children__.update(children)
         else:
             assert False, f"Invalid mode {mode}"
+        self._node_mark_dirty()
+
+
+# Library get_value implementations backed by cached snapshots
+_SNAPSHOT_GET_VALUES = frozenset(
+    (ConfigurationDict.get_value, ConfigurationList.get_value)
+)
+
+
+def _schema_paths(cls, prefix, seen):
+    """Yield paths read by a ConfigurationObj class, as key tuples.
+
+    Children that are not strict ConfigurationObj classes (leafs, dicts,
+    lists, extra fields) are selected with their whole subtree.
+    """
+    for entry in cls._node_class_schema().entries:
+        path = prefix + (entry.key,)
+        child = entry.instance_class
+        if (
+            inspect.isclass(child)
+            and issubclass(child, ConfigurationObj)
+            and child not in seen
+            and query_class_config(child, "extra_fields") is False
+        ):
+            yield from _schema_paths(child, path, seen | {child})
+        else:
+            yield path
+
+
+def schema_projection(config_cls):
+    """Return the projection of the data a ConfigurationObj class reads.
+
+    Undeclared keys are left out, so projected data no longer reports them
+    as ``UndeclaredField``.
+
+    Args:
+        config_cls: ConfigurationObj subclass.
+
+    Returns:
+        ``Projection`` of the declared paths, or None when the class accepts
+        extra fields and needs all the data.
+    """
+    if query_class_config(config_cls, "extra_fields") is not False:
+        return None
+    return Projection(_schema_paths(config_cls, (), {config_cls}))
+
+
+# Validation fast path
+# ----------------------------
+# ``ConfigurationObj.validate`` walks plain data against compiled class
+# schemas, running casts and field checks without instantiating nodes.
+# Classes overriding a build hook, or with settings only resolvable on an
+# instance, are validated by building their subtree instead.
+
+_VALIDATION_PLAN = ("validation_plan",)
+_VALIDATION_HOOKS = (
+    "__init__",
+    "__node_init__",
+    "pre_load",
+    "post_load",
+    "set_default",
+    "set_value",
+    "get_default",
+    "post_dump",
+    "_apply_casted",
+    "_get_child_entry",
+    "__node__set_children__",
+)
+_LIBRARY_HOOKS = frozenset(
+    klass.__dict__[name]
+    for klass in (
+        Leaf,
+        _ContainerInstance,
+        ConfigurationDict,
+        ConfigurationObj,
+        ConfigurationList,
+    )
+    for name in _VALIDATION_HOOKS
+    if name in klass.__dict__
+)
+
+
+class ValidationIssue(NamedTuple):
+    "Error found by ``ConfigurationObj.validate``, at a dotted data path"
+
+    path: str
+    error: Exception
+
+
+class _ValidationPlan(NamedTuple):
+    "Class-level settings used to validate data without nodes"
+
+    kind: str
+    extra_fields: Any
+    item_kwargs: Mapping[str, Any]
+
+
+def _validation_plan(cls):
+    """Return the cached validation plan of a node class.
+
+    Returns:
+        ``_ValidationPlan``, or None when data must be validated by building
+        nodes (overriden hooks, instance-only settings).
+    """
+    plan = node_class_plan(cls)
+    if _VALIDATION_PLAN not in plan:
+        plan[_VALIDATION_PLAN] = _compile_validation_plan(cls)
+    return plan[_VALIDATION_PLAN]
+
+
+def _compile_validation_plan(cls):
+    "Build the validation plan of a node class"
+    for name in _VALIDATION_HOOKS:
+        hook = getattr(cls, name, None)
+        if hook is not None and hook not in _LIBRARY_HOOKS:
+            return None
+
+    extra_fields = False
+    if issubclass(cls, ConfigurationObj):
+        kind = "obj"
+        extra_fields = query_class_config(cls, "extra_fields")
+        if extra_fields is UNSET_ARG:
+            return None
+    elif issubclass(cls, ConfigurationList):
+        kind = "list"
+    elif issubclass(cls, ConfigurationDict):
+        kind = "dict"
+    elif issubclass(cls, _ContainerInstance):
+        return None
+    else:
+        kind = "leaf"
+
+    return _ValidationPlan(
+        kind=kind,
+        extra_fields=extra_fields,
+        item_kwargs=_child_init_kwargs(GenericField(), cls),
+    )
+
+
+def _issue_path(path, key):
+    return f"{path}.{key}" if path else str(key)
+
+
+# pylint: disable-next=too-many-arguments, too-many-positional-arguments
+def _validate_by_build(cls, value, path, kwargs, field, issues, default=UNSET_ARG):
+    "Validate value by instantiating its node, record the raised error"
+    try:
+        cls(value=value, default=default, field=field, **kwargs)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        issues.append(ValidationIssue(path, err))
+
+
+def _validate_cast(cls, cast, value, path, issues):
+    "Cast value like ``node_cast_value``, return UNSET_ARG on errors"
+    if cast is None or cast is NOT_SET:
+        return value
+    try:
+        return cast(value)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        issues.append(
+            ValidationIssue(
+                path,
+                exceptions.InvalidCastConfiguration(
+                    f"Invalid cast {cast} for {path or cls.__name__} "
+                    f"for value: {value}, "
+                    f"got error: {type(err).__name__} {err}"
+                ),
+            )
+        )
+    return UNSET_ARG
+
+
+# pylint: disable-next=too-many-arguments, too-many-positional-arguments
+def _validate_node(cls, value, path, kwargs, field, issues, default=UNSET_ARG):
+    """Validate value against node class cls, append errors to issues.
+
+    Mirrors the build: the resolved default is always casted, then the value
+    when set. Children are checked against the value, or against the default
+    when no value is given.
+
+    Args:
+        cls: Node class the value would be instantiated with.
+        value: Raw value.
+        path: Dotted path of the value, for error reports.
+        kwargs: Child settings resolved from classes (see ``_child_init_kwargs``).
+        field: Declared field of the child, or None.
+        issues: List collecting ``ValidationIssue``.
+        default: Default given by the parent node, if any.
+    """
+    plan = _validation_plan(cls)
+    cast = kwargs.get("cast", UNSET_ARG)
+    if plan is not None:
+        default = query_class_config(
+            cls,
+            "default",
+            [default, field.query("default") if field is not None else UNSET_ARG],
+        )
+    if (
+        plan is None
+        or cast is UNSET_ARG
+        or default is UNSET_ARG
+        or callable(default)
+        or (plan.kind != "leaf" and "children_class" not in kwargs)
+    ):
+        _validate_by_build(cls, value, path, kwargs, field, issues, default=default)
+        return
+
+    node_default = _validate_cast(cls, cast, default, path, issues)
+    if node_default is UNSET_ARG:
+        return
+    data = node_default
+    if not is_not_set(value):
+        data = _validate_cast(cls, cast, value, path, issues)
+        if data is UNSET_ARG:
+            return
+
+    if plan.kind == "leaf":
+        return
+
+    expected = list if plan.kind == "list" else dict
+    for candidate in (node_default, data):
+        if not isinstance(candidate, expected):
+            issues.append(
+                ValidationIssue(
+                    path,
+                    exceptions.InvalidCastConfiguration(
+                        f"Expected a {expected.__name__} for "
+                        f"{path or cls.__name__}, "
+                        f"got: {type(candidate).__name__}={truncate(candidate)}"
+                    ),
+                )
+            )
+            return
+
+    children_class = kwargs["children_class"]
+    if plan.kind == "obj":
+        if plan.extra_fields is not False and not inspect.isclass(children_class):
+            _validate_by_build(cls, value, path, kwargs, field, issues, default=default)
+            return
+        _validate_obj_children(
+            cls, plan, data, node_default or {}, path, children_class, issues
+        )
+        return
+
+    if not inspect.isclass(children_class):
+        return
+    item_plan = _validation_plan(children_class)
+    item_kwargs = (
+        item_plan.item_kwargs
+        if item_plan is not None
+        else _child_init_kwargs(GenericField(), children_class)
+    )
+    items = enumerate(data) if plan.kind == "list" else data.items()
+    for key, item in items:
+        _validate_node(
+            children_class, item, _issue_path(path, key), item_kwargs, None, issues
+        )
+
+
+# pylint: disable-next=too-many-arguments, too-many-positional-arguments
+def _validate_obj_children(
+    cls, plan, value, node_default, path, children_class, issues
+):
+    "Validate the children of a ConfigurationObj value against its schema"
+    schema = cls._node_class_schema()
+    keys = unique(list(schema.keys) + list(node_default.keys()) + list(value.keys()))
+    for key in keys:
+        child_path = _issue_path(path, key)
+        matches = schema.lookup(key=key)
+        if len(matches) > 1:
+            issues.append(
+                ValidationIssue(
+                    child_path,
+                    exceptions.InvalidCastConfiguration(
+                        f"Multiple child fields found for {path}: "
+                        f"{[entry.field for entry in matches]}"
+                    ),
+                )
+            )
+            continue
+
+        if matches:
+            entry = matches[0]
+            child_cls = entry.instance_class
+            child_kwargs = entry.init_kwargs
+            child_field = entry.field
+            child_default = node_default.get(key, entry.default)
+        else:
+            # Extra fields set to "warn" are accepted, without logging
+            if plan.extra_fields is False:
+                issues.append(
+                    ValidationIssue(
+                        child_path,
+                        exceptions.UndeclaredField(
+                            f"Key '{key}' is not declared in "
+                            f"'{cls.__name__}({path})', "
+                            "use extra_fields=True to allow unknown keys"
+                        ),
+                    )
+                )
+                continue
+            child_cls = children_class
+            child_plan = _validation_plan(child_cls)
+            child_kwargs = (
+                child_plan.item_kwargs
+                if child_plan is not None
+                else _child_init_kwargs(GenericField(), child_cls)
+            )
+            child_field = None
+            child_default = node_default.get(key, NOT_SET)
+
+        if not inspect.isclass(child_cls):
+            issues.append(
+                ValidationIssue(
+                    child_path,
+                    exceptions.InvalidField(
+                        f"Expected a class for {child_path}, "
+                        f"got: {type(child_cls)}={child_cls}"
+                    ),
+                )
+            )
+            continue
+
+        _validate_node(
+            child_cls,
+            value.get(key, NOT_SET),
+            child_path,
+            child_kwargs,
+            child_field,
+            issues,
+            default=child_default,
+        )
+
+
+def validate_data(config_cls, data):
+    """Check data against a ConfigurationObj class without building nodes.
+
+    Runs the same field lookups and casts as instantiating
+    ``config_cls(value=data)`` and collects every error instead of raising
+    the first one. Defaults are casted as well, so a declared field missing
+    from data and without default is reported when the build would fail.
+
+    Args:
+        config_cls: ConfigurationObj subclass.
+        data: Candidate configuration data.
+
+    Returns:
+        List of ``ValidationIssue``, empty when data is valid.
+    """
+    issues = []
+    plan = _validation_plan(config_cls)
+    kwargs = (
+        plan.item_kwargs
+        if plan is not None
+        else _child_init_kwargs(GenericField(), config_cls)
+    )
+    _validate_node(config_cls, data, "", kwargs, None, issues)
+    return issues
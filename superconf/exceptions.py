@@ -51,3 +51,7 @@ class InvalidField(ConfigurationException):
 
 class InvalidFieldOption(ConfigurationException):
     "Raised when an invalid field option is found"
+
+
+class FrozenConfiguration(ConfigurationException):
+    "Raised when changing a frozen configuration"
@@ -11,18 +11,23 @@ from superconf.common import (
     NOT_SET,
     NOT_SET_DICT,
     UNSET_ARG,
+    compile_merge,
     infer_merge_kind,
     is_merge_value_set,
     is_not_set,
-    merge_data,
     normalize_merge_strategy,
     prefer_other_scalar,
 )
+from superconf.lib.frozen import freeze, thaw
+from superconf.lib.layered import LayeredMapping
 from superconf.merge import MergeKind
-from superconf.nodes import Node
+from superconf.nodes import Node, node_class_plan
 
 logger = logging.getLogger(__name__)
 
+# Class plan marker: Meta keys were validated for this class
+_META_CHECKED = ("meta_checked",)
+
 # ====================================
 # Base Fields V2
 # ====================================
@@ -97,10 +102,12 @@ class LeafContainerConfig(LeafBaseConfig):
         self,
         children_class=NOT_SET,
         merge=MERGE_DICT_DEFAULT,
+        lazy=NOT_SET,
         **kwargs,
     ):
 
         self.children_class = children_class
+        self.lazy = lazy
         super().__init__(merge=merge, **kwargs)
 
 
@@ -113,12 +120,14 @@ class LeafObjConfig(LeafContainerConfig):
         extra_fields=NOT_SET,
         children_classes=NOT_SET_DICT,
         env_prefix=NOT_SET,
+        frozen=NOT_SET,
         **kwargs,
     ):
 
         self.extra_fields = extra_fields
         self.children_classes = children_classes
         self.env_prefix = env_prefix
+        self.frozen = frozen
         super().__init__(**kwargs)
 
 
@@ -173,6 +182,16 @@ class Leaf(Node):
     __node_cast__ = None
     __node_field__ = None
 
+    # Frozen state, and whether instances freeze once built (Meta.frozen)
+    __node_frozen__ = False
+    __node_freeze__ = False
+
+    # Frozen state and structural hash: copies and clones are not frozen
+    __node_cache_attrs__ = Node.__node_cache_attrs__ + (
+        "__node_frozen__",
+        "__node_hash__",
+    )
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __init__(
         self,
@@ -194,18 +213,22 @@ class Leaf(Node):
             self.__node_config__, LeafBaseConfig
         ), f"Invalid __node_config__ type: {self.__node_config__.__class__.__mro__}"
 
-        # Validate override Meta
-        metadata = getattr(self, "Meta", None)
-        if metadata is not None:
-            for _key, _ in metadata.__dict__.items():
-                if _key.startswith("__"):
-                    continue
-                if not hasattr(self.__node_config__, _key):
-                    msg = (
-                        f"Invalid Meta key '{_key}' for {self.__class__}, "
-                        f"please choose one of: {list(self.__node_config__.__dict__.keys())}"
-                    )
-                    raise exceptions.InvalidField(msg)
+        # Validate override Meta, once per class
+        plan = node_class_plan(type(self))
+        if "Meta" in self.__dict__ or not plan.get(_META_CHECKED):
+            metadata = getattr(self, "Meta", None)
+            if metadata is not None:
+                for _key, _ in metadata.__dict__.items():
+                    if _key.startswith("__"):
+                        continue
+                    if not hasattr(self.__node_config__, _key):
+                        msg = (
+                            f"Invalid Meta key '{_key}' for {self.__class__}, "
+                            f"please choose one of: {list(self.__node_config__.__dict__.keys())}"
+                        )
+                        raise exceptions.InvalidField(msg)
+            if "Meta" not in self.__dict__:
+                plan[_META_CHECKED] = True
 
         # Call node init hook
         self.__node_init__(**kwargs)
@@ -231,11 +254,16 @@ class Leaf(Node):
         # Run post_load hook
         self.post_load()
 
+        # Lock instances of frozen classes
+        if self.__node_freeze__ is True:
+            self.freeze()
+
     def __node_init__(self, **kwargs):
         "Prepare Leaf instance"
 
         # Call parent init
         cast = kwargs.pop("cast", UNSET_ARG)
+        merge = kwargs.pop("merge", UNSET_ARG)
         assert len(kwargs) == 0, f"Unexpected kwargs: {kwargs}"
         _report = []
 
@@ -256,6 +284,7 @@ class Leaf(Node):
             "merge",
             default=self.__node_config__.query("merge"),
             overrides=[
+                merge,
                 self.__node_field__.query("merge"),
             ],
             report=_report,
@@ -276,10 +305,18 @@ class Leaf(Node):
 
         Returns:
             The casted value that was stored.
+
+        Raises:
+            FrozenConfiguration: If the node is frozen.
         """
+        if self.__node_frozen__:
+            raise exceptions.FrozenConfiguration(
+                f"Can't set {debug_label} of frozen {self.__node_fname__ or self}"
+            )
         value = self.pre_load(value)
         value = node_cast_value(self, value)
         setattr(self, attr_name, value)
+        self._node_mark_dirty()
         logger.debug(
             "Set %s for %s: %s",
             debug_label,
@@ -294,6 +331,9 @@ class Leaf(Node):
 
     def set_value(self, value):
         "Set value"
+        if isinstance(value, LayeredMapping):
+            # Leaf values are plain data, containers resolve layers lazily
+            value = value.to_dict()
         return self._apply_casted(value, "__node_value__", "value")
 
     def get_default(self):
@@ -324,6 +364,117 @@ class Leaf(Node):
 
         ret = _get_value()
         ret = self.post_dump(ret)
+        if self.__node_frozen__:
+            ret = freeze(ret)
+        return ret
+
+    def _node_mark_dirty(self):
+        """Drop cached value snapshots of this node and its ancestors.
+
+        Walking stops at the first ancestor without a cache: an ancestor is
+        only cached once all its descendants have been cached.
+        """
+        self.__dict__.pop("__node_value_cache__", None)
+        node = self.__node_parent__
+        while (
+            node is not None
+            and node.__dict__.pop("__node_value_cache__", None) is not None
+        ):
+            node = node.__node_parent__
+
+    def _node_clone(self, **attrs):
+        """Return a shallow clone without running ``__init__`` again.
+
+        Settings resolved at init time (field, cast, merge, children) are
+        shared with the original node, caches and frozen state are dropped.
+
+        Args:
+            attrs: Instance attributes to set on the clone.
+
+        Returns:
+            The cloned node.
+        """
+        inst = object.__new__(type(self))
+        state = self.__dict__.copy()
+        for name in self.__node_cache_attrs__:
+            state.pop(name, None)
+        state.update(attrs)
+        inst.__dict__.update(state)
+        return inst
+
+    def _node_detached(self, parent, key):
+        """Return a clone of this node owned by ``parent`` under ``key``.
+
+        Used by merges to hold input nodes without sharing them.
+
+        Args:
+            parent: Container owning the clone.
+            key: Key of the clone in ``parent``.
+
+        Returns:
+            The cloned node.
+        """
+        return self._node_clone(__node_parent__=parent, __node_key__=key)
+
+    def _node_snapshot(self, nodefaults=False):
+        """Return value for parent snapshots.
+
+        Args:
+            nodefaults: Same as ``get_value`` nodefaults.
+
+        Returns:
+            Tuple of ``(value, volatile)``, volatile values may change without
+            ``set_value`` (callable defaults, overriden dump hooks).
+        """
+        cls = type(self)
+        volatile = (
+            callable(self.__node_default__)
+            or cls.post_dump is not Leaf.post_dump
+            or cls.get_value is not Leaf.get_value
+        )
+        return self.get_value(nodefaults=nodefaults), volatile
+
+    def freeze(self):
+        """Lock the node against changes.
+
+        Dict and list values are replaced by read-only copies, and the node
+        gets a structural hash. Copies of a frozen node are not frozen.
+
+        Returns:
+            The node itself.
+        """
+        inst_dict = self.__dict__
+        inst_dict["__node_value__"] = freeze(self.__node_value__)
+        if not callable(self.__node_default__):
+            inst_dict["__node_default__"] = freeze(self.__node_default__)
+        inst_dict["__node_frozen__"] = True
+        inst_dict.pop("__node_hash__", None)
+        self._node_mark_dirty()
+        return self
+
+    def __eq__(self, other):
+        "Frozen nodes compare by class and value, other nodes by identity"
+        if self is other:
+            return True
+        if (
+            self.__node_frozen__
+            and isinstance(other, Leaf)
+            and other.__node_frozen__
+            and type(self) is type(other)
+        ):
+            return self.get_value() == other.get_value()
+        return NotImplemented
+
+    def __hash__(self):
+        "Frozen nodes hash their value, cached unless volatile"
+        if not self.__node_frozen__:
+            return object.__hash__(self)
+        ret = self.__dict__.get("__node_hash__")
+        if ret is None:
+            value, volatile = self._node_snapshot()
+            ret = hash((type(self), freeze(value)))
+            if not volatile:
+                self.__dict__["__node_hash__"] = ret
         return ret
 
     def pre_load(self, value):
@@ -397,22 +548,42 @@ class Leaf(Node):
                     f"{kind.value} merge on {self.__node_fname__} requires "
                     f"{expected.__name__} values, got: {type(base)} and {type(right)}"
                 )
-            inst = self.copy()
-            inst.set_value(merge_data(base, right, strategy, kind))
+            merged = compile_merge(strategy, kind)(base, right)
+            inst = self._node_clone(__node_parent__=None)
+            inst.set_value(merged)
             return inst
 
         if prefer_other_scalar(self_val, other_val, strategy):
             return other
         return self
 
+    def merge_all(self, others):
+        """Merge many nodes left to right, same as chained ``merge`` calls.
+
+        Args:
+            others: Nodes to merge over this one, by increasing precedence.
+
+        Returns:
+            Merged node, this node when there is nothing to merge.
+        """
+        ret = self
+        for other in others:
+            ret = ret.merge(other)
+        return ret
+
     def copy(self):
         "Copy the instance"
 
         curr = self.__dict__.copy()
+        for name in self.__node_cache_attrs__:
+            curr.pop(name, None)
         curr_default = curr.pop("__node_default__", None)
         curr_value = curr.pop("__node_value__", None)
         curr_key = curr.pop("__node_key__", None)
         curr_parent = curr.pop("__node_parent__", None)
+        if self.__node_frozen__:
+            curr_default = thaw(curr_default)
+            curr_value = thaw(curr_value)
 
         # Instanciate copy
         inst = self.__class__(
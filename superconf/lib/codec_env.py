@@ -6,7 +6,8 @@ nested dicts/lists; flatten does the reverse. Designed to be extractable.
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Union
+import io
+from typing import Any, Iterable, Iterator, Mapping, TextIO, Union
 
 EnvMapping = Mapping[str, str]
 NestedData = Union[dict[str, Any], list[Any]]
@@ -52,27 +53,30 @@ def _is_index(segment: str) -> bool:
     return bool(segment) and segment.isdigit()
 
 
-def _ensure_list_index(parent: list, key: int) -> None:
-    """Pad a list with ``None`` until ``key`` is a valid index.
+class _SparseList(dict):
+    """List being expanded: index -> value, made dense once at the end.
 
-    Args:
-        parent: List to extend in place.
-        key: Target index that must become addressable.
+    Memory follows the number of set indexes, not the highest index.
     """
-    while len(parent) <= key:
-        parent.append(None)
+
+    __slots__ = ()
+
+
+def _container_name(node: Any) -> str:
+    """Return the user-facing type name of an expansion container."""
+    return "list" if isinstance(node, _SparseList) else type(node).__name__
 
 
 def _ensure_container(
-    parent: NestedData,
+    parent: dict,
     key: Union[str, int],
     child_is_index: bool,
     path: str,
-) -> NestedData:
+) -> dict:
     """Ensure parent[key] is a dict or list matching the next segment type.
 
     Args:
-        parent: Current container (dict or list).
+        parent: Current container (dict or sparse list).
         key: Key or index into parent.
         child_is_index: True if the next segment is a list index.
         path: Full env key path for error messages.
@@ -83,28 +87,19 @@ def _ensure_container(
     Raises:
         CodecEnvConflictError: If an existing leaf blocks a container.
     """
-    expected: type = list if child_is_index else dict
-
-    if isinstance(parent, dict):
-        assert isinstance(key, str)
-        if key not in parent:
-            parent[key] = [] if child_is_index else {}
-        child = parent[key]
-    else:
-        assert isinstance(parent, list)
-        assert isinstance(key, int)
-        _ensure_list_index(parent, key)
-        child = parent[key]
-        if child is None:
-            parent[key] = [] if child_is_index else {}
-            child = parent[key]
-
-    if isinstance(child, expected):
+    expected: type = _SparseList if child_is_index else dict
+
+    child = parent.get(key)
+    if child is None:
+        child = parent[key] = expected()
+        return child
+
+    if type(child) is expected:
         return child
 
-    if isinstance(child, (dict, list)):
-        got = type(child).__name__
-        want = expected.__name__
+    if isinstance(child, dict):
+        got = _container_name(child)
+        want = "list" if child_is_index else "dict"
         raise CodecEnvConflictError(
             f"Path conflict at '{path}': existing {got} incompatible with {want}"
         )
@@ -115,7 +110,7 @@ def _ensure_container(
 
 
 def _set_leaf(
-    parent: NestedData,
+    parent: dict,
     key: Union[str, int],
     value: str,
     path: str,
@@ -123,7 +118,7 @@ def _set_leaf(
     """Set a leaf string on parent, rejecting container overwrite.
 
     Args:
-        parent: Current container (dict or list).
+        parent: Current container (dict or sparse list).
         key: Key or index into parent.
         value: Leaf string value from the environment.
         path: Full env key path for error messages.
@@ -131,40 +126,28 @@ def _set_leaf(
     Raises:
         CodecEnvConflictError: If a container already exists at this path.
     """
-    if isinstance(parent, dict):
-        assert isinstance(key, str)
-        existing = parent.get(key, None)
-        if isinstance(existing, (dict, list)):
-            raise CodecEnvConflictError(
-                f"Path conflict at '{path}': container blocks leaf {value!r}"
-            )
-        parent[key] = value
-        return
-
-    assert isinstance(parent, list)
-    assert isinstance(key, int)
-    _ensure_list_index(parent, key)
-    existing = parent[key]
-    if isinstance(existing, (dict, list)):
+    if isinstance(parent.get(key), dict):
         raise CodecEnvConflictError(
             f"Path conflict at '{path}': container blocks leaf {value!r}"
         )
     parent[key] = value
 
 
-def _compact_lists(node: Any) -> Any:
-    """Recursively drop None holes from lists (missing indexes).
+def _densify(node: Any) -> Any:
+    """Recursively turn sparse lists into lists, ordered by index.
+
+    Missing indexes are dropped (compact).
 
     Args:
-        node: Nested dict/list/leaf structure.
+        node: Nested dict/sparse list/leaf structure.
 
     Returns:
-        Structure with list holes removed; dicts walked recursively.
+        Structure with plain dicts and lists.
     """
+    if isinstance(node, _SparseList):
+        return [_densify(node[index]) for index in sorted(node)]
     if isinstance(node, dict):
-        return {key: _compact_lists(val) for key, val in node.items()}
-    if isinstance(node, list):
-        return [_compact_lists(item) for item in node if item is not None]
+        return {key: _densify(val) for key, val in node.items()}
     return node
 
 
@@ -188,9 +171,16 @@ def _apply_env_path(  # pylint: disable=too-many-arguments
         lowercase_keys: Lowercase non-index segments when True.
 
     Raises:
-        CodecEnvConflictError: On leaf/container path conflicts.
+        CodecEnvConflictError: On leaf/container path conflicts, or when the
+            path starts with a list index.
     """
-    parent: NestedData = root
+    if _is_index(segments[0]):
+        path = separator.join([norm_prefix, segments[0]])
+        raise CodecEnvConflictError(
+            f"Path conflict at '{path}': root is a dict, not a list"
+        )
+
+    parent: dict = root
     path_parts: list[str] = []
 
     for index, segment in enumerate(segments):
@@ -211,6 +201,66 @@ def _apply_env_path(  # pylint: disable=too-many-arguments
         parent = _ensure_container(parent, key, next_is_index, path)
 
 
+def filter_env(
+    environ: EnvMapping,
+    prefix: str,
+    separator: str = "__",
+) -> dict[str, str]:
+    """Return env entries whose key matches ``PREFIX`` + separator.
+
+    Args:
+        environ: Mapping of environment variables (e.g. ``os.environ``).
+        prefix: Required prefix (``APP`` or ``APP__``).
+        separator: Segment separator (default ``__``).
+
+    Returns:
+        Matching raw entries, in environ order.
+
+    Raises:
+        CodecEnvPrefixError: If prefix is empty.
+    """
+    head = _normalize_prefix(prefix, separator) + separator
+    size = len(head)
+    out: dict[str, str] = {}
+    # Only keys are scanned, values are read for matching keys only
+    for key in environ:
+        text = str(key)
+        if text[:size].upper() == head or (
+            not text.isascii() and text.upper().startswith(head)
+        ):
+            out[key] = environ[key]
+    return out
+
+
+def split_env_key(key: str, prefix: str, separator: str = "__") -> list[str]:
+    """Return the uppercase path segments of a matching env key.
+
+    Args:
+        key: Env key matching ``PREFIX`` + separator (see ``filter_env``).
+        prefix: Required prefix (``APP`` or ``APP__``).
+        separator: Segment separator (default ``__``).
+
+    Returns:
+        Path segments after the prefix.
+
+    Raises:
+        CodecEnvPrefixError: If prefix is empty.
+        CodecEnvConflictError: If the path is empty or has an empty segment.
+    """
+    head = _normalize_prefix(prefix, separator) + separator
+    remainder = str(key).upper()[len(head) :]
+    if not remainder:
+        raise CodecEnvConflictError(
+            f"Environment key '{key}' matches prefix only; need a path"
+        )
+    segments = remainder.split(separator)
+    if any(not segment for segment in segments):
+        raise CodecEnvConflictError(
+            f"Environment key '{key}' has an empty path segment"
+        )
+    return segments
+
+
 def expand_env(
     environ: EnvMapping,
     prefix: str,
@@ -236,38 +286,23 @@ def expand_env(
 
     Raises:
         CodecEnvPrefixError: If prefix is empty.
-        CodecEnvConflictError: If leaf and container paths collide.
+        CodecEnvConflictError: If leaf and container paths collide, or a path
+            starts with a list index.
     """
     norm_prefix = _normalize_prefix(prefix, separator)
-    head = norm_prefix + separator
     root: dict[str, Any] = {}
 
-    for raw_key, raw_value in environ.items():
-        env_key = str(raw_key).upper()
-        if not env_key.startswith(head):
-            continue
-        remainder = env_key[len(head) :]
-        if not remainder:
-            raise CodecEnvConflictError(
-                f"Environment key '{raw_key}' matches prefix only; need a path"
-            )
-
-        segments = remainder.split(separator)
-        if any(not segment for segment in segments):
-            raise CodecEnvConflictError(
-                f"Environment key '{raw_key}' has an empty path segment"
-            )
-
+    for raw_key, raw_value in filter_env(environ, prefix, separator).items():
         _apply_env_path(
             root,
-            segments,
+            split_env_key(raw_key, norm_prefix, separator),
             str(raw_value),
             norm_prefix=norm_prefix,
             separator=separator,
             lowercase_keys=lowercase_keys,
         )
 
-    return _compact_lists(root)
+    return _densify(root)
 
 
 def _format_env_value(value: Any) -> str:
@@ -284,6 +319,128 @@ def _format_env_value(value: Any) -> str:
     return str(value)
 
 
+def _env_items(node: NestedData) -> Iterable[tuple[Any, Any]]:
+    """Return the (key, child) pairs of a mapping or list."""
+    return enumerate(node) if isinstance(node, list) else node.items()
+
+
+def _iter_env_pairs(
+    nodes: Iterable[NestedData],
+    head: str,
+    separator: str,
+    skip_none: bool,
+    uppercase_keys: bool,
+) -> Iterator[tuple[str, str]]:
+    """Yield env pairs below head of each node, in traversal order."""
+    for root in nodes:
+        # Walk with a stack of (key so far, child iterator), no recursion
+        stack: list[tuple[str, Iterator[tuple[Any, Any]]]] = [
+            (head, iter(_env_items(root)))
+        ]
+        while stack:
+            prefix, children = stack[-1]
+            for key, node in children:
+                segment = str(key)
+                env_key = prefix + (segment.upper() if uppercase_keys else segment)
+                if isinstance(node, (Mapping, list)):
+                    stack.append((env_key + separator, iter(_env_items(node))))
+                    break
+                if node is None:
+                    if not skip_none:
+                        yield env_key, ""
+                    continue
+                yield env_key, _format_env_value(node)
+            else:
+                stack.pop()
+
+
+def _iter_sorted_env_pairs(
+    nodes: list[NestedData],
+    head: str,
+    separator: str,
+    skip_none: bool,
+    uppercase_keys: bool,
+) -> Iterator[tuple[str, str]]:
+    """Yield env pairs below head of nodes, sorted by key, one per key.
+
+    Children of all nodes are grouped by env segment, so containers whose
+    keys only differ by case are walked as one. Each level is sorted on its
+    own. A level where a container key prefixes another key can interleave
+    with it, it is collected and sorted whole instead.
+    """
+    leaves: dict[str, str] = {}
+    containers: dict[str, list[NestedData]] = {}
+    for node in nodes:
+        for key, child in _env_items(node):
+            segment = str(key).upper() if uppercase_keys else str(key)
+            if isinstance(child, (Mapping, list)):
+                containers.setdefault(segment + separator, []).append(child)
+            elif child is not None:
+                leaves[segment] = _format_env_value(child)
+            elif not skip_none:
+                leaves[segment] = ""
+
+    entries = sorted(
+        [(key, False) for key in leaves] + [(key, True) for key in containers]
+    )
+    for (key, is_container), (next_key, _) in zip(entries, entries[1:]):
+        if next_key == key or (is_container and next_key.startswith(key)):
+            pairs = _iter_env_pairs(nodes, head, separator, skip_none, uppercase_keys)
+            yield from sorted(dict(pairs).items())
+            return
+
+    for key, is_container in entries:
+        if is_container:
+            yield from _iter_sorted_env_pairs(
+                containers[key], head + key, separator, skip_none, uppercase_keys
+            )
+        else:
+            yield head + key, leaves[key]
+
+
+def iter_flatten_env(
+    data: Mapping[str, Any],
+    prefix: str,
+    separator: str = "__",
+    *,
+    skip_none: bool = True,
+    uppercase_keys: bool = True,
+    sort_keys: bool = False,
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(PREFIX__PATH, value)`` env entries of a nested dict.
+
+    Entries come in traversal order: mapping order, then list index order.
+    Nothing is collected, keys are built once per path segment.
+
+    With ``sort_keys``, entries come sorted by key with one entry per key,
+    the same as ``flatten_env``. Only the keys of the walked levels are held.
+
+    Args:
+        data: Nested mapping (dicts and lists).
+        prefix: Required prefix (``APP`` or ``APP__``).
+        separator: Segment separator (default ``__``).
+        skip_none: If True (default), omit keys whose value is ``None``.
+            If False, emit an empty string for ``None``.
+        uppercase_keys: Uppercase the full env key (default True).
+        sort_keys: Yield entries sorted by key, without duplicate keys.
+
+    Yields:
+        Env key and string value pairs.
+
+    Raises:
+        CodecEnvPrefixError: If prefix is empty.
+        CodecEnvConflictError: If the root is not a mapping.
+    """
+    norm_prefix = _normalize_prefix(prefix, separator)
+    if not isinstance(data, Mapping):
+        raise CodecEnvConflictError("flatten_env expects a mapping at the root")
+
+    walk = _iter_sorted_env_pairs if sort_keys else _iter_env_pairs
+    yield from walk(
+        [data], norm_prefix + separator, separator, skip_none, uppercase_keys
+    )
+
+
 def flatten_env(
     data: Mapping[str, Any],
     prefix: str,
@@ -307,41 +464,47 @@ def flatten_env(
 
     Raises:
         CodecEnvPrefixError: If prefix is empty.
-        CodecEnvConflictError: If a non-dict/list/scalar leaf type appears.
+        CodecEnvConflictError: If the root is not a mapping.
     """
-    norm_prefix = _normalize_prefix(prefix, separator)
-    out: dict[str, str] = {}
+    out = dict(
+        iter_flatten_env(
+            data,
+            prefix,
+            separator,
+            skip_none=skip_none,
+            uppercase_keys=uppercase_keys,
+        )
+    )
+    return dict(sorted(out.items()))
 
-    def walk(node: Any, parts: list[str]) -> None:
-        if node is None:
-            if skip_none:
-                return
-            key = separator.join(parts)
-            if uppercase_keys:
-                key = key.upper()
-            out[key] = ""
-            return
 
-        if isinstance(node, Mapping):
-            for key, val in node.items():
-                walk(val, parts + [str(key)])
-            return
-
-        if isinstance(node, list):
-            for index, val in enumerate(node):
-                walk(val, parts + [str(index)])
-            return
+def write_dotenv(
+    env_items: Union[Mapping[str, str], Iterable[tuple[str, str]]],
+    stream: TextIO,
+    *,
+    export: bool = False,
+) -> int:
+    """Write env entries as dotenv or shell ``export`` lines to a stream.
 
-        key = separator.join(parts)
-        if uppercase_keys:
-            key = key.upper()
-        out[key] = _format_env_value(node)
+    Entries are written in the given order, one line at a time.
 
-    if not isinstance(data, Mapping):
-        raise CodecEnvConflictError("flatten_env expects a mapping at the root")
+    Args:
+        env_items: Flat ``KEY`` → ``value`` mapping, or iterable of pairs
+            (e.g. from ``iter_flatten_env``).
+        stream: Text file object to write to.
+        export: If True, prefix lines with ``export ``.
 
-    walk(data, [norm_prefix])
-    return dict(sorted(out.items()))
+    Returns:
+        Number of written lines.
+    """
+    if isinstance(env_items, Mapping):
+        env_items = env_items.items()
+    prefix = "export " if export else ""
+    count = 0
+    for key, value in env_items:
+        stream.write(f"{prefix}{key}={_dotenv_quote(value)}\n")
+        count += 1
+    return count
 
 
 def to_dotenv(
@@ -356,13 +519,11 @@ def to_dotenv(
         export: If True, prefix lines with ``export ``.
 
     Returns:
-        Newline-terminated text block (empty string if no keys).
+        Newline-terminated text block, sorted by key (empty string if no keys).
     """
-    lines: list[str] = []
-    prefix = "export " if export else ""
-    for key, value in sorted(env_map.items()):
-        lines.append(f"{prefix}{key}={_dotenv_quote(value)}")
-    return "\n".join(lines) + ("\n" if lines else "")
+    buffer = io.StringIO()
+    write_dotenv(sorted(env_map.items()), buffer, export=export)
+    return buffer.getvalue()
 
 
 def _dotenv_quote(value: str) -> str:
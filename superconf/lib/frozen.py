@@ -0,0 +1,122 @@
+"""Read-only dict and list types for shared, cached configuration data.
+
+Standalone utility (no SuperConf types). ``FrozenDict`` and ``FrozenList``
+subclass ``dict`` and ``list`` so they pass ``isinstance`` checks and
+serialize like plain containers, but every mutating method raises
+``TypeError``. Copies (``copy``, ``deepcopy``, ``thaw``) are plain and
+mutable.
+
+Example usage:
+    >>> data = freeze({"tags": ["a"]})
+    >>> data["tags"].append("b")
+    Traceback (most recent call last):
+    TypeError: FrozenList is read-only
+    >>> thaw(data)["tags"].append("b")
+"""
+
+from typing import Any
+
+
+def _read_only(self, *_args, **_kwargs):
+    raise TypeError(f"{self.__class__.__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """Read-only dict, build it with ``freeze`` to freeze nested values."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __ior__ = _read_only
+    clear = _read_only
+    pop = _read_only
+    popitem = _read_only
+    setdefault = _read_only
+    update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __hash__(self):
+        return hash(frozenset(self.items()))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """Read-only list, build it with ``freeze`` to freeze nested values."""
+
+    __slots__ = ()
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only
+    __imul__ = _read_only
+    append = _read_only
+    clear = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only
+    remove = _read_only
+    reverse = _read_only
+    sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list.__repr__(self)})"
+
+
+def freeze(data: Any) -> Any:
+    """Return data with nested dicts and lists made read-only.
+
+    Already frozen containers are returned as is.
+
+    Args:
+        data: Nested data.
+
+    Returns:
+        Frozen copy of dicts and lists, other values unchanged.
+    """
+    kind = type(data)
+    if kind is FrozenDict or kind is FrozenList:
+        return data
+    if isinstance(data, dict):
+        return FrozenDict({key: freeze(val) for key, val in data.items()})
+    if isinstance(data, list):
+        return FrozenList([freeze(val) for val in data])
+    return data
+
+
+def thaw(data: Any) -> Any:
+    """Return a mutable copy of data, with nested dicts and lists copied.
+
+    Args:
+        data: Nested data, frozen or not.
+
+    Returns:
+        Plain nested dicts and lists.
+    """
+    if isinstance(data, dict):
+        return {key: thaw(val) for key, val in data.items()}
+    if isinstance(data, list):
+        return [thaw(val) for val in data]
+    return data
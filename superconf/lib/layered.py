@@ -0,0 +1,116 @@
+"""Lazy layered mapping: resolve keys through stacked mappings on access.
+
+Standalone utility (no SuperConf types). Layers are never copied: values are
+looked up through the stack when read, nested mappings present in several
+layers are merged on the fly. ``to_dict()`` builds plain nested dicts.
+"""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+from superconf.lib.sentinels import is_not_set
+
+_IMMUTABLE_LEAFS = (str, int, float, bool, bytes, type(None))
+
+
+class LayeredMapping(Mapping):
+    """Read-only mapping resolving keys through layers, highest first.
+
+    A key resolves to the value of the highest layer holding it. When that
+    value is a mapping, it is deep-merged with the mappings found at the same
+    key in lower layers, down to the first non-mapping value. Lists and
+    scalars replace lower values, ``NOT_SET`` values are skipped and ``None``
+    is a real value.
+
+    Keys iterate in first appearance order, from the lowest layer up.
+
+    Args:
+        layers: Mappings, highest priority first.
+    """
+
+    __slots__ = ("_layers", "_resolved", "_keys")
+
+    def __init__(self, layers: Sequence[Mapping[str, Any]]) -> None:
+        self._layers = tuple(layers)
+        self._resolved: dict[str, Any] = {}
+        self._keys: Optional[list] = None
+
+    @property
+    def layers(self) -> tuple:
+        """Return layer mappings, highest priority first."""
+        return self._layers
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+
+        nested = []
+        for layer in self._layers:
+            if key not in layer:
+                continue
+            value = layer[key]
+            if is_not_set(value):
+                continue
+            if not isinstance(value, Mapping):
+                if not nested:
+                    self._resolved[key] = value
+                    return value
+                break
+            nested.append(value)
+
+        if not nested:
+            raise KeyError(key)
+        value = LayeredMapping(nested)
+        self._resolved[key] = value
+        return value
+
+    def _key_list(self) -> list:
+        "Return resolved keys, computed once"
+        if self._keys is None:
+            seen: dict = {}
+            for layer in reversed(self._layers):
+                for key, value in layer.items():
+                    if key not in seen and not is_not_set(value):
+                        seen[key] = None
+            self._keys = list(seen)
+        return self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._key_list())
+
+    def __len__(self) -> int:
+        return len(self._key_list())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return resolved data as plain nested dicts.
+
+        Values are copied, the result does not share state with layers.
+
+        Returns:
+            Nested dict.
+        """
+        if len(self._layers) == 1:
+            return _plain_copy(self._layers[0])
+        return {key: _plain_copy(self[key]) for key in self._key_list()}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({len(self._layers)} layers)"
+
+
+def _plain_copy(value: Any) -> Any:
+    """Return value with layers resolved, containers copied, NOT_SET skipped."""
+    if isinstance(value, _IMMUTABLE_LEAFS):
+        return value
+    if isinstance(value, LayeredMapping):
+        return value.to_dict()
+    if isinstance(value, Mapping):
+        return {
+            key: _plain_copy(val) for key, val in value.items() if not is_not_set(val)
+        }
+    if isinstance(value, list):
+        return [_plain_copy(item) for item in value]
+    return deepcopy(value)
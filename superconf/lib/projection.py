@@ -0,0 +1,156 @@
+"""Projection: select parts of nested data by dotted paths.
+
+Standalone utility (no SuperConf types). A ``Projection`` is an immutable
+trie of paths: a selected path keeps its whole subtree, keys outside every
+path are dropped. Sources use it to skip data their consumer never reads.
+
+Example usage:
+    >>> projection = Projection(["db.host", "tags"])
+    >>> projection.apply({"db": {"host": "h", "port": 1}, "tags": [1], "x": 0})
+    {'db': {'host': 'h'}, 'tags': [1]}
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+PathSpec = Union[str, Sequence[str]]
+
+
+class Projection:
+    """Immutable set of selected paths, stored as a trie.
+
+    Paths covered by a shorter selected path are merged into it. Projections
+    are hashable and compare by their selected paths.
+
+    Args:
+        paths: Dotted path strings or sequences of keys.
+        sep: Path separator for string paths.
+
+    Raises:
+        ValueError: If a path is empty.
+    """
+
+    __slots__ = ("_children", "_paths")
+
+    def __init__(self, paths: Iterable[PathSpec] = (), sep: str = ".") -> None:
+        trie: dict = {}
+        for path in paths:
+            parts = tuple(path.split(sep)) if isinstance(path, str) else tuple(path)
+            if not parts or any(part == "" for part in parts):
+                raise ValueError(f"Invalid projection path: {path!r}")
+            node = trie
+            for part in parts[:-1]:
+                child = node.setdefault(part, {})
+                if child is None:
+                    break
+                node = child
+            else:
+                node[parts[-1]] = None
+        self._set_trie(trie)
+
+    @classmethod
+    def _from_trie(cls, trie: dict) -> "Projection":
+        "Build a projection from a nested dict trie, None marks full subtrees"
+        projection = cls.__new__(cls)
+        projection._set_trie(trie)
+        return projection
+
+    def _set_trie(self, trie: dict) -> None:
+        "Freeze the trie into child projections and the selected paths"
+        self._children: dict[str, Optional[Projection]] = {
+            key: None if sub is None else Projection._from_trie(sub)
+            for key, sub in trie.items()
+        }
+        self._paths = frozenset(self._iter_paths())
+
+    def _iter_paths(self) -> Iterator[tuple[str, ...]]:
+        for key, child in self._children.items():
+            if child is None:
+                yield (key,)
+            else:
+                for path in child._iter_paths():
+                    yield (key, *path)
+
+    @property
+    def paths(self) -> frozenset:
+        """Return selected paths as key tuples."""
+        return self._paths
+
+    def keys(self) -> list[str]:
+        """Return selected keys at this level."""
+        return list(self._children)
+
+    def child(self, key: str) -> Optional["Projection"]:
+        """Return the projection below ``key``.
+
+        Args:
+            key: Selected key at this level.
+
+        Returns:
+            Child projection, or ``None`` when the whole subtree is selected.
+
+        Raises:
+            KeyError: If ``key`` is not selected.
+        """
+        return self._children[key]
+
+    def select(self, keys: Sequence[str]) -> Union[bool, "Projection"]:
+        """Tell whether data at the path ``keys`` is selected.
+
+        Args:
+            keys: Path from this level, as keys.
+
+        Returns:
+            ``True`` when the path is inside a selected subtree, ``False``
+            when it is dropped, or the projection below a partially selected
+            path.
+        """
+        node: Projection = self
+        for key in keys:
+            if key not in node._children:
+                return False
+            child = node._children[key]
+            if child is None:
+                return True
+            node = child
+        return node
+
+    def apply(self, data: Any) -> Any:
+        """Return data restricted to the selected paths.
+
+        Selected subtrees are shared, not copied. Non-mapping data is
+        returned as is.
+
+        Args:
+            data: Nested mapping.
+
+        Returns:
+            New dict with the selected keys found in data.
+        """
+        if not isinstance(data, Mapping):
+            return data
+        out = {}
+        for key, child in self._children.items():
+            if key in data:
+                value = data[key]
+                out[key] = value if child is None else child.apply(value)
+        return out
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._children
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Projection):
+            return NotImplemented
+        return self._paths == other._paths
+
+    def __hash__(self) -> int:
+        return hash(self._paths)
+
+    def __repr__(self) -> str:
+        paths = sorted(".".join(path) for path in self._paths)
+        return f"{self.__class__.__name__}({paths})"
@@ -27,7 +27,39 @@ Example usage:
     '<NOT_SET>'
 """
 
-from sentinel import create
+
+def _failing_new(cls, *_args, **_kwargs):
+    raise TypeError(f"Sentinel {cls.__name__} can not be allocated more than once")
+
+
+def create(name, mro, cls_dict):
+    """Create the singleton instance of a new sentinel class.
+
+    Same objects as ``sentinel.create``: the instance repr is its name, it
+    pickles and copies to itself, and calling its class returns it. The
+    module is set here, ``sentinel.create`` finds it with ``inspect.stack()``,
+    which made most of the package import time.
+    """
+    instances = []
+
+    class _SentinelMeta(type(mro[0])):
+        def __call__(cls, *args, **kwargs):
+            if not instances:
+                instances.append(super().__call__(*args, **kwargs))
+            return instances[0]
+
+    namespace = {
+        "__module__": __name__,
+        "__repr__": lambda _: name,
+        "__reduce__": lambda _: name,
+        "__copy__": lambda self: self,
+        "__deepcopy__": lambda self, _: self,
+        **cls_dict,
+    }
+    sentinel_cls = _SentinelMeta("_Sentinel", mro, namespace)
+    instance = sentinel_cls()
+    sentinel_cls.__new__ = _failing_new
+    return instance
 
 
 class Sentinel:
@@ -0,0 +1,113 @@
+"""On-disk snapshot cache: store picklable data under a string key.
+
+Standalone utility (no SuperConf types). Each entry is one pickle file in the
+cache directory. Writes go to a temporary file in the same directory, then
+``os.replace`` moves it in place, so readers in other processes see either
+the previous file or the complete new one. Unreadable entries are misses.
+
+Only point the cache at a directory you trust: entries are unpickled.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+_SUFFIX = ".pickle"
+_READ_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    TypeError,
+    ValueError,
+)
+
+
+class SnapshotCache:
+    """Directory of pickled snapshots, one file per key.
+
+    Args:
+        directory: Cache directory, created on first write.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+
+    def path_for(self, key: str) -> Path:
+        """Return the file path of a key.
+
+        Args:
+            key: Cache key, used as file name (e.g. a hex digest).
+
+        Returns:
+            Entry path inside the cache directory.
+        """
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def load(self, key: str, default: Any = None) -> Any:
+        """Return the data stored under key.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the entry is missing or unreadable.
+
+        Returns:
+            Stored data, or ``default``.
+        """
+        try:
+            with open(self.path_for(key), "rb") as stream:
+                return pickle.load(stream)
+        except _READ_ERRORS:
+            return default
+
+    def store(self, key: str, data: Any) -> Path:
+        """Write data under key, atomically replacing any previous entry.
+
+        Args:
+            key: Cache key.
+            data: Picklable data.
+
+        Returns:
+            Entry path.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        target = self.path_for(key)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.directory, prefix=f".{key}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                pickle.dump(data, stream, protocol=pickle.HIGHEST_PROTOCOL)
+                stream.flush()
+                os.fsync(stream.fileno())
+            os.replace(tmp_name, target)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return target
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of removed entries.
+        """
+        removed = 0
+        if not self.directory.is_dir():
+            return removed
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
@@ -96,6 +96,18 @@ MERGE_OTHER_DEFAULT = _KIND_DEFAULT[MergeKind.OTHER]
 MERGE_DICT_DEFAULT = _KIND_DEFAULT[MergeKind.DICT]
 MERGE_LIST_DEFAULT = _KIND_DEFAULT[MergeKind.LIST]
 
+# Lookup tables for the hot path, see compile_merge()
+_STRATEGY_BY_VALUE = {strategy.value: strategy for strategy in MergeStrategy}
+_STRATEGY_KIND = {
+    MergeStrategy.PREPEND: MergeKind.LIST,
+    MergeStrategy.APPEND: MergeKind.LIST,
+    MergeStrategy.OVERRIDE_PRESENT: MergeKind.DICT,
+    MergeStrategy.OVERRIDE_ABSENT: MergeKind.DICT,
+    MergeStrategy.OVERRIDE_NON_NULL: MergeKind.OTHER,
+}
+_ENSURED: Dict = {}
+_MERGERS: Dict = {}
+
 
 def normalize_merge_strategy(value: Any) -> MergeStrategy:
     """Normalize a merge strategy from enum or string to ``MergeStrategy``.
@@ -113,8 +125,8 @@ def normalize_merge_strategy(value: Any) -> MergeStrategy:
         return value
     if isinstance(value, str):
         try:
-            return MergeStrategy(value)
-        except ValueError as exc:
+            return _STRATEGY_BY_VALUE[value]
+        except KeyError as exc:
             allowed = ", ".join(repr(s.value) for s in MergeStrategy)
             raise ValueError(
                 f"Invalid merge strategy {value!r}, expected one of: {allowed}"
@@ -138,6 +150,11 @@ def ensure_merge_strategy(strategy: Any, kind: MergeKind) -> MergeStrategy:
     Raises:
         ValueError: If strategy is unknown or invalid for kind.
     """
+    try:
+        return _ENSURED[strategy, kind]
+    except (KeyError, TypeError):
+        pass
+
     strategy = normalize_merge_strategy(strategy)
     allowed = _KIND_ALLOWED[kind]
     if strategy not in allowed:
@@ -145,6 +162,7 @@ def ensure_merge_strategy(strategy: Any, kind: MergeKind) -> MergeStrategy:
             f"Invalid {kind.value} merge strategy '{strategy}', "
             f"expected one of: {tuple(allowed)}"
         )
+    _ENSURED[strategy, kind] = strategy
     return strategy
 
 
@@ -168,13 +186,9 @@ def infer_merge_kind(
     Returns:
         Inferred ``MergeKind``.
     """
-    strategy = normalize_merge_strategy(strategy)
-    if strategy in (MergeStrategy.PREPEND, MergeStrategy.APPEND):
-        return MergeKind.LIST
-    if strategy in (MergeStrategy.OVERRIDE_PRESENT, MergeStrategy.OVERRIDE_ABSENT):
-        return MergeKind.DICT
-    if strategy == MergeStrategy.OVERRIDE_NON_NULL:
-        return MergeKind.OTHER
+    kind = _STRATEGY_KIND.get(normalize_merge_strategy(strategy))
+    if kind is not None:
+        return kind
     if isinstance(base, list) or isinstance(other, list):
         return MergeKind.LIST
     if isinstance(base, dict) or isinstance(other, dict):
@@ -201,13 +215,26 @@ def prefer_other_scalar(
         True if ``other`` wins.
     """
     strategy = ensure_merge_strategy(strategy, MergeKind.OTHER)
-    other_set = is_set(other)
-    if strategy == MergeStrategy.OVERRIDE:
-        return other_set
-    if strategy == MergeStrategy.OVERRIDE_NON_NULL:
-        return other_set and other is not None
-    # KEEP
-    return (not is_set(base)) and other_set
+    return _SCALAR_PREFER[strategy](base, other, is_set)
+
+
+def _prefer_override(_base, other, is_set):
+    return is_set(other)
+
+
+def _prefer_override_non_null(_base, other, is_set):
+    return is_set(other) and other is not None
+
+
+def _prefer_keep(base, other, is_set):
+    return (not is_set(base)) and is_set(other)
+
+
+_SCALAR_PREFER = {
+    MergeStrategy.OVERRIDE: _prefer_override,
+    MergeStrategy.OVERRIDE_NON_NULL: _prefer_override_non_null,
+    MergeStrategy.KEEP: _prefer_keep,
+}
 
 
 def merge_data(
@@ -232,46 +259,118 @@ def merge_data(
     """
     if kind is None:
         kind = infer_merge_kind(strategy, base, other)
-    strategy = ensure_merge_strategy(strategy, kind)
+    if kind == MergeKind.OTHER:
+        ensure_merge_strategy(strategy, kind)
+        raise ValueError(f"merge_data does not support kind {kind!r}")
+    return compile_merge(strategy, kind)(base, other)
+
+
+def compile_merge(strategy: Any, kind: MergeKind) -> Callable[[Any, Any], Any]:
+    """Return the merge callable of a (strategy, kind) pair.
 
+    Pairs are validated once and memoized, callables skip strategy
+    normalization and dispatch entirely.
+
+    Args:
+        strategy: Merge strategy (enum or string).
+        kind: Merge value kind.
+
+    Returns:
+        Callable ``(base, other)`` returning the merged value. For
+        ``MergeKind.OTHER`` it returns the winning scalar.
+
+    Raises:
+        ValueError: If strategy/kind combination is invalid.
+    """
+    try:
+        return _MERGERS[strategy, kind]
+    except (KeyError, TypeError):
+        pass
+
+    strategy = ensure_merge_strategy(strategy, kind)
     if kind == MergeKind.LIST:
-        base_list = list(base) if base is not None else []
-        other_list = list(other) if other is not None else []
-        if strategy == MergeStrategy.REPLACE:
-            return other_list
-        if strategy == MergeStrategy.KEEP:
-            return base_list
-        if strategy == MergeStrategy.APPEND:
-            return base_list + other_list
-        # PREPEND
-        return other_list + base_list
+        func = _LIST_MERGERS[strategy]
+    elif kind == MergeKind.DICT:
+        func = _DICT_MERGERS[strategy]
+    else:
+        prefer = _SCALAR_PREFER[strategy]
 
-    if kind == MergeKind.DICT:
-        base_dict = dict(base) if base is not None else {}
-        other_dict = dict(other) if other is not None else {}
-        if strategy == MergeStrategy.REPLACE:
-            merged = dict(other_dict)
-        elif strategy == MergeStrategy.KEEP:
-            merged = dict(base_dict)
-        else:
-            merged = merge_maps(
-                base_dict,
-                other_dict,
-                strategy,
-                merge_both=_deep_merge_dict_values,
-            )
-        return merged
+        def func(base, other):
+            return other if prefer(base, other, is_merge_value_set) else base
+
+    _MERGERS[strategy, kind] = func
+    return func
 
-    raise ValueError(f"merge_data does not support kind {kind!r}")
+
+def _as_list(value: Any) -> list:
+    return list(value) if value is not None else []
+
+
+def _as_dict(value: Any) -> dict:
+    return dict(value) if value is not None else {}
+
+
+def _list_replace(_base, other):
+    return _as_list(other)
+
+
+def _list_keep(base, _other):
+    return _as_list(base)
+
+
+def _list_append(base, other):
+    return _as_list(base) + _as_list(other)
+
+
+def _list_prepend(base, other):
+    return _as_list(other) + _as_list(base)
+
+
+def _dict_replace(_base, other):
+    return _as_dict(other)
+
+
+def _dict_keep(base, _other):
+    return _as_dict(base)
+
+
+def _dict_override(base, other):
+    return _maps_override(_as_dict(base), _as_dict(other), _deep_merge_dict_values)
+
+
+def _dict_override_present(base, other):
+    return _maps_override_present(
+        _as_dict(base), _as_dict(other), _deep_merge_dict_values
+    )
+
+
+def _dict_override_absent(base, other):
+    return _maps_override_absent(_as_dict(base), _as_dict(other))
 
 
 def _deep_merge_dict_values(base: Any, other: Any) -> Any:
     """Recursively merge nested dict values; otherwise prefer ``other``."""
     if isinstance(base, dict) and isinstance(other, dict):
-        return merge_data(base, other, MergeStrategy.OVERRIDE, MergeKind.DICT)
+        return _maps_override(base, other, _deep_merge_dict_values)
     return other
 
 
+_LIST_MERGERS = {
+    MergeStrategy.REPLACE: _list_replace,
+    MergeStrategy.KEEP: _list_keep,
+    MergeStrategy.APPEND: _list_append,
+    MergeStrategy.PREPEND: _list_prepend,
+}
+
+_DICT_MERGERS = {
+    MergeStrategy.REPLACE: _dict_replace,
+    MergeStrategy.KEEP: _dict_keep,
+    MergeStrategy.OVERRIDE: _dict_override,
+    MergeStrategy.OVERRIDE_PRESENT: _dict_override_present,
+    MergeStrategy.OVERRIDE_ABSENT: _dict_override_absent,
+}
+
+
 def merge_maps(
     base: Mapping,
     other: Mapping,
@@ -298,22 +397,29 @@ def merge_maps(
         return dict(other)
     if strategy == MergeStrategy.KEEP:
         return dict(base)
-
-    out: Dict = {}
     if strategy == MergeStrategy.OVERRIDE_ABSENT:
-        out = dict(base)
-        for key, right in other.items():
-            if key not in out:
-                out[key] = right
-        return out
-
+        return _maps_override_absent(base, other)
     if strategy == MergeStrategy.OVERRIDE_PRESENT:
-        keys: Iterable = base.keys()
-    else:
-        keys = _unique(list(base.keys()) + list(other.keys()))
+        return _maps_override_present(base, other, merge_both, missing)
+    return _maps_override(base, other, merge_both, missing)
 
-    for key in keys:
-        left = base[key] if key in base else missing
+
+def _maps_override_absent(base: Mapping, other: Mapping) -> Dict:
+    """Add keys of ``other`` missing from ``base``."""
+    out = dict(base)
+    for key, right in other.items():
+        if key not in out:
+            out[key] = right
+    return out
+
+
+def _maps_override_present(
+    base: Mapping, other: Mapping, merge_both: Callable, missing: Any = _MISSING
+) -> Dict:
+    """Merge keys of ``base`` with matching keys of ``other``."""
+    out: Dict = {}
+    for key in base.keys():
+        left = base[key]
         right = other[key] if key in other else missing
         if left is not missing and right is not missing:
             out[key] = merge_both(left, right)
@@ -324,6 +430,141 @@ def merge_maps(
     return out
 
 
+def _maps_override(
+    base: Mapping, other: Mapping, merge_both: Callable, missing: Any = _MISSING
+) -> Dict:
+    """Merge the union of keys, base keys first."""
+    out = _maps_override_present(base, other, merge_both, missing)
+    for key in other.keys():
+        if key not in base:
+            right = other[key]
+            if right is not missing:
+                out[key] = right
+    return out
+
+
+def merge_all_maps(
+    maps: Iterable[Mapping],
+    strategy: Any,
+    *,
+    merge_many: Callable[[list], Any],
+) -> Dict:
+    """Merge many key/value maps in one pass with a dict merge strategy.
+
+    Gives the same result as folding ``merge_maps`` left to right, but each
+    key is visited once with all its values.
+
+    Args:
+        maps: Mappings, from lowest to highest precedence.
+        strategy: Dict merge strategy.
+        merge_many: Called with all values of keys present in several maps.
+
+    Returns:
+        New dict with merged entries.
+    """
+    maps = list(maps)
+    strategy = ensure_merge_strategy(strategy, MergeKind.DICT)
+    if not maps:
+        return {}
+
+    if strategy == MergeStrategy.REPLACE:
+        return dict(maps[-1])
+    if strategy == MergeStrategy.KEEP:
+        return dict(maps[0])
+
+    out: Dict = {}
+    if strategy == MergeStrategy.OVERRIDE_ABSENT:
+        for mapping in maps:
+            for key, value in mapping.items():
+                if key not in out:
+                    out[key] = value
+        return out
+
+    if strategy == MergeStrategy.OVERRIDE_PRESENT:
+        keys: Iterable = maps[0].keys()
+    else:
+        keys = _unique(key for mapping in maps for key in mapping.keys())
+
+    for key in keys:
+        values = [mapping[key] for mapping in maps if key in mapping]
+        out[key] = values[0] if len(values) == 1 else merge_many(values)
+    return out
+
+
+def merge_all_data(
+    values: Iterable[Any],
+    strategy: Any,
+    kind: Optional[MergeKind] = None,
+) -> Any:
+    """Merge many plain values (list/dict) in one pass.
+
+    Same result as folding ``merge_data`` left to right.
+
+    Args:
+        values: Values, from lowest to highest precedence.
+        strategy: Merge strategy (enum or string).
+        kind: Explicit kind; inferred from first and last values when omitted.
+
+    Returns:
+        Merged value (new list/dict).
+
+    Raises:
+        ValueError: If no value is given or strategy/kind is invalid.
+    """
+    values = list(values)
+    if not values:
+        raise ValueError("merge_all_data requires at least one value")
+    if kind is None:
+        kind = infer_merge_kind(strategy, values[0], values[-1])
+    strategy = ensure_merge_strategy(strategy, kind)
+
+    if kind == MergeKind.LIST:
+        lists = [list(value) if value is not None else [] for value in values]
+        if strategy == MergeStrategy.REPLACE:
+            return lists[-1]
+        if strategy == MergeStrategy.KEEP:
+            return lists[0]
+        if strategy == MergeStrategy.PREPEND:
+            lists.reverse()
+        return [item for items in lists for item in items]
+
+    if kind == MergeKind.DICT:
+        dicts = [dict(value) if value is not None else {} for value in values]
+        return merge_all_maps(dicts, strategy, merge_many=_deep_merge_all_dict_values)
+
+    raise ValueError(f"merge_all_data does not support kind {kind!r}")
+
+
+def _deep_merge_all_dict_values(values: list) -> Any:
+    """Recursively merge the trailing run of dict values; else take the last."""
+    if not isinstance(values[-1], dict):
+        return values[-1]
+    start = len(values) - 1
+    while start > 0 and isinstance(values[start - 1], dict):
+        start -= 1
+    if start == len(values) - 1:
+        return values[-1]
+    return merge_all_data(values[start:], MergeStrategy.OVERRIDE, MergeKind.DICT)
+
+
+def merge_all(nodes: Iterable[Any]) -> Any:
+    """Merge configuration nodes left to right in a single pass.
+
+    Args:
+        nodes: Nodes, from lowest to highest precedence.
+
+    Returns:
+        Merged node, built once from all inputs.
+
+    Raises:
+        ValueError: If no node is given.
+    """
+    nodes = list(nodes)
+    if not nodes:
+        raise ValueError("merge_all requires at least one node")
+    return nodes[0].merge_all(nodes[1:])
+
+
 # Thin aliases kept for existing callers / docs
 def merge_list_data(base, other, strategy):
     """Merge two list values according to a list merge strategy."""
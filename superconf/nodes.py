@@ -25,6 +25,7 @@ safety and validation.
 """
 
 import copy
+import inspect
 import logging
 from typing import Any, List, Optional, Type, Union
 
@@ -54,7 +55,172 @@ def _maybe_cast_config(out: Any, cast: Optional[Type], context: Any) -> Any:
     return out
 
 
-class BaseNode:
+def _is_set(val: Any) -> bool:
+    "Return True when val is neither UNSET_ARG nor a NOT_SET sentinel"
+    return val is not UNSET_ARG and not is_not_set(val)
+
+
+# Per-class resolution plans
+# ----------------------------
+# Each node class lazily caches how ``__meta__``, ``Meta`` and ``meta__NAME``
+# resolve for every queried setting name. Plans are tagged with a global
+# epoch; any class attribute change bumps the epoch so stale plans rebuild.
+
+_PLAN_MISS = object()
+_DYNAMIC = object()
+_PLAN_EPOCH = 0
+
+
+def invalidate_node_plans() -> None:
+    """Drop every cached per-class resolution plan.
+
+    Called automatically when an attribute is set or deleted on a node class.
+    Call it explicitly after mutating a ``Meta`` or ``__meta__`` class in place.
+    """
+    global _PLAN_EPOCH  # pylint: disable=global-statement
+    _PLAN_EPOCH += 1
+
+
+def node_plan_epoch() -> int:
+    "Return the current plan epoch, bumped on every node class change"
+    return _PLAN_EPOCH
+
+
+def node_class_plan(cls: type) -> dict:
+    """Return the mutable resolution plan of a node class.
+
+    Args:
+        cls: Node class owning the plan.
+
+    Returns:
+        Dict mapping setting names to ``(value, report_label)`` or None.
+    """
+    plan = cls.__dict__.get("__node_plan__")
+    if plan is None or plan[0] != _PLAN_EPOCH:
+        plan = (_PLAN_EPOCH, {})
+        # Bypass NodeMeta.__setattr__, storing a plan is not a class change
+        type.__setattr__(cls, "__node_plan__", plan)
+    return plan[1]
+
+
+def query_class_config(cls: type, name: str, overrides: Optional[List] = None) -> Any:
+    """Resolve a setting from class-level sources only.
+
+    Same precedence as ``Node.__node_get_self_config__`` without per-instance
+    attributes: overrides, then the class plan, then the class
+    ``__node_config__`` default when the class has one.
+
+    Args:
+        cls: Node class to query.
+        name: Configuration setting name to query.
+        overrides: Optional list of override values.
+
+    Returns:
+        The resolved value, or ``UNSET_ARG`` when it can only be resolved on
+        an instance (descriptor ``meta__NAME``) or is not defined at all.
+    """
+    for _override in overrides or []:
+        if _is_set(_override):
+            return _override
+
+    plan = node_class_plan(cls)
+    hit = plan.get(name, _PLAN_MISS)
+    if hit is _PLAN_MISS:
+        hit = _resolve_setting(cls, name)
+        plan[name] = hit
+    if hit is not None:
+        if hit[0] is _DYNAMIC:
+            return UNSET_ARG
+        out = hit[0]
+        return copy.copy(out) if isinstance(out, (dict, list)) else out
+
+    config = getattr(cls, "__node_config__", None)
+    if config is None:
+        return UNSET_ARG
+    return config.query(name)
+
+
+def _resolve_setting(target: Any, name: str) -> Optional[tuple]:
+    """Look up a setting on ``__meta__``, ``Meta`` then ``meta__NAME``.
+
+    Args:
+        target: Node class (for plans) or node instance (for overrides).
+        name: Configuration setting name to query.
+
+    Returns:
+        ``(value, report_label)`` tuple, or None when not defined. When a
+        class-level ``meta__NAME`` is a descriptor, value is ``_DYNAMIC``.
+    """
+    if hasattr(target, "__meta__"):
+        val = getattr(target.__meta__, name, UNSET_ARG)
+        if val is not UNSET_ARG:
+            return (val, f"class_meta:__meta__.{name}")
+
+    if hasattr(target, "Meta"):
+        val = getattr(target.Meta, name, UNSET_ARG)
+        if val is not UNSET_ARG:
+            return (val, f"class_meta:Meta.{name}")
+
+    attr = f"meta__{name}"
+    val = getattr(target, attr, UNSET_ARG)
+    if val is not UNSET_ARG:
+        if isinstance(target, type) and hasattr(
+            inspect.getattr_static(target, attr), "__get__"
+        ):
+            val = _DYNAMIC
+        return (val, f"self_attr:{attr}")
+
+    return None
+
+
+class NodeMeta(type):
+    """Metaclass keeping per-class resolution plans coherent.
+
+    Setting or deleting an attribute on a node class invalidates all plans.
+    """
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        invalidate_node_plans()
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        invalidate_node_plans()
+
+
+# Node path caching
+# ----------------------------
+# Full names and keys are cached per node and tagged with a global epoch,
+# bumped whenever an already set node key or parent is changed.
+
+_PATH_EPOCH = 0
+
+
+class _NodePathAttr:
+    """Data descriptor for node attributes that shape the node path.
+
+    Values are stored in the instance ``__dict__`` under the same name, so
+    ``__dict__`` copies keep working. Re-assigning a different value bumps the
+    path epoch, invalidating every cached ``__node_fname__``/``__node_fkey__``.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name  # pylint: disable=attribute-defined-outside-init
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return None
+        return obj.__dict__.get(self.name)
+
+    def __set__(self, obj, value):
+        inst_dict = obj.__dict__
+        if self.name in inst_dict and inst_dict[self.name] is not value:
+            global _PATH_EPOCH  # pylint: disable=global-statement
+            _PATH_EPOCH += 1
+        inst_dict[self.name] = value
+
+
+class BaseNode(metaclass=NodeMeta):
     """Base class for configuration objects providing core configuration query functionality.
 
     This class implements hierarchical configuration management with support for querying values
@@ -72,10 +238,13 @@ class BaseNode:
         Meta: Inner class for class-level configuration settings
     """
 
-    __node_key__: Optional[Union[str, int]] = None
-    __node_parent__: Optional["Node"] = None
+    __node_key__: Optional[Union[str, int]] = _NodePathAttr()
+    __node_parent__: Optional["Node"] = _NodePathAttr()
     __node_value__: Any = NOT_SET
 
+    # Instance attributes holding caches, dropped when a node is copied
+    __node_cache_attrs__ = ("__node_fname_cache__", "__node_fkey_cache__")
+
     # pylint: disable=too-few-public-methods
     class Meta:
         """Class to store class-level configuration settings."""
@@ -115,31 +284,34 @@ class BaseNode:
     @property
     def __node_fname__(self) -> str:
         """The full hierarchical name including all parent names."""
-        curr = self
-        out = []
-        while curr is not None:
-            name = curr.__node_name__
-            assert isinstance(
-                name, str
-            ), f"Object {curr} does not have a valid name, got: {name}"
-            out.append(name)
-            curr = curr.__node_parent__
-        out.reverse()
-        return ".".join(out)
+        cached = self.__dict__.get("__node_fname_cache__")
+        if cached is not None and cached[0] == _PATH_EPOCH:
+            return cached[1]
+
+        name = self.__node_name__
+        assert isinstance(
+            name, str
+        ), f"Object {self} does not have a valid name, got: {name}"
+        parent = self.__node_parent__
+        if parent is not None:
+            name = f"{parent.__node_fname__}.{name}"
+        self.__dict__["__node_fname_cache__"] = (_PATH_EPOCH, name)
+        return name
 
     @property
     def __node_fkey__(self) -> str:
         """The full hierarchical key including all parent keys."""
-        curr = self
-        out = []
-        while curr is not None:
-            curr_key = curr.__node_key__
-            if not isinstance(curr_key, (int, str)):
-                curr_key = ""
-            out.append(curr_key)
-            curr = curr.__node_parent__
-        out.reverse()
-        return ".".join(out)
+        cached = self.__dict__.get("__node_fkey_cache__")
+        if cached is not None and cached[0] == _PATH_EPOCH:
+            return cached[1]
+
+        key = self.__node_key__
+        key = str(key) if isinstance(key, (int, str)) else ""
+        parent = self.__node_parent__
+        if parent is not None:
+            key = f"{parent.__node_fkey__}.{key}"
+        self.__dict__["__node_fkey_cache__"] = (_PATH_EPOCH, key)
+        return key
 
 
 # pylint: disable=too-few-public-methods
@@ -166,124 +338,44 @@ class Node(BaseNode):
 
         return out
 
-    # pylint: disable=too-many-branches
     def __node_get_self_config__(
         self,
         name: str,
         cast: Optional[Type] = None,
         report: Optional[List] = None,
-        **kwargs,
+        overrides: Optional[List] = None,
+        defaults: Optional[List] = None,
+        default: Any = UNSET_ARG,
     ) -> Any:
         """Query instance configuration with optional type casting.
 
+        Searches for configuration values in the following precedence order:
+        1. Dictionary override if provided
+        2. Class Meta attribute via __meta__
+        3. Class Meta attribute via Meta class
+        4. Instance attribute with meta__ prefix
+        5. Defaults list, then default value if provided
+
+        Steps 2 to 4 are resolved once per class (see ``node_class_plan``),
+        unless the instance itself carries ``__meta__``, ``Meta`` or
+        ``meta__NAME`` attributes.
+
         Args:
             name: Configuration setting name to query
             cast: Optional type to cast the result to
             report: Optional list to collect query trace information
-            **kwargs: Additional arguments passed to _query_inst_cfg
+            overrides: Optional list of override values
+            defaults: Optional list of fallback values
+            default: Default value if setting is not found
 
         Returns:
             The configuration value, optionally cast to the specified type
 
         Raises:
+            MissingSetting: If the setting is not found and no default is provided
             AssertionError: If casting fails
         """
 
-        def is_defined(val):
-            if val is UNSET_ARG:
-                return False
-            return True
-
-        def is_set(val):
-            if val is UNSET_ARG:
-                return False
-            if is_not_set(val):
-                return False
-            return True
-
-        def _query_inst_cfg(
-            name: str,
-            overrides: Optional[List] = None,
-            defaults: Optional[List] = None,
-            default: Any = UNSET_ARG,
-            report: Optional[List] = None,
-        ) -> Any:
-            """Internal method to query instance configuration from various sources.
-
-            Searches for configuration values in the following precedence order:
-            1. Dictionary override if provided
-            2. Instance attribute with _name prefix
-            3. Class Meta attribute via __meta__
-            4. Class Meta attribute via Meta class
-            5. Instance attribute with meta__ prefix
-            6. Default value if provided
-
-            Args:
-                name: Configuration setting name to query
-                overrides: Optional list of override values
-                default: Default value if setting is not found
-                report: Optional list to collect query trace information
-
-            Returns:
-                The configuration value if found
-
-            Raises:
-                UnknownSetting: If the setting is not found and no default is provided
-            """
-            query_from = report if isinstance(report, list) else []
-
-            if isinstance(overrides, list):
-                for idx, _override in enumerate(overrides):
-                    if is_set(_override):
-                        query_from.append(f"overrides_arg:{name}:{idx}")
-                        return _override
-            elif overrides is not None:
-                raise ValueError(f"Invalid override type: {type(overrides)}")
-
-            # Fetch from self.__meta__.NAME
-            cls = self
-            if hasattr(cls, "__meta__"):
-                val = getattr(cls.__meta__, name, UNSET_ARG)
-                if is_defined(val):
-
-                    query_from.append(f"class_meta:__meta__.{name}")
-                    return val
-
-            # Python class params: self.Meta.NAME
-            # Good for class overrides
-            cls = self
-            if hasattr(cls, "Meta"):
-                val = getattr(cls.Meta, name, UNSET_ARG)
-                if is_defined(val):
-                    query_from.append(f"class_meta:Meta.{name}")
-                    return val
-
-            # Fetch from self.meta__NAME
-            # Python class inherited params (good for defaults)
-            val = getattr(self, f"meta__{name}", UNSET_ARG)
-            if is_defined(val):
-                query_from.append(f"self_attr:meta__{name}")
-                return val
-
-            if isinstance(defaults, list):
-                for idx, _default in enumerate(defaults):
-                    if is_set(_default):
-                        query_from.append(f"defaults_arg:{name}:{idx}")
-                        return _default
-            elif defaults is not None:
-                raise ValueError(f"Invalid default type: {type(defaults)}")
-
-            if default is not UNSET_ARG:
-                query_from.append("default_arg")
-                return default
-
-            msg = (
-                f"Failed to query setting: '{name}'"
-                # f"Setting '{name}' has not been declared before being used"
-                f" in '{repr(self)}', please provide default value, tried to query: {query_from}"
-            )
-            raise exceptions.MissingSetting(msg)
-
         # Ensure the temporary node configuration declares the setting.
         if hasattr(self, "tmp__node_config"):
             if not hasattr(self.tmp__node_config, name):
@@ -293,17 +385,92 @@ class Node(BaseNode):
                 )
                 raise exceptions.UnknownSetting(msg)
 
-        report = report if isinstance(report, list) else []
-        out = _query_inst_cfg(name, report=report, **kwargs)
-        logger.debug(
-            "Node config query for %s.%s=%s (from: %s)", self, name, out, report[-1]
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if isinstance(report, list):
+            trace = report
+        else:
+            trace = [] if debug else None
+
+        out = self._node_query_config(name, overrides, defaults, default, trace)
+        if debug:
+            logger.debug(
+                "Node config query for %s.%s=%s (from: %s)", self, name, out, trace[-1]
+            )
 
         if isinstance(out, (dict, list)):
             out = copy.copy(out)
 
         return _maybe_cast_config(out, cast, self)
 
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _node_query_config(self, name, overrides, defaults, default, trace):
+        """Resolve a setting from overrides, class plan, then defaults.
+
+        Args:
+            name: Configuration setting name to query
+            overrides: Optional list of override values
+            defaults: Optional list of fallback values
+            default: Default value if setting is not found
+            trace: Optional list collecting where the value came from
+
+        Returns:
+            The configuration value if found
+
+        Raises:
+            MissingSetting: If the setting is not found and no default is provided
+        """
+        if isinstance(overrides, list):
+            for idx, _override in enumerate(overrides):
+                if _is_set(_override):
+                    if trace is not None:
+                        trace.append(f"overrides_arg:{name}:{idx}")
+                    return _override
+        elif overrides is not None:
+            raise ValueError(f"Invalid override type: {type(overrides)}")
+
+        # Fetch from __meta__, Meta or meta__NAME
+        inst_dict = self.__dict__
+        if (
+            "__meta__" in inst_dict
+            or "Meta" in inst_dict
+            or f"meta__{name}" in inst_dict
+        ):
+            hit = _resolve_setting(self, name)
+        else:
+            plan = node_class_plan(type(self))
+            hit = plan.get(name, _PLAN_MISS)
+            if hit is _PLAN_MISS:
+                hit = _resolve_setting(type(self), name)
+                plan[name] = hit
+            if hit is not None and hit[0] is _DYNAMIC:
+                # Descriptors (methods, properties) must bind to the instance
+                hit = (getattr(self, f"meta__{name}"), hit[1])
+        if hit is not None:
+            if trace is not None:
+                trace.append(hit[1])
+            return hit[0]
+
+        if isinstance(defaults, list):
+            for idx, _default in enumerate(defaults):
+                if _is_set(_default):
+                    if trace is not None:
+                        trace.append(f"defaults_arg:{name}:{idx}")
+                    return _default
+        elif defaults is not None:
+            raise ValueError(f"Invalid default type: {type(defaults)}")
+
+        if default is not UNSET_ARG:
+            if trace is not None:
+                trace.append("default_arg")
+            return default
+
+        query_from = trace if trace is not None else []
+        msg = (
+            f"Failed to query setting: '{name}'"
+            f" in '{repr(self)}', please provide default value, tried to query: {query_from}"
+        )
+        raise exceptions.MissingSetting(msg)
+
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     def __node_get_hier_config__(
         self,
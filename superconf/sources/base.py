@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
-from typing import Any, Callable, Mapping, Optional, Union
+from typing import Any, Callable, Hashable, Mapping, Optional, Union
 
-from superconf.common import read_file
+from superconf.common import decode_text, read_file_bytes
+from superconf.lib.frozen import freeze
+from superconf.lib.projection import Projection
 
 DataDict = dict[str, Any]
 DataFactory = Callable[[], Mapping[str, Any]]
@@ -37,6 +40,7 @@ class BaseSource:
             raise SourceError("Source name must be a non-empty string")
         self.name = str(name).strip()
         self.help = help
+        self._generation = 0
 
     def load(self) -> DataDict:
         """Load data as a nested dict.
@@ -46,6 +50,38 @@ class BaseSource:
         """
         raise NotImplementedError()
 
+    def load_projected(self, projection: Optional[Projection]) -> DataDict:
+        """Load only the data selected by a projection.
+
+        Sources that can skip unselected data early override this, the
+        default loads everything and keeps the selected paths.
+
+        Args:
+            projection: Selected paths, or None for all data.
+
+        Returns:
+            Nested configuration dictionary, treat it as read-only.
+        """
+        if projection is None:
+            return self.load()
+        return projection.apply(self.load())
+
+    def fingerprint(self) -> Optional[Hashable]:
+        """Return a cheap token that changes when loaded data may change.
+
+        ``View`` reuses previously loaded data while the fingerprint is
+        unchanged. ``None`` means the source can not tell, it is then
+        reloaded on every lookup.
+
+        Returns:
+            Hashable fingerprint, or None.
+        """
+        return None
+
+    def invalidate(self) -> None:
+        """Mark loaded data as stale, so the next lookup reloads it."""
+        self._generation += 1
+
     def dump(self, data: Mapping[str, Any]) -> Union[str, DataDict, None]:
         """Dump a nested dict to this source's format.
 
@@ -74,51 +110,150 @@ class BaseSource:
 class TextFileSource(BaseSource):
     """Base for sources that load from a text string or filesystem path.
 
+    Parsed data is cached with the source fingerprint (file path, mtime and
+    size): unchanged inputs are neither read nor parsed again. Loaded data
+    is read-only (``FrozenDict`` / ``FrozenList``), use ``thaw`` to get a
+    mutable copy.
+
+    Files are read as bytes in one call. Parsers that decode bytes
+    themselves set ``parse_bytes`` and get them as is, others get the text
+    decoded once.
+
     Args:
         name: Unique source name.
         data: Format text, filesystem path, or None.
         path: Optional path (alternative to ``data`` when loading a file).
+        content_hash: Also hash file content, so a touched but unchanged
+            file is read but not parsed again.
         help: Optional description.
     """
 
-    # pylint: disable=redefined-builtin
+    # Pass file bytes to ``_parse`` instead of decoded text
+    parse_bytes = False
+
+    # pylint: disable=redefined-builtin,too-many-arguments
     def __init__(
         self,
         name: str,
         data: Union[str, Path, None] = None,
         *,
         path: Union[str, Path, None] = None,
+        content_hash: bool = False,
         help: Optional[str] = None,
     ) -> None:
         super().__init__(name, help=help)
         self._data = data
         self._path = path
+        # Inline text or file is decided once, loads do not stat the text
+        self._file = self._find_file(data, path)
+        self.content_hash = content_hash
+        # (fingerprint, content digest, parsed data) of the last load
+        self._parsed: Optional[tuple[Hashable, Optional[str], DataDict]] = None
 
-    def _read_raw(self) -> str:
-        """Return text from ``data`` or ``path``.
+    def _read_raw(self) -> Union[str, bytes]:
+        """Return file bytes from ``path``, or text from ``data``.
 
         Returns:
-            Raw format text.
+            Raw file bytes, or inline format text.
 
         Raises:
             SourceLoadError: If neither input is set.
         """
-        if self._path is not None:
-            return read_file(str(self._path))
+        path = self._resolve_path()
+        if path is not None:
+            return read_file_bytes(str(path))
         if self._data is None:
             raise SourceLoadError(
                 f"{self.__class__.__name__} {self.name!r} has no data or path to load"
             )
-        path_candidate = Path(str(self._data))
-        if path_candidate.is_file():
-            return read_file(str(path_candidate))
         return str(self._data)
 
+    @staticmethod
+    def _find_file(
+        data: Union[str, Path, None], path: Union[str, Path, None]
+    ) -> Optional[Path]:
+        """Return the file to read, or None when ``data`` is inline text.
+
+        Args:
+            data: Format text, filesystem path, or None.
+            path: Explicit path, or None.
+
+        Returns:
+            Path of the file to load, or None.
+        """
+        if path is not None:
+            return Path(path)
+        if data is None:
+            return None
+        try:
+            path_candidate = Path(str(data))
+            if path_candidate.is_file():
+                return path_candidate
+        except (OSError, ValueError):
+            # Inline text can be too long or invalid as a file name
+            pass
+        return None
+
+    def _resolve_path(self) -> Optional[Path]:
+        """Return the file to read, or None when ``data`` is inline text.
+
+        Returns:
+            Path of the file to load, or None.
+        """
+        return self._file
+
+    def fingerprint(self) -> Optional[Hashable]:
+        """Return file stat based fingerprint, or generation for inline text.
+
+        Returns:
+            Hashable fingerprint, or None if the file can not be stat'ed.
+        """
+        path = self._resolve_path()
+        if path is None:
+            return (self._generation, None)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (self._generation, str(path), stat.st_mtime_ns, stat.st_size)
+
     def load(self) -> DataDict:
-        """Load data as a nested dict.
+        """Load data as a read-only nested dict, reusing the last parse.
+
+        Returns:
+            Nested configuration dictionary.
+
+        Raises:
+            SourceLoadError: If no input is configured or parsing fails.
+        """
+        fingerprint = self.fingerprint()
+        cached = self._parsed
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            return cached[2]
+
+        raw = self._read_raw()
+        digest = None
+        if self.content_hash:
+            encoded = raw if isinstance(raw, bytes) else raw.encode("utf-8")
+            digest = hashlib.sha256(encoded).hexdigest()
+            if cached is not None and cached[1] == digest:
+                self._parsed = (fingerprint, digest, cached[2])
+                return cached[2]
+
+        if isinstance(raw, bytes) and not self.parse_bytes:
+            raw = decode_text(raw)
+        data = freeze(self._parse(raw))
+        self._parsed = (fingerprint, digest, data)
+        return data
+
+    def _parse(self, raw: Union[str, bytes]) -> DataDict:
+        """Parse raw text into a nested dict.
 
         Subclasses must implement format-specific parsing.
 
+        Args:
+            raw: Raw format text, or file bytes when ``parse_bytes`` is set.
+
         Returns:
             Nested configuration dictionary.
         """
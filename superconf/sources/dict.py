@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Hashable, Mapping, Optional, Union
 
 from superconf.sources.base import BaseSource, DataDict, DataFactory, resolve_mapping
 
@@ -36,6 +36,19 @@ class DictSource(BaseSource):
         """
         return resolve_mapping(self._data)
 
+    def fingerprint(self) -> Optional[Hashable]:
+        """Return a generation based fingerprint.
+
+        Mappings mutated in place are not detected, call ``invalidate()``
+        after changing them. Factories are called on every load.
+
+        Returns:
+            Hashable fingerprint, or None for factories.
+        """
+        if callable(self._data):
+            return None
+        return (self._generation, id(self._data))
+
     def dump(self, data: Mapping[str, Any]) -> DataDict:
         """Return a plain dict copy of ``data``.
 
@@ -3,15 +3,31 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Mapping, Optional, Union
+from typing import Any, Hashable, Mapping, Optional, TextIO, Union
 
-from superconf.lib.codec_env import expand_env, flatten_env, to_dotenv
+from superconf.lib.codec_env import (
+    CodecEnvError,
+    expand_env,
+    filter_env,
+    flatten_env,
+    iter_flatten_env,
+    split_env_key,
+    to_dotenv,
+    write_dotenv,
+)
+from superconf.lib.frozen import freeze
+from superconf.lib.projection import Projection
 from superconf.sources.base import BaseSource, DataDict, SourceDumpError
 
 
 class EnvSource(BaseSource):
     """Source that converts ``PREFIX__PATH`` environment variables.
 
+    Only variables matching the prefix are read on each load, and the
+    expansion is rebuilt only when they changed. The whole environ is
+    scanned again only when its size changed. Loaded data is read-only,
+    like file sources.
+
     Args:
         name: Unique source name.
         prefix: Required env prefix (e.g. ``APP``).
@@ -36,15 +52,98 @@ class EnvSource(BaseSource):
         self.separator = separator
         self.skip_none = skip_none
         self._environ = environ
+        # (environ, its size, matching keys) of the last full scan
+        self._keys: Optional[tuple[Mapping[str, str], int, tuple[str, ...]]] = None
+        # (matching variables snapshot, expanded data) of the last load
+        self._expanded: Optional[tuple[tuple, DataDict]] = None
+        # (projection, snapshot, expanded data) of the last projected load
+        self._projected: Optional[tuple[Projection, tuple, DataDict]] = None
+
+    def _matching(self) -> tuple:
+        """Return a snapshot of the variables matching the prefix.
+
+        All keys are scanned only when the environ size changed since the
+        last scan, otherwise the matching keys are read again. A variable
+        replaced by another one in between, keeping the size, is seen after
+        ``invalidate()``.
+
+        Returns:
+            Tuple of ``(key, value)`` pairs, in environ order.
+        """
+        environ = self._environ if self._environ is not None else os.environ
+        keys = self._keys
+        if keys is not None and keys[0] is environ and keys[1] == len(environ):
+            try:
+                return tuple((key, environ[key]) for key in keys[2])
+            except KeyError:
+                pass
+        matching = filter_env(environ, prefix=self.prefix, separator=self.separator)
+        self._keys = (environ, len(environ), tuple(matching))
+        return tuple(matching.items())
 
     def load(self) -> DataDict:
         """Expand matching environment variables into a nested dict.
 
         Returns:
-            Nested configuration dictionary (values as strings).
+            Read-only nested configuration dictionary (values as strings).
         """
-        environ = self._environ if self._environ is not None else os.environ
-        return expand_env(environ, prefix=self.prefix, separator=self.separator)
+        snapshot = self._matching()
+        cached = self._expanded
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+        data = freeze(
+            expand_env(dict(snapshot), prefix=self.prefix, separator=self.separator)
+        )
+        self._expanded = (snapshot, data)
+        return data
+
+    def load_projected(self, projection: Optional[Projection]) -> DataDict:
+        """Expand only the matching variables under selected paths.
+
+        Args:
+            projection: Selected paths, or None for all variables.
+
+        Returns:
+            Read-only nested configuration dictionary (values as strings).
+        """
+        if projection is None:
+            return self.load()
+        snapshot = self._matching()
+        cached = self._projected
+        if cached is not None and cached[:2] == (projection, snapshot):
+            return cached[2]
+
+        # Bad keys are kept, so expand_env reports them like load() does
+        selected = {}
+        for key, value in snapshot:
+            try:
+                segments = split_env_key(key, self.prefix, self.separator)
+            except CodecEnvError:
+                selected[key] = value
+                continue
+            path = [segment.lower() for segment in segments]
+            if projection.select(path) is not False:
+                selected[key] = value
+        data = freeze(
+            expand_env(selected, prefix=self.prefix, separator=self.separator)
+        )
+        self._projected = (projection, snapshot, data)
+        return data
+
+    def invalidate(self) -> None:
+        """Drop the cached expansion and bump the generation."""
+        super().invalidate()
+        self._keys = None
+        self._expanded = None
+        self._projected = None
+
+    def fingerprint(self) -> Optional[Hashable]:
+        """Return a snapshot of the matching environment variables.
+
+        Returns:
+            Hashable fingerprint.
+        """
+        return (self._generation, self._matching())
 
     def dump(
         self,
@@ -52,21 +151,43 @@ class EnvSource(BaseSource):
         *,
         fmt: str = "dict",
         skip_none: Optional[bool] = None,
-    ) -> Union[DataDict, str]:
+        stream: Optional[TextIO] = None,
+    ) -> Union[DataDict, str, None]:
         """Flatten a nested dict to env keys.
 
         Args:
             data: Nested configuration dictionary.
             fmt: ``dict``, ``dotenv``, or ``exports``.
             skip_none: Override constructor ``skip_none`` when set.
+            stream: Text file object; when set, dotenv/export lines are
+                written to it line by line, with the same content as the
+                returned text.
 
         Returns:
-            Flat env dict, or dotenv/export text.
+            Flat env dict, or dotenv/export text, or None when written to
+            ``stream``.
 
         Raises:
-            SourceDumpError: If ``fmt`` is unknown.
+            SourceDumpError: If ``fmt`` is unknown, or ``dict`` with a stream.
         """
         omit_none = self.skip_none if skip_none is None else skip_none
+        if fmt not in ("dict", "dotenv", "exports"):
+            raise SourceDumpError(
+                f"Unknown env dump format {fmt!r}; use dict, dotenv, or exports"
+            )
+        if stream is not None:
+            if fmt == "dict":
+                raise SourceDumpError("Env dump format 'dict' can not use a stream")
+            items = iter_flatten_env(
+                data,
+                prefix=self.prefix,
+                separator=self.separator,
+                skip_none=omit_none,
+                sort_keys=True,
+            )
+            write_dotenv(items, stream, export=fmt == "exports")
+            return None
+
         flat = flatten_env(
             data,
             prefix=self.prefix,
@@ -75,10 +196,4 @@ class EnvSource(BaseSource):
         )
         if fmt == "dict":
             return flat
-        if fmt == "dotenv":
-            return to_dotenv(flat, export=False)
-        if fmt == "exports":
-            return to_dotenv(flat, export=True)
-        raise SourceDumpError(
-            f"Unknown env dump format {fmt!r}; use dict, dotenv, or exports"
-        )
+        return to_dotenv(flat, export=fmt == "exports")
@@ -17,9 +17,12 @@ class JsonSource(TextFileSource):
         data: JSON string, filesystem path, or None.
         path: Optional path (alternative to ``data`` when loading a file).
         nice: Pretty-print JSON on dump when True.
+        content_hash: Skip parsing touched but unchanged files.
         help: Optional description.
     """
 
+    parse_bytes = True
+
     def __init__(  # pylint: disable=redefined-builtin,too-many-arguments
         self,
         name: str,
@@ -27,21 +30,25 @@ class JsonSource(TextFileSource):
         *,
         path: Union[str, Path, None] = None,
         nice: bool = True,
+        content_hash: bool = False,
         help: Optional[str] = None,
     ) -> None:
-        super().__init__(name, data, path=path, help=help)
+        super().__init__(name, data, path=path, content_hash=content_hash, help=help)
         self.nice = nice
 
-    def load(self) -> DataDict:
-        """Parse JSON from string or file into a nested dict.
+    def _parse(self, raw: Union[str, bytes]) -> DataDict:
+        """Parse JSON text into a nested dict.
+
+        Args:
+            raw: JSON text, or UTF-8/16/32 file bytes.
 
         Returns:
             Nested configuration dictionary.
 
         Raises:
-            SourceLoadError: If no input is configured or JSON is not a dict.
+            SourceLoadError: If JSON is not a dict.
         """
-        return self._as_root_dict(from_json(self._read_raw()), "JSON")
+        return self._as_root_dict(from_json(raw), "JSON")
 
     def dump(self, data: Mapping[str, Any]) -> str:
         """Serialize a nested dict to a JSON string.
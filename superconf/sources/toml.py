@@ -46,19 +46,22 @@ class TomlSource(TextFileSource):
         name: Unique source name.
         data: TOML string, filesystem path, or None.
         path: Optional path (alternative to ``data`` when loading a file).
+        content_hash: Skip parsing touched but unchanged files.
         help: Optional description.
     """
 
-    def load(self) -> DataDict:
-        """Parse TOML from string or file into a nested dict.
+    def _parse(self, raw: str) -> DataDict:
+        """Parse TOML text into a nested dict.
+
+        Args:
+            raw: TOML text.
 
         Returns:
             Nested configuration dictionary.
 
         Raises:
-            SourceLoadError: If no input is configured or backend is missing.
+            SourceLoadError: If the TOML backend is missing.
         """
-        raw = self._read_raw()
         tomllib = _load_toml_module()
         # tomllib.loads expects str on tomli; tomllib (stdlib) wants str via loads
         # in 3.11+ loads accepts str. Prefer loads; fall back to loads on bytes.
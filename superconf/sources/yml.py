@@ -2,32 +2,87 @@
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Union
 
-from superconf.common import from_yaml, to_yaml
+from superconf.common import from_yaml, from_yaml_all, to_yaml
+from superconf.lib.layered import LayeredMapping
 from superconf.sources.base import DataDict, TextFileSource
 
 
 class YamlSource(TextFileSource):
     """Source that loads/dumps YAML text or files.
 
+    Parsing and dumping use the libyaml C classes when PyYAML was built
+    with them, see ``superconf.common.yaml_backend()``.
+
     Args:
         name: Unique source name.
         data: YAML string, filesystem path, or None.
         path: Optional path (alternative to ``data`` when loading a file).
+        all_documents: Load every document of a multi-document stream and
+            deep-merge them in order, later documents win. By default only
+            single-document streams are accepted.
+        content_hash: Skip parsing touched but unchanged files.
         help: Optional description.
     """
 
-    def load(self) -> DataDict:
-        """Parse YAML from string or file into a nested dict.
+    parse_bytes = True
+
+    def __init__(  # pylint: disable=redefined-builtin,too-many-arguments
+        self,
+        name: str,
+        data: Union[str, Path, None] = None,
+        *,
+        path: Union[str, Path, None] = None,
+        all_documents: bool = False,
+        content_hash: bool = False,
+        help: Optional[str] = None,
+    ) -> None:
+        super().__init__(name, data, path=path, content_hash=content_hash, help=help)
+        self.all_documents = all_documents
+
+    def _parse(self, raw: Union[str, bytes]) -> DataDict:
+        """Parse YAML text into a nested dict.
+
+        Args:
+            raw: YAML text, or UTF-8/16/32 file bytes.
 
         Returns:
             Nested configuration dictionary.
 
         Raises:
-            SourceLoadError: If no input is configured or YAML is not a dict.
+            SourceLoadError: If YAML is not a dict.
+        """
+        if not self.all_documents:
+            return self._as_root_dict(from_yaml(raw), "YAML")
+        documents = [self._as_root_dict(doc, "YAML") for doc in from_yaml_all(raw)]
+        if not documents:
+            return {}
+        return LayeredMapping(documents[::-1]).to_dict()
+
+    def iter_documents(self) -> Iterator[DataDict]:
+        """Stream the documents of a YAML file or text, one at a time.
+
+        Files are parsed while read, only the current document is held in
+        memory. Documents are not cached, empty documents are skipped.
+
+        Yields:
+            One nested dictionary per document.
+
+        Raises:
+            SourceLoadError: If a document is not a dict.
         """
-        return self._as_root_dict(from_yaml(self._read_raw()), "YAML")
+        path = self._resolve_path()
+        if path is None:
+            for doc in from_yaml_all(self._read_raw()):
+                if doc is not None:
+                    yield self._as_root_dict(doc, "YAML")
+            return
+        with open(path, encoding="utf-8") as stream:
+            for doc in from_yaml_all(stream):
+                if doc is not None:
+                    yield self._as_root_dict(doc, "YAML")
 
     def dump(self, data: Mapping[str, Any]) -> str:
         """Serialize a nested dict to a YAML string.
@@ -6,9 +6,19 @@ optional CLI dict through ``View`` with ``TWELVE_FACTOR_ORDER`` precedence.
 
 from __future__ import annotations
 
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import weakref
 from pathlib import Path
 from typing import Any, Mapping, Optional, Sequence, Type, TypeVar, Union
 
+from superconf.common import UNSET_ARG
+from superconf.lib.codec_env import filter_env
+from superconf.lib.snapshot_cache import SnapshotCache
+from superconf.nodes import node_plan_epoch, query_class_config
 from superconf.sources import (
     ConfigSource,
     DictSource,
@@ -23,6 +33,9 @@ from superconf.views import TWELVE_FACTOR_ORDER, View
 ConfigT = TypeVar("ConfigT")
 PathLike = Union[str, Path]
 
+# Schema digests per config class, tagged with the node plan epoch
+_SCHEMA_DIGESTS: "weakref.WeakKeyDictionary[type, tuple]" = weakref.WeakKeyDictionary()
+
 
 class TwelveFactorError(ValueError):
     """Raised when 12-factor loading cannot be configured."""
@@ -80,6 +93,145 @@ def _file_source(path: PathLike) -> BaseSource:
     )
 
 
+def _stable_repr(value: Any) -> str:
+    """Return a repr that does not change between processes.
+
+    Classes, functions and objects without their own ``__repr__`` are named
+    by their qualified name instead of their memory address.
+    """
+    if inspect.isclass(value) or inspect.isroutine(value):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    if isinstance(value, dict):
+        items = ", ".join(
+            f"{_stable_repr(key)}: {_stable_repr(val)}" for key, val in value.items()
+        )
+        return f"{{{items}}}"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_stable_repr(item) for item in value)}]"
+    if type(value).__repr__ is object.__repr__:
+        return _stable_repr(type(value))
+    return repr(value)
+
+
+def _schema_signature(cls: type, seen: set) -> Optional[list]:
+    """Return a process-stable description of a class schema and defaults.
+
+    Args:
+        cls: Node class to describe.
+        seen: Classes already described, guards recursive schemas.
+
+    Returns:
+        Nested list of strings, or ``None`` when a default is computed at
+        runtime (callable or instance-level) and the schema cannot be keyed.
+    """
+    out = [_stable_repr(cls)]
+    if not hasattr(cls, "__node_config__") or cls in seen:
+        return out
+    seen.add(cls)
+
+    for name in ("default", "cast", "merge", "children_class"):
+        value = query_class_config(cls, name)
+        if value is UNSET_ARG and hasattr(cls, f"meta__{name}"):
+            return None
+        if name == "default" and callable(value):
+            return None
+        out.append(_stable_repr(value))
+        if name == "children_class" and inspect.isclass(value):
+            child = _schema_signature(value, seen)
+            if child is None:
+                return None
+            out.append(child)
+
+    schema_getter = getattr(cls, "_node_class_schema", None)
+    if schema_getter is None:
+        return out
+    for entry in schema_getter().entries:
+        if callable(entry.default):
+            return None
+        child = _schema_signature(entry.instance_class, seen)
+        if child is None:
+            return None
+        out.append(
+            [
+                entry.attr,
+                entry.key,
+                _stable_repr(entry.default),
+                _stable_repr(dict(entry.init_kwargs)),
+                child,
+            ]
+        )
+    return out
+
+
+def _schema_digest(config_cls: type) -> Optional[str]:
+    """Return the schema signature digest of a class, cached per node epoch."""
+    epoch = node_plan_epoch()
+    cached = _SCHEMA_DIGESTS.get(config_cls)
+    if cached is not None and cached[0] == epoch:
+        return cached[1]
+    signature = _schema_signature(config_cls, set())
+    digest = None
+    if signature is not None:
+        digest = hashlib.sha256(repr(signature).encode("utf-8")).hexdigest()
+    _SCHEMA_DIGESTS[config_cls] = (epoch, digest)
+    return digest
+
+
+# pylint: disable-next=too-many-arguments
+def _snapshot_key(
+    config_cls: type,
+    *,
+    prefix: Optional[str],
+    file: Optional[PathLike],
+    cli: Optional[Mapping[str, Any]],
+    environ: Optional[Mapping[str, str]],
+    order: Sequence[str],
+    project: bool,
+) -> Optional[str]:
+    """Return the snapshot cache key of a 12-factor load, without loading.
+
+    The key covers the schema and defaults, the file stat, the matching env
+    vars, the CLI dict, the layer order and the SuperConf/Python versions.
+
+    Returns:
+        Hex digest, or ``None`` when the inputs cannot be keyed (runtime
+        defaults, missing file).
+    """
+    # pylint: disable-next=import-outside-toplevel,cyclic-import
+    from superconf import __version__
+
+    schema = _schema_digest(config_cls)
+    if schema is None:
+        return None
+
+    file_token = None
+    if file is not None:
+        path = Path(file)
+        try:
+            stat = path.stat()
+        except (OSError, ValueError):
+            return None
+        file_token = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    env_token = None
+    if prefix is not None:
+        env = os.environ if environ is None else environ
+        env_token = tuple(sorted(filter_env(env, prefix).items()))
+
+    parts = (
+        __version__,
+        sys.version,
+        schema,
+        list(order),
+        project,
+        prefix,
+        file_token,
+        env_token,
+        None if cli is None else _stable_repr(dict(cli)),
+    )
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
 # Keyword-only public API: layer knobs stay explicit (not a options bag).
 # pylint: disable-next=too-many-arguments
 def build_12factor_view(
@@ -132,6 +284,8 @@ def load_12factor(
     cli: Optional[Mapping[str, Any]] = None,
     environ: Optional[Mapping[str, str]] = None,
     order: Optional[Sequence[str]] = None,
+    cache_dir: Optional[PathLike] = None,
+    project: bool = False,
 ) -> ConfigT:
     """Load a typed config from layered 12-factor sources.
 
@@ -146,10 +300,35 @@ def load_12factor(
         cli: Optional mapping of CLI overrides.
         environ: Optional env mapping for tests; defaults to ``os.environ``.
         order: Optional custom source order (highest first).
+        cache_dir: Optional directory for a snapshot cache of the merged
+            data. When the schema, file stat, matching env vars and CLI dict
+            are unchanged since the last load, the merged data is read back
+            instead of reloading every layer. Loads whose defaults are
+            computed at runtime are never cached.
+        project: Only load the paths declared by ``config_cls`` from the
+            sources (see ``schema_projection``). Undeclared keys are then
+            ignored instead of raising ``UndeclaredField``.
 
     Returns:
         Instance of ``config_cls`` with merged, cast values.
     """
+    cache = key = None
+    if cache_dir is not None:
+        cache = SnapshotCache(cache_dir)
+        key = _snapshot_key(
+            config_cls,
+            prefix=_resolve_env_prefix(config_cls, env_prefix),
+            file=file,
+            cli=cli,
+            environ=environ,
+            order=order if order is not None else TWELVE_FACTOR_ORDER,
+            project=project,
+        )
+        if key is not None:
+            data = cache.load(key)
+            if isinstance(data, dict):
+                return config_cls(value=data)
+
     view = build_12factor_view(
         config_cls,
         env_prefix=env_prefix,
@@ -158,7 +337,13 @@ def load_12factor(
         environ=environ,
         order=order,
     )
-    return config_cls(value=view.materialize())
+    data = view.materialize(projection=config_cls if project else None)
+    if key is not None:
+        try:
+            cache.store(key, data)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass
+    return config_cls(value=data)
 
 
 # Developer-facing alias (not a ConfigurationObj method — keep core free of this).
@@ -6,10 +6,13 @@ converter from ``superconf.sources`` that can ``load()`` a nested dict.
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Any, List, Mapping, Optional, Sequence
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Hashable, List, Mapping, Optional, Sequence
 
-from superconf.common import UNSET_ARG, is_not_set
+from superconf.common import UNSET_ARG, build_path_index, is_not_set
+from superconf.lib.layered import LayeredMapping
+from superconf.lib.projection import Projection
 from superconf.sources.base import BaseSource, DataDict
 
 # Highest priority first (12-factor friendly default names).
@@ -28,40 +31,6 @@ class NoResults(ViewError):
     """Raised when a key is not found in any source."""
 
 
-def _deep_overlay(base: Any, overlay: Any) -> Any:
-    """Merge overlay onto base; overlay wins on conflicts.
-
-    Dicts are merged recursively. Lists and scalars from overlay replace base.
-    NOT_SET in overlay is skipped (does not erase base). ``None`` is a real
-    value and wins.
-
-    Args:
-        base: Existing value (lower priority).
-        overlay: Incoming value (higher priority).
-
-    Returns:
-        Merged value.
-    """
-    if is_not_set(overlay):
-        return deepcopy(base)
-
-    if is_not_set(base):
-        return deepcopy(overlay)
-
-    if isinstance(base, Mapping) and isinstance(overlay, Mapping):
-        result: DataDict = deepcopy(dict(base))
-        for key, val in overlay.items():
-            if is_not_set(val):
-                continue
-            if key in result:
-                result[key] = _deep_overlay(result[key], val)
-            else:
-                result[key] = deepcopy(val)
-        return result
-
-    return deepcopy(overlay)
-
-
 def _lookup_path(data: Mapping[str, Any], key: str) -> Any:
     """Return a top-level or dotted-path value from data.
 
@@ -88,6 +57,54 @@ def _lookup_path(data: Mapping[str, Any], key: str) -> Any:
     return current
 
 
+def as_projection(value: Any) -> Optional[Projection]:
+    """Return a ``Projection`` from a projection, paths or config class.
+
+    Args:
+        value: ``Projection``, iterable of dotted paths, a ConfigurationObj
+            class (its declared paths, see ``schema_projection``), or None.
+
+    Returns:
+        Projection, or None to load all data.
+    """
+    if value is None or isinstance(value, Projection):
+        return value
+    if isinstance(value, str):
+        return Projection([value])
+    if isinstance(value, type):
+        # pylint: disable-next=import-outside-toplevel,cyclic-import
+        from superconf.container import schema_projection
+
+        return schema_projection(value)
+    return Projection(value)
+
+
+class _Layer:
+    """Loaded source data with its fingerprint and lazy path index."""
+
+    __slots__ = ("fingerprint", "data", "_index")
+
+    def __init__(self, fingerprint: Optional[Hashable], data: DataDict) -> None:
+        self.fingerprint = fingerprint
+        self.data = data
+        self._index: Optional[dict[str, Any]] = None
+
+    def lookup(self, key: str) -> Any:
+        """Return value at ``key``, from the path index for cached layers.
+
+        Args:
+            key: Top-level key or dotted path.
+
+        Returns:
+            Found value, or ``UNSET_ARG`` if missing / unset.
+        """
+        if self.fingerprint is None:
+            return _lookup_path(self.data, key)
+        if self._index is None:
+            self._index = build_path_index(self.data)
+        return self._index.get(key, UNSET_ARG)
+
+
 class View:
     """Ordered stack of sources for layered configuration lookup.
 
@@ -104,6 +121,8 @@ class View:
         self._sources: dict[str, BaseSource] = {}
         self._order: List[str] = list(order) if order is not None else []
         self._order_preset = order is not None
+        # Layers by (source name, projection), projection None for full data
+        self._layer_cache: dict[tuple[str, Optional[Projection]], _Layer] = {}
 
     def add(self, source: BaseSource) -> None:
         """Register a source by its ``name``.
@@ -160,30 +179,178 @@ class View:
         """
         return [self._sources[name] for name in self._order if name in self._sources]
 
-    def load_layers(self) -> List[tuple[str, DataDict]]:
+    def load_layers(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        projection: Optional[Projection] = None,
+    ) -> List[tuple[str, DataDict]]:
         """Load all sources in precedence order.
 
+        Layers are served from the cache while source fingerprints are
+        unchanged, treat returned data as read-only.
+
+        Args:
+            parallel: Load sources concurrently on a thread pool.
+            max_workers: Pool size, defaults to one thread per source.
+            projection: Only load the selected paths, see ``as_projection``.
+
         Returns:
             List of ``(name, data)`` pairs, highest priority first.
         """
-        layers: List[tuple[str, DataDict]] = []
-        for source in self.get_ordered_sources():
-            layers.append((source.name, source.load()))
-        return layers
+        projection = as_projection(projection)
+        sources = self.get_ordered_sources()
+
+        def load(source: BaseSource) -> DataDict:
+            return self._load_source(source, projection)
+
+        if parallel and len(sources) > 1:
+            workers = max_workers or len(sources)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                loaded = list(pool.map(load, sources))
+        else:
+            loaded = [load(source) for source in sources]
+        return [(source.name, data) for source, data in zip(sources, loaded)]
+
+    async def aload_layers(
+        self, projection: Optional[Projection] = None
+    ) -> List[tuple[str, DataDict]]:
+        """Load all sources concurrently without blocking the event loop.
+
+        Each source is loaded in a worker thread, results keep the
+        precedence order.
+
+        Args:
+            projection: Only load the selected paths, see ``as_projection``.
+
+        Returns:
+            List of ``(name, data)`` pairs, highest priority first.
+        """
+        projection = as_projection(projection)
+        sources = self.get_ordered_sources()
+        loaded = await asyncio.gather(
+            *(
+                asyncio.to_thread(self._load_source, source, projection)
+                for source in sources
+            )
+        )
+        return [(source.name, data) for source, data in zip(sources, loaded)]
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop cached layer data so sources are reloaded on next access.
+
+        Args:
+            name: Source name to invalidate; all sources when omitted.
+        """
+        if name is None:
+            self._layer_cache.clear()
+            return
+        for cache_key in [key for key in self._layer_cache if key[0] == name]:
+            del self._layer_cache[cache_key]
+
+    def _load_source(
+        self, source: BaseSource, projection: Optional[Projection] = None
+    ) -> DataDict:
+        """Return source data, shared with the layer cache (do not mutate).
+
+        Args:
+            source: Registered source.
+            projection: Selected paths, or None for all data.
+
+        Returns:
+            Loaded data.
+        """
+        return self._load_layer(source, projection).data
+
+    def _load_layer(
+        self, source: BaseSource, projection: Optional[Projection] = None
+    ) -> _Layer:
+        """Return the cached layer of ``source``, reloading it when stale.
+
+        Sources returning a ``None`` fingerprint are always reloaded.
+
+        Args:
+            source: Registered source.
+            projection: Selected paths, or None for all data.
 
-    def materialize(self) -> DataDict:
+        Returns:
+            Loaded layer.
+        """
+        cache_key = (source.name, projection)
+        fingerprint = source.fingerprint()
+        if fingerprint is not None:
+            cached = self._layer_cache.get(cache_key)
+            if cached is not None and cached.fingerprint == fingerprint:
+                return cached
+
+        if projection is None:
+            layer = _Layer(fingerprint, source.load())
+        else:
+            layer = _Layer(fingerprint, source.load_projected(projection))
+        if fingerprint is None:
+            self._layer_cache.pop(cache_key, None)
+        else:
+            self._layer_cache[cache_key] = layer
+        return layer
+
+    def layered(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        projection: Optional[Projection] = None,
+    ) -> LayeredMapping:
+        """Return all layers as a lazy, read-only merged mapping.
+
+        Keys resolve through the layers on access, nothing is copied. The
+        result can be passed directly as ``value=`` to a configuration.
+
+        Args:
+            parallel: Load sources concurrently, see ``load_layers``.
+            max_workers: Pool size for parallel loading.
+            projection: Only load the selected paths, see ``as_projection``.
+
+        Returns:
+            Layered mapping, highest priority layer first.
+        """
+        layers = self.load_layers(
+            parallel=parallel, max_workers=max_workers, projection=projection
+        )
+        return LayeredMapping([data for _name, data in layers])
+
+    def materialize(
+        self,
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+        projection: Optional[Projection] = None,
+    ) -> DataDict:
         """Merge all layers into one nested dict.
 
-        Applies sources from lowest to highest priority so higher layers win.
-        Nested dicts merge deeply; lists/scalars replace.
+        Higher layers win. Nested dicts merge deeply; lists/scalars replace;
+        ``NOT_SET`` values are skipped.
+
+        Args:
+            parallel: Load sources concurrently, see ``load_layers``.
+            max_workers: Pool size for parallel loading.
+            projection: Only load the selected paths, see ``as_projection``.
 
         Returns:
             Resolved nested dictionary.
         """
-        result: DataDict = {}
-        for _name, data in reversed(self.load_layers()):
-            result = _deep_overlay(result, data)
-        return result if isinstance(result, dict) else {}
+        return self.layered(
+            parallel=parallel, max_workers=max_workers, projection=projection
+        ).to_dict()
+
+    async def amaterialize(self, projection: Optional[Projection] = None) -> DataDict:
+        """Async ``materialize``, loading sources with ``aload_layers``.
+
+        Args:
+            projection: Only load the selected paths, see ``as_projection``.
+
+        Returns:
+            Resolved nested dictionary.
+        """
+        layers = await self.aload_layers(projection=projection)
+        return LayeredMapping([data for _name, data in layers]).to_dict()
 
     def get(self, key: str, default: Any = UNSET_ARG) -> Any:
         """Return the first value found for ``key`` (highest priority wins).
@@ -198,8 +365,7 @@ class View:
         Raises:
             NoResults: If the key is absent from every source and no default.
         """
-        report: List[str] = []
-        value = self._query_first(key, report=report)
+        value = self._query_first(key, report=None)
         if value is not UNSET_ARG:
             return value
         if default is not UNSET_ARG:
@@ -254,27 +420,26 @@ class View:
 
         raise ViewError(f"Unknown query mode {mode!r}; use 'first' or 'all'")
 
-    def _iter_source_hits(self, key: str, report: List[str]):
+    def _iter_source_hits(self, key: str, report: Optional[List[str]]):
         """Yield set values found while walking sources high-to-low.
 
         Args:
             key: Top-level or dotted path to look up.
-            report: Mutable list collecting query trace messages.
+            report: Mutable list collecting query trace messages, or None.
 
         Yields:
             Each concrete value found in a source (skips missing/unset).
         """
         for source in self.get_ordered_sources():
-            report.append(f"Querying '{key}' from {source.name}")
-            data = source.load()
-            value = _lookup_path(data, key)
-            if value is UNSET_ARG:
-                report.append(f"  Not found '{key}' from {source.name}")
-                continue
-            report.append(f"  Found '{key}' from {source.name}")
-            yield value
-
-    def _query_first(self, key: str, report: List[str]) -> Any:
+            value = self._load_layer(source).lookup(key)
+            if report is not None:
+                report.append(f"Querying '{key}' from {source.name}")
+                found = "Not found" if value is UNSET_ARG else "Found"
+                report.append(f"  {found} '{key}' from {source.name}")
+            if value is not UNSET_ARG:
+                yield value
+
+    def _query_first(self, key: str, report: Optional[List[str]]) -> Any:
         """Walk sources high-to-low; return first set value or UNSET_ARG."""
         for value in self._iter_source_hits(key, report):
             return value
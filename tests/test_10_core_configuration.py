@@ -6,9 +6,20 @@ operations, field access, and configuration behavior.
 
 import pytest
 
-from superconf.configuration import ConfigurationObj
-from superconf.exceptions import UndeclaredField
-from superconf.fields import Field
+from superconf.common import UNSET_ARG
+from superconf.configuration import (
+    ConfigurationDict,
+    ConfigurationList,
+    ConfigurationObj,
+)
+from superconf.exceptions import (
+    FrozenConfiguration,
+    InvalidCastConfiguration,
+    UndeclaredField,
+)
+from superconf.fields import Field, FieldConf, FieldFloat, FieldInt
+from superconf.leaf import Leaf
+from superconf.lib.frozen import FrozenDict, FrozenList
 
 # Test data
 EXAMPLE_DICT = {
@@ -228,3 +239,444 @@ def test_configuration_iteration(base_config_class):
 
     assert items_count == len(FULL_CONFIG)
     assert collected_values == FULL_CONFIG
+
+
+def test_schema_compiled_at_class_creation(base_config_class):
+    """Declared fields are compiled once, shared fields are left untouched."""
+    schema = base_config_class.__dict__["__node_class_schema__"][1]
+    assert schema.keys == ("field1", "field2", "field3", "field4")
+    assert schema.entries[2].default == 42
+
+    config = base_config_class()
+    assert config.__node_schema__ is schema
+    assert not hasattr(schema.entries[0].field, "attr")
+    assert schema.entries[0].field.key is None
+
+    with pytest.raises(AttributeError):
+        schema.keys = ()
+
+
+def test_schema_recompiled_on_class_change(base_config_class):
+    """Changing class Meta at runtime is reflected by new instances."""
+
+    class Child(base_config_class):
+        """Child configuration."""
+
+    assert Child().get_value("field3") == 42
+    Child.Meta = type("Meta", (), {"children_classes": {"extra": Field(default=1)}})
+    config = Child()
+    assert config.__node_schema__.keys[-1] == "extra"
+    assert config.extra == 1
+
+
+def test_schema_index_lookup():
+    """Wide schemas resolve children through key and attr indexes."""
+    fields = {f"flag_{idx}": Field(default=idx) for idx in range(600)}
+    flag_12 = fields["flag_12"]
+    WideConfig = type("WideConfig", (ConfigurationObj,), fields)
+
+    config = WideConfig(value={"flag_599": -1})
+    assert config.flag_0 == 0
+    assert config.flag_599 == -1
+
+    schema = config.__node_schema__
+    assert schema.lookup(key="flag_10")[0].attr == "flag_10"
+    assert schema.lookup(attr="flag_11")[0].key == "flag_11"
+    assert schema.lookup(key="flag_1", attr="flag_1") == schema.by_key["flag_1"]
+    assert schema.lookup(key="missing") == ()
+    assert config._get_child_field(attr="flag_12") is flag_12
+
+
+def test_get_value_snapshot_cache(base_config_class):
+    """Container values are cached until a descendant changes."""
+
+    class Root(ConfigurationObj):
+        """Root configuration."""
+
+        name = Field(default="app")
+        sub = FieldConf(base_config_class)
+
+    config = Root()
+    first = config.get_value()
+    assert first["sub"]["field3"] == 42
+    cache = config.__dict__["__node_value_cache__"]
+    assert False in cache
+
+    # Returned values are private copies of the cached snapshot
+    first["sub"]["field3"] = 0
+    assert config.get_value()["sub"]["field3"] == 42
+    assert config.__dict__["__node_value_cache__"] is cache
+
+    # Variants are cached separately
+    assert config.get_value(nodefaults=True)["name"] is not None
+    assert set(cache) == {False, True}
+
+    # Deep changes mark the path to the root dirty
+    config.sub.set_value("field3", 7)
+    assert "__node_value_cache__" not in config.__dict__
+    assert config.get_value()["sub"]["field3"] == 7
+
+
+def test_get_value_snapshot_volatile_defaults():
+    """Callable defaults are evaluated on every get_value call."""
+    counter = []
+
+    class Dynamic(ConfigurationObj):
+        """Configuration with a dynamic default."""
+
+        static = Field(default=1)
+        dynamic = Field(default=lambda node: len(counter))
+
+    config = Dynamic()
+    assert config.get_value() == {"static": 1, "dynamic": 0}
+    counter.append(1)
+    assert config.get_value() == {"static": 1, "dynamic": 1}
+    assert "__node_value_cache__" not in config.__dict__
+
+
+def test_dotted_path_lookup(base_config_class):
+    """Dotted keys resolve through children from a cached path index."""
+
+    class Root(ConfigurationObj):
+        """Root configuration."""
+
+        name = Field(default="app")
+        sub = FieldConf(base_config_class)
+
+    config = Root()
+    assert config["sub.field3"] == 42
+    assert config["sub.field4.item2"] == 4333
+    assert config["sub"]["field1"] is False
+    assert config.get_path_value("sub.missing", default=None) is None
+    with pytest.raises(KeyError):
+        config["sub.missing"]
+
+    # Index is dropped with the snapshot on change
+    config.sub.field3 = 7
+    assert config["sub.field3"] == 7
+    assert config["sub"]["field3"] == 7
+
+
+def _build_error(config_cls, data):
+    "Return the error raised when building config_cls from data, or None"
+    try:
+        config_cls(value=data)
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        return err
+    return None
+
+
+def test_validate_collects_errors_without_nodes():
+    """validate() reports every cast and undeclared key with its path."""
+
+    class Db(ConfigurationObj):
+        """Database settings."""
+
+        port = FieldInt(default=5432)
+        host = Field(default="localhost")
+
+    class Ports(ConfigurationList):
+        """List of ports."""
+
+        class Meta:
+            """Ports settings."""
+
+            children_class = Db
+
+    class App(ConfigurationObj):
+        """Application settings."""
+
+        db = FieldConf(Db)
+        replicas = FieldConf(Ports)
+        name = Field(default="app")
+
+    assert not App.validate({"db": {"port": "5433"}, "replicas": [{"port": 1}]})
+    issues = App.validate(
+        {
+            "db": {"port": "x", "user": "me"},
+            "replicas": [{"port": 1}, {"port": "y"}],
+            "other": 1,
+        }
+    )
+    assert [issue.path for issue in issues] == [
+        "db.port",
+        "db.user",
+        "replicas.1.port",
+        "other",
+    ]
+    assert [type(issue.error) for issue in issues] == [
+        InvalidCastConfiguration,
+        UndeclaredField,
+        InvalidCastConfiguration,
+        UndeclaredField,
+    ]
+    assert [issue.path for issue in App.validate({"db": 3})] == ["db"]
+    assert [issue.path for issue in App.validate("oops")] == [""]
+
+
+def test_validate_reports_missing_required_field():
+    """A declared field without default nor value fails like the build."""
+
+    class App(ConfigurationObj):
+        """Application settings."""
+
+        ratio = FieldFloat()
+        name = Field(default="app")
+
+    with pytest.raises(InvalidCastConfiguration):
+        App(value={})
+    issues = App.validate({})
+    assert [issue.path for issue in issues] == ["ratio"]
+    assert isinstance(issues[0].error, InvalidCastConfiguration)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"db": {"port": "7"}, "tags": {"a": {"port": 2}}},
+        {"db": {"port": None}},
+        {"db": []},
+        {"tags": {"a": {"port": "z"}}},
+        {"tags": ["a"]},
+        {"extra": {"any": 1}},
+        "oops",
+    ],
+)
+def test_validate_matches_full_build(data):
+    """validate() reports errors exactly when building the tree fails."""
+
+    class Db(ConfigurationObj):
+        """Database settings."""
+
+        port = FieldInt(default=5432)
+
+    class Tags(ConfigurationDict):
+        """Mapping of databases."""
+
+        class Meta:
+            """Tags settings."""
+
+            children_class = Db
+
+    class App(ConfigurationObj):
+        """Application settings."""
+
+        db = FieldConf(Db)
+        tags = FieldConf(Tags)
+
+    class FlexibleApp(App):
+        """Application accepting extra keys."""
+
+        class Meta:
+            """Flexible settings."""
+
+            extra_fields = True
+
+    class RequiredApp(App):
+        """Application with a field without default."""
+
+        ratio = FieldFloat()
+
+    for config_cls in (App, FlexibleApp, RequiredApp):
+        error = _build_error(config_cls, data)
+        issues = config_cls.validate(data)
+        assert bool(issues) == (error is not None), (config_cls, issues, error)
+
+
+def test_validate_builds_classes_with_hooks():
+    """Classes overriding load hooks are validated by building them."""
+
+    class Port(ConfigurationObj):
+        """Port with a range check."""
+
+        value = FieldInt(default=80)
+
+        def post_load(self):
+            if self.get_value()["value"] > 65535:
+                raise ValueError("port out of range")
+
+    class App(ConfigurationObj):
+        """Application settings."""
+
+        port = FieldConf(Port)
+
+    assert not App.validate({"port": {"value": 8080}})
+    issues = App.validate({"port": {"value": 70000}})
+    assert [issue.path for issue in issues] == ["port"]
+    assert isinstance(issues[0].error, ValueError)
+
+
+def test_field_attributes_match_lookup():
+    """Declared field attributes return the same as get(key, mode="auto")."""
+
+    class Sub(ConfigurationObj):
+        """Nested settings."""
+
+        port = FieldInt(default=1)
+
+    class Root(ConfigurationObj):
+        """Root settings."""
+
+        class Meta:
+            """Root settings."""
+
+            extra_fields = True
+
+        name = Field(default="app")
+        computed = Field(default=lambda node: f"{node.__node_parent__.name}-x")
+        sub = FieldConf(Sub)
+        items = Field(default="shadowed by the method")
+
+    config = Root(value={"sub": {"port": "3"}, "extra": 5})
+    assert Root.name.query("default") == "app"
+    for key in ("name", "computed", "sub", "extra"):
+        assert getattr(config, key) == config.get(key, mode="auto")
+    assert config.computed == "app-x"
+    assert config.sub.port == 3
+    assert callable(config.items)
+
+    config.name = "other"
+    assert config.name == "other"
+    assert config.computed == "other-x"
+    with pytest.raises(AttributeError):
+        getattr(config, "missing")
+
+
+def test_field_attributes_keep_overriden_hooks():
+    """post_dump and lookup overrides still apply to field attributes."""
+
+    class Shout(Leaf):
+        """Leaf dumping uppercased values."""
+
+        def post_dump(self, value):
+            return value.upper()
+
+    class Base(ConfigurationObj):
+        """Base settings."""
+
+        name = Field(Shout, default="app")
+
+    class Prefixed(Base):
+        """Settings reading every child with a prefix."""
+
+        name = Field(default="base")
+
+        def get(self, key, default=UNSET_ARG, mode="auto"):
+            return f"prefixed-{super().get(key, default=default, mode=mode)}"
+
+    assert Base().name == "APP"
+    assert Base(value={"name": "x"}).name == "X"
+    assert Prefixed.name.query("default") == "base"
+    assert Prefixed().name == "prefixed-base"
+
+
+def test_field_attributes_follow_patched_lookup():
+    """Lookup methods patched after class creation apply to field attributes."""
+
+    class Settings(ConfigurationObj):
+        """Settings with an alias child."""
+
+        name = Field(default="app")
+        alias = Field(default="patched")
+
+    config = Settings()
+    assert config.name == "app"
+
+    def get_child(self, key, noexceptions=False):
+        key = "alias" if key == "name" else key
+        return ConfigurationDict.get_child(self, key, noexceptions=noexceptions)
+
+    Settings.get_child = get_child
+    assert config.name == "patched"
+    del Settings.get_child
+    assert config.name == "app"
+
+
+def test_freeze_locks_tree(base_config_class):
+    """Frozen trees refuse changes and return shared read-only values."""
+
+    config = base_config_class(value={"field3": 7}).freeze()
+    assert config.__node_frozen__ and config("field4").__node_frozen__
+
+    value = config.get_value()
+    assert isinstance(value, FrozenDict)
+    assert value is config.get_value()
+    assert value["field3"] == 7
+    assert isinstance(config.field4, FrozenDict)
+    with pytest.raises(TypeError):
+        value["field3"] = 8
+
+    with pytest.raises(FrozenConfiguration):
+        config.field3 = 8
+    with pytest.raises(FrozenConfiguration):
+        config.set_value({"field3": 8})
+    with pytest.raises(FrozenConfiguration):
+        config.other = 1
+    assert config.field3 == 7
+
+
+def test_frozen_hash_and_copies(base_config_class):
+    """Frozen trees hash by value, copies are mutable plain trees."""
+
+    config = base_config_class(value={"field3": 7}).freeze()
+    same = base_config_class(value={"field3": 7}).freeze()
+    other = base_config_class(value={"field3": 8}).freeze()
+    assert config == same and hash(config) == hash(same)
+    assert config != other
+    assert {config: "cached"}[same] == "cached"
+    assert base_config_class() != base_config_class()
+
+    copied = config.deepcopy()
+    assert not copied.__node_frozen__
+    assert isinstance(copied.get_value()["field4"], dict)
+    copied.field3 = 9
+    assert copied.get_value()["field3"] == 9
+    assert config.field3 == 7
+
+
+def test_meta_frozen_class():
+    """Meta.frozen freezes instances once built."""
+
+    class Sub(ConfigurationObj):
+        """Nested settings."""
+
+        tags = Field(default=["a"])
+
+    class Frozen(ConfigurationObj):
+        """Frozen settings."""
+
+        class Meta:
+            """Frozen settings."""
+
+            frozen = True
+
+        sub = FieldConf(Sub)
+        port = FieldInt(default=1)
+
+    config = Frozen(value={"port": "2"})
+    assert config.port == 2
+    assert isinstance(config.sub.tags, FrozenList)
+    with pytest.raises(FrozenConfiguration):
+        config.sub.tags = ["b"]
+    assert config.deepcopy().__node_frozen__
+
+
+def test_freeze_merge_result_keeps_inputs_mutable(base_config_class):
+    """Freezing a merge result locks only the result tree."""
+
+    left = base_config_class(value={"field3": 1})
+    right = base_config_class(value={"field2": "right"}).freeze()
+    merged = left.merge(right)
+    assert not merged.__node_frozen__
+    merged.field3 = 2
+    merged.field2 = "merged"
+
+    merged.freeze()
+    with pytest.raises(FrozenConfiguration):
+        merged.field3 = 3
+    left.field3 = 9
+    assert left.field3 == 9
+    assert merged.field3 == 2
+    assert merged.field2 == "merged"
+    assert right.field2 == "right"
@@ -2,7 +2,7 @@
 
 import pytest
 
-from superconf.nodes import NOT_SET, Node
+from superconf.nodes import NOT_SET, Node, invalidate_node_plans
 
 
 class TestNodeBase:
@@ -194,6 +194,74 @@ class TestNodeNested:
         assert value == "grandchild"
         assert report == ["class_meta:Meta.OVERRIDE_VALUE"]
 
+    def test_23_cached_names_follow_reparenting(self):
+        """Full names and keys are cached and refreshed on re-parenting."""
+        root = Node(key="root")
+        other = Node(key="other")
+        child = Node(key="child", parent=root)
+        leaf = Node(key=0, parent=child)
+
+        assert leaf.__node_fname__ == "root.child.0"
+        assert leaf.__node_fkey__ == "root.child.0"
+        assert "__node_fname_cache__" in leaf.__dict__
+
+        child.__node_parent__ = other
+        assert leaf.__node_fname__ == "other.child.0"
+
+        root.__node_key__ = "renamed"
+        other.__node_key__ = None
+        assert leaf.__node_fname__ == "Node.child.0"
+        assert leaf.__node_fkey__ == ".child.0"
+
+
+class TestNodeConfigPlan:
+    """Test suite for per-class config resolution plans."""
+
+    def test_31_plan_invalidated_on_class_change(self):
+        """Class level changes are seen after the plan was cached."""
+
+        class PlanNode(Node):
+            class Meta:
+                NAME = "meta"
+
+        node = PlanNode()
+        assert node.__node_get_self_config__("NAME") == "meta"
+        assert "__node_plan__" in PlanNode.__dict__
+
+        PlanNode.Meta = type("Meta", (), {"NAME": "patched"})
+        assert node.__node_get_self_config__("NAME") == "patched"
+
+        PlanNode.Meta.NAME = "in_place"
+        invalidate_node_plans()
+        assert node.__node_get_self_config__("NAME") == "in_place"
+
+    def test_32_instance_overrides_apply_on_top(self):
+        """Instance meta__ attributes and bound methods still resolve per instance."""
+
+        class PlanNode(Node):
+            meta__NAME = "class"
+
+            def meta__BOUND(self):
+                "Descriptor setting, must be bound to the instance"
+                return self.__node_key__
+
+        node1 = PlanNode(key="k1")
+        node2 = PlanNode(key="k2")
+        node2.meta__NAME = "instance"
+
+        assert node1.__node_get_self_config__("NAME") == "class"
+        assert node2.__node_get_self_config__("NAME") == "instance"
+        assert node1.__node_get_self_config__("BOUND")() == "k1"
+        assert node2.__node_get_self_config__("BOUND")() == "k2"
+
+        # Mutable results are still copied per query
+        class ListNode(Node):
+            meta__ITEMS = ["a"]
+
+        items = ListNode().__node_get_self_config__("ITEMS")
+        items.append("b")
+        assert ListNode().__node_get_self_config__("ITEMS") == ["a"]
+
 
 # if __name__ == '__main__':
 #     pytest.main([__file__])
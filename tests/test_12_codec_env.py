@@ -1,13 +1,18 @@
 """Unit tests for the standalone environment codec in lib.codec_env."""
 
+import io
+
 import pytest
 
 from superconf.lib.codec_env import (
     CodecEnvConflictError,
     CodecEnvPrefixError,
     expand_env,
+    filter_env,
     flatten_env,
+    iter_flatten_env,
     to_dotenv,
+    write_dotenv,
 )
 
 pytestmark = pytest.mark.unit
@@ -45,6 +50,24 @@ def test_expand_compacts_list_holes_silently():
     assert result == {"tags": ["a", "c"]}
 
 
+def test_expand_sparse_indexes_scale_with_entries():
+    """Huge or scattered indexes do not allocate the whole range."""
+    environ = {
+        "APP__HOSTS__5000000000": "typo",
+        "APP__HOSTS__10__NAME": "b",
+        "APP__HOSTS__2__NAME": "a",
+        "APP__MATRIX__3__7": "x",
+    }
+    result = expand_env(environ, prefix="APP")
+    assert result == {
+        "hosts": [{"name": "a"}, {"name": "b"}, "typo"],
+        "matrix": [["x"]],
+    }
+
+    with pytest.raises(CodecEnvConflictError, match="existing list incompatible"):
+        expand_env({"APP__A__0": "x", "APP__A__B": "y"}, prefix="APP")
+
+
 def test_expand_accepts_trailing_separator_on_prefix():
     """Prefix may be passed with a trailing separator."""
     result = expand_env({"APP__NAME": "x"}, prefix="APP__")
@@ -57,6 +80,29 @@ def test_expand_prefix_is_case_insensitive():
     assert result == {"name": "x"}
 
 
+def test_filter_env_reads_matching_values_only():
+    """Only values of matching keys are read, in environ order."""
+
+    class Environ(dict):
+        """Mapping recording which values are read."""
+
+        reads = []
+
+        def __getitem__(self, key):
+            self.reads.append(key)
+            return super().__getitem__(key)
+
+        def items(self):
+            raise AssertionError("values of every key should not be read")
+
+    environ = Environ(
+        {"OTHER": "x", "app__b": "1", "APPX__C": "2", "APP__A": "3", "stra\u00dfe": "4"}
+    )
+    assert filter_env(environ, "app") == {"app__b": "1", "APP__A": "3"}
+    assert Environ.reads == ["app__b", "APP__A"]
+    assert filter_env({"\u00df__X": "1"}, "SS") == {"\u00df__X": "1"}
+
+
 def test_expand_empty_prefix_raises():
     """Empty prefix is rejected."""
     with pytest.raises(CodecEnvPrefixError):
@@ -83,6 +129,13 @@ def test_expand_container_then_leaf_conflict_raises():
         expand_env(environ, prefix="APP")
 
 
+@pytest.mark.parametrize("key", ["APP__1", "APP__0__HOST"])
+def test_expand_index_at_root_raises(key):
+    """The root is a dict, a leading list index conflicts."""
+    with pytest.raises(CodecEnvConflictError, match="root is a dict"):
+        expand_env({key: "v"}, prefix="APP")
+
+
 def test_flatten_nested_structure():
     """Flatten nested dict/list structures to PREFIX__PATH keys."""
     data = {
@@ -138,3 +191,70 @@ def test_to_dotenv_and_export():
     export_text = to_dotenv(env_map, export=True)
     assert export_text.startswith("export ")
     assert "export APP__OK=1" in export_text
+
+
+def test_iter_flatten_env_streams_in_data_order():
+    """Pairs come in traversal order, flatten_env sorts the same pairs."""
+    data = {"z": 1, "tags": ["a", None, "c"], "db": {"host": "h", "x": None}}
+    pairs = iter_flatten_env(data, prefix="app", skip_none=False)
+    assert next(pairs) == ("APP__Z", "1")
+    assert list(pairs) == [
+        ("APP__TAGS__0", "a"),
+        ("APP__TAGS__1", ""),
+        ("APP__TAGS__2", "c"),
+        ("APP__DB__HOST", "h"),
+        ("APP__DB__X", ""),
+    ]
+    assert list(flatten_env(data, prefix="APP")) == [
+        "APP__DB__HOST",
+        "APP__TAGS__0",
+        "APP__TAGS__2",
+        "APP__Z",
+    ]
+    deep = {"a": {"b": {"c": {"d": [True]}}}}
+    assert dict(iter_flatten_env(deep, "APP", uppercase_keys=False)) == {
+        "APP__a__b__c__d__0": "true"
+    }
+    with pytest.raises(CodecEnvConflictError):
+        next(iter_flatten_env(["x"], prefix="APP"))
+
+
+@pytest.mark.parametrize("uppercase_keys", [True, False])
+def test_iter_flatten_env_sorted_matches_flatten_env(uppercase_keys):
+    """Sorted pairs equal flatten_env, even when keys collide or interleave."""
+    data = {
+        "b": {"x": 1, "y": None},
+        "B": {"x": 2},
+        "a": {"a": 1, "z": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]},
+        "a_": {"b": 2, "_c": 3},
+        "a__b": "k",
+        "c": None,
+    }
+    for skip_none in (True, False):
+        pairs = iter_flatten_env(
+            data,
+            "APP",
+            skip_none=skip_none,
+            uppercase_keys=uppercase_keys,
+            sort_keys=True,
+        )
+        assert list(pairs) == list(
+            flatten_env(
+                data, "APP", skip_none=skip_none, uppercase_keys=uppercase_keys
+            ).items()
+        )
+
+
+def test_write_dotenv_streams_lines():
+    """write_dotenv writes pairs or mappings line by line."""
+    stream = io.StringIO()
+    count = write_dotenv(iter_flatten_env({"b": "x y", "a": 1}, "APP"), stream)
+    assert count == 2
+    assert stream.getvalue() == 'APP__B="x y"\nAPP__A=1\n'
+
+    env_map = {"APP__B": "2", "APP__A": "1"}
+    stream = io.StringIO()
+    write_dotenv(env_map, stream, export=True)
+    assert stream.getvalue() == "export APP__B=2\nexport APP__A=1\n"
+    assert to_dotenv(env_map) == "APP__A=1\nAPP__B=2\n"
+    assert to_dotenv({}) == ""
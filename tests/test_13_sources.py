@@ -1,17 +1,28 @@
 """Unit tests for configuration data sources."""
 
+import copy
+import io
+import os
+import pickle
+from pathlib import Path
+
 import pytest
 
+from superconf import common
+from superconf.common import from_json, from_yaml, to_json, to_yaml
 from superconf.configuration import ConfigurationObj
 from superconf.fields import FieldBool, FieldInt, FieldString
+from superconf.lib.frozen import thaw
 from superconf.sources import (
     ConfigSource,
     DictSource,
     EnvSource,
     JsonSource,
+    SourceDumpError,
     SourceLoadError,
     TomlSource,
     YamlSource,
+    base,
 )
 
 pytestmark = pytest.mark.unit
@@ -46,6 +57,105 @@ def test_env_source_load_and_dump(tmp_path):
     dotenv_text = source.dump({"name": "x"}, fmt="dotenv")
     assert "APP__NAME=x" in dotenv_text
 
+    path = tmp_path / "app.env"
+    with open(path, "w", encoding="utf-8") as stream:
+        assert (
+            source.dump({"name": "x", "db": {"port": 1}}, fmt="exports", stream=stream)
+            is None
+        )
+    assert path.read_text(encoding="utf-8") == (
+        "export APP__DB__PORT=1\nexport APP__NAME=x\n"
+    )
+    with pytest.raises(SourceDumpError):
+        source.dump({"name": "x"}, stream=io.StringIO())
+
+
+@pytest.mark.parametrize("fmt", ["dotenv", "exports"])
+def test_env_source_dump_stream_matches_text(fmt):
+    """Streamed env dumps write the same sorted, deduplicated text."""
+    source = EnvSource("env", prefix="APP")
+    data = {"name": "x", "db": {"port": 1}, "DB": {"PORT": 2}, "tags": ["a", "b"]}
+    stream = io.StringIO()
+    assert source.dump(data, fmt=fmt, stream=stream) is None
+    assert stream.getvalue() == source.dump(data, fmt=fmt)
+    assert stream.getvalue().count("APP__DB__PORT=") == 1
+
+
+def test_env_source_dump_stream_writes_lines():
+    """Streamed env dumps write each line as it is produced."""
+
+    class Recorder(io.StringIO):
+        "StringIO keeping every write call"
+
+        def __init__(self):
+            super().__init__()
+            self.chunks = []
+
+        def write(self, text):
+            self.chunks.append(text)
+            return super().write(text)
+
+    source = EnvSource("env", prefix="APP")
+    data = {"svc": [{"name": f"s{i}", "port": i} for i in range(50)]}
+    stream = Recorder()
+    source.dump(data, fmt="dotenv", stream=stream)
+    assert len(stream.chunks) == 100
+    assert stream.chunks[0] == "APP__SVC__0__NAME=s0\n"
+    assert stream.getvalue() == source.dump(data, fmt="dotenv")
+
+
+def test_env_source_reuses_expansion():
+    """EnvSource expands again only when matching variables change."""
+    environ = {"APP__DB__HOST": "a", "OTHER": "x"}
+    source = EnvSource("env", prefix="APP", environ=environ)
+    first = source.load()
+    with pytest.raises(TypeError):
+        first["db"]["host"] = "b"
+
+    environ["OTHER"] = "y"
+    assert source.load() is first
+    environ["APP__DB__HOST"] = "b"
+    second = source.load()
+    assert second == {"db": {"host": "b"}}
+    assert source.load() is second
+
+    source.invalidate()
+    assert source.load() is not second
+
+
+def test_env_source_scans_environ_on_size_change():
+    """Unchanged environ sizes reuse the matching keys without a scan."""
+
+    class Environ(dict):
+        "Dict counting full key scans"
+
+        scans = 0
+
+        def __iter__(self):
+            Environ.scans += 1
+            return super().__iter__()
+
+    environ = Environ({"APP__DB__HOST": "a", "OTHER": "x"})
+    source = EnvSource("env", prefix="APP", environ=environ)
+    assert source.load() == {"db": {"host": "a"}}
+    source.fingerprint()
+    environ["APP__DB__HOST"] = "b"
+    assert source.load() == {"db": {"host": "b"}}
+    assert Environ.scans == 1
+
+    environ["APP__DB__PORT"] = "1"
+    assert source.load() == {"db": {"host": "b", "port": "1"}}
+    del environ["APP__DB__HOST"]
+    assert source.load() == {"db": {"port": "1"}}
+    assert Environ.scans == 3
+
+    # Replaced without size change: seen once invalidated
+    del environ["OTHER"]
+    environ["APP__NAME"] = "x"
+    assert "name" not in source.load()
+    source.invalidate()
+    assert source.load() == {"db": {"port": "1"}, "name": "x"}
+
 
 def test_json_source_string_and_file(tmp_path):
     """JsonSource loads from string and path."""
@@ -59,6 +169,45 @@ def test_json_source_string_and_file(tmp_path):
     assert file_source.load() == {"port": 9}
 
 
+def test_text_source_fingerprint_inline_and_file(tmp_path):
+    """Inline text never stats as a path; files fingerprint on stat."""
+    long_text = "name: inline\n" + "# padding\n" * 500
+    source = YamlSource("file", data=long_text)
+    assert source.load() == {"name": "inline"}
+    first = source.fingerprint()
+    assert first == source.fingerprint()
+    source.invalidate()
+    assert source.fingerprint() != first
+
+    path = tmp_path / "cfg.yml"
+    path.write_text("workers: 3\n", encoding="utf-8")
+    file_source = YamlSource("file", path=path)
+    before = file_source.fingerprint()
+    path.write_text("workers: 30\n", encoding="utf-8")
+    assert file_source.fingerprint() != before
+    assert YamlSource("file", path=tmp_path / "missing.yml").fingerprint() is None
+
+
+def test_text_source_decides_inline_once(tmp_path, monkeypatch):
+    """Path or inline text is decided at creation, loads do not stat text."""
+    path = tmp_path / "cfg.yml"
+    path.write_text("workers: 3\n", encoding="utf-8")
+    file_source = YamlSource("file", data=str(path))
+    source = YamlSource("inline", data="name: inline\n")
+
+    def no_stat(*_args, **_kwargs):
+        raise AssertionError("inline text was checked as a path")
+
+    monkeypatch.setattr(Path, "is_file", no_stat)
+    monkeypatch.setattr(Path, "stat", no_stat)
+    assert source.load() == {"name": "inline"}
+    assert source.load() == {"name": "inline"}
+    assert source.fingerprint() == source.fingerprint()
+    monkeypatch.undo()
+    assert file_source.load() == {"workers": 3}
+    assert file_source.fingerprint()[1] == str(path)
+
+
 def test_yaml_source_string_and_file(tmp_path):
     """YamlSource loads from string and path."""
     source = YamlSource("file", data="name: from-yaml\n")
@@ -69,6 +218,46 @@ def test_yaml_source_string_and_file(tmp_path):
     assert YamlSource("file", path=path).load() == {"workers": 3}
 
 
+def test_yaml_backend_and_fallback(monkeypatch):
+    """libyaml is used when built in, the pure Python classes otherwise."""
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    expected = "libyaml" if hasattr(yaml, "CSafeLoader") else "python"
+    assert common.yaml_backend() == expected
+    frozen = YamlSource("file", data="a: [1]\n").load()
+    assert from_yaml(to_yaml({"frozen": frozen})) == {"frozen": {"a": [1]}}
+
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    monkeypatch.setattr(common, "_YAML", None)
+    assert common.yaml_backend() == "python"
+    assert from_yaml("a: [1, {b: 2}]\n") == {"a": [1, {"b": 2}]}
+    assert to_yaml(YamlSource("file", data="a: [1]\n").load()) == "a:\n- 1\n"
+    monkeypatch.setattr(common, "_YAML", None)
+
+
+def test_yaml_multi_document(tmp_path):
+    """Multi-document streams merge in order or stream one by one."""
+    text = "a: 1\nnested: {x: 1, y: 1}\n---\n---\nnested: {y: 2}\nb: [1]\n"
+    assert list(common.from_yaml_all(text)) == [
+        {"a": 1, "nested": {"x": 1, "y": 1}},
+        None,
+        {"nested": {"y": 2}, "b": [1]},
+    ]
+    source = YamlSource("file", data=text, all_documents=True)
+    assert source.load() == {"a": 1, "nested": {"x": 1, "y": 2}, "b": [1]}
+
+    path = tmp_path / "inventory.yml"
+    path.write_text(text, encoding="utf-8")
+    documents = YamlSource("file", path=path).iter_documents()
+    assert next(documents) == {"a": 1, "nested": {"x": 1, "y": 1}}
+    assert list(documents) == [{"nested": {"y": 2}, "b": [1]}]
+
+    with pytest.raises(Exception, match="expected a single document"):
+        YamlSource("file", path=path).load()
+    with pytest.raises(SourceLoadError, match="YAML root must be a dict"):
+        YamlSource("file", data="a: 1\n---\n- 1\n", all_documents=True).load()
+
+
 def test_toml_source_load():
     """TomlSource loads TOML tables when a backend is available."""
     try:
@@ -105,3 +294,74 @@ def test_json_source_requires_object_root():
     source = JsonSource("file", data="[1, 2]")
     with pytest.raises(SourceLoadError):
         source.load()
+
+
+def test_text_source_reuses_parsed_file(tmp_path, monkeypatch):
+    """Unchanged files are neither read nor parsed again."""
+    reads = []
+    real_read_file = base.read_file_bytes
+    monkeypatch.setattr(
+        base, "read_file_bytes", lambda path: reads.append(path) or real_read_file(path)
+    )
+    path = tmp_path / "cfg.yml"
+    path.write_text("db:\n  port: 1\ntags: [a]\n", encoding="utf-8")
+    source = YamlSource("file", path=path)
+
+    first = source.load()
+    assert source.load() is first
+    assert len(reads) == 1
+
+    path.write_text("db:\n  port: 22\ntags: [a]\n", encoding="utf-8")
+    assert source.load()["db"]["port"] == 22
+    assert len(reads) == 2
+
+
+def test_text_source_reads_file_bytes(tmp_path):
+    """Files are read as bytes once, text parsers get decoded text."""
+    path = tmp_path / "cfg.yml"
+    path.write_bytes("name: caf\u00e9\r\ntags: [a]\r\n".encode("utf-8"))
+    assert common.read_file_bytes(path) == path.read_bytes()
+    assert common.read_file(path) == "name: caf\u00e9\ntags: [a]\n"
+    assert YamlSource("file", path=path).load() == {"name": "caf\u00e9", "tags": ["a"]}
+
+    json_path = tmp_path / "cfg.json"
+    json_path.write_bytes(b'\xef\xbb\xbf{"name": "bom"}\r\n')
+    assert JsonSource("file", path=json_path).load() == {"name": "bom"}
+
+    toml_path = tmp_path / "cfg.toml"
+    toml_path.write_bytes(b'name = "toml"\r\n')
+    try:
+        assert TomlSource("file", path=toml_path).load() == {"name": "toml"}
+    except SourceLoadError:
+        pytest.skip("tomllib/tomli not available")
+
+
+def test_text_source_content_hash_skips_parse(tmp_path):
+    """content_hash reuses the parse when a touched file is unchanged."""
+    path = tmp_path / "cfg.json"
+    path.write_text('{"port": 9}', encoding="utf-8")
+    source = JsonSource("file", path=path, content_hash=True)
+    first = source.load()
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert source.load() is first
+
+
+def test_loaded_data_is_read_only():
+    """Cached parse results are frozen; thaw/copies are mutable."""
+    source = YamlSource("file", data="db:\n  host: x\ntags: [a, b]\n")
+    data = source.load()
+    assert isinstance(data, dict) and isinstance(data["tags"], list)
+    with pytest.raises(TypeError):
+        data["db"]["host"] = "y"
+    with pytest.raises(TypeError):
+        data["tags"].append("c")
+
+    mutable = thaw(data)
+    mutable["tags"].append("c")
+    assert copy.deepcopy(data) == {"db": {"host": "x"}, "tags": ["a", "b"]}
+    assert type(copy.deepcopy(data)["tags"]) is list
+    assert pickle.loads(pickle.dumps(data)) == data
+    assert from_yaml(to_yaml(data)) == data
+    assert from_json(to_json(data)) == data
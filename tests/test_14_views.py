@@ -1,7 +1,15 @@
 """Unit tests for multi-source View precedence and materialize."""
 
+import asyncio
+import threading
+import time
+
 import pytest
 
+from superconf.configuration import ConfigurationObj
+from superconf.container import schema_projection
+from superconf.fields import Field, FieldConf, FieldInt, FieldString
+from superconf.lib.projection import Projection
 from superconf.sources import DictSource, EnvSource, YamlSource
 from superconf.views import (
     TWELVE_FACTOR_ORDER,
@@ -86,3 +94,231 @@ def test_view_with_yaml_layer(tmp_path):
     view.add(DictSource("cli", {"workers": 9}))
 
     assert view.materialize() == {"name": "from-file", "workers": 9}
+
+
+class CountingSource(DictSource):
+    """DictSource counting load() calls."""
+
+    loads = 0
+
+    def load(self):
+        self.loads += 1
+        return super().load()
+
+
+def test_view_caches_layers_until_source_changes(tmp_path):
+    """Lookups reuse loaded layers; changed or invalidated sources reload."""
+    path = tmp_path / "app.yml"
+    path.write_text("name: from-file\n", encoding="utf-8")
+    environ = {"APP__WORKERS": "2"}
+    cli_data = {"debug": "no"}
+    cli = CountingSource("cli", cli_data)
+
+    view = View(order=["cli", "env", "file"])
+    view.add(cli)
+    view.add(EnvSource("env", prefix="APP", environ=environ))
+    view.add(YamlSource("file", path=path))
+
+    for _ in range(5):
+        assert view.get("name") == "from-file"
+        assert view.get("debug") == "no"
+    assert cli.loads == 1
+
+    path.write_text("name: changed-file\n", encoding="utf-8")
+    environ["APP__WORKERS"] = "4"
+    assert view.get("name") == "changed-file"
+    assert view.get("workers") == "4"
+
+    # In-place mapping changes need an explicit invalidation
+    cli_data["debug"] = "yes"
+    assert view.get("debug") == "no"
+    cli.invalidate()
+    assert view.get("debug") == "yes"
+    assert cli.loads == 2
+
+    view.invalidate("cli")
+    view.materialize()
+    assert cli.loads == 3
+
+
+def test_view_layered_mapping_resolves_lazily():
+    """layered() merges nested dicts on access without copying layers."""
+    tags = ["a", "b"]
+    view = View(order=["cli", "file", "defaults"])
+    view.add(
+        DictSource(
+            "defaults",
+            {"db": {"host": "local", "port": 1, "opts": {"ssl": False}}, "tags": tags},
+        )
+    )
+    view.add(DictSource("file", {"db": {"port": 2}, "name": "file"}))
+    view.add(DictSource("cli", {"db": {"opts": {"ssl": True}}, "name": None}))
+
+    layered = view.layered()
+    assert list(layered) == ["db", "tags", "name"]
+    assert layered["tags"] is tags
+    assert layered["name"] is None
+    assert layered["db"]["port"] == 2
+    assert dict(layered["db"]["opts"]) == {"ssl": True}
+
+    merged = view.materialize()
+    assert merged == {
+        "db": {"host": "local", "port": 2, "opts": {"ssl": True}},
+        "tags": ["a", "b"],
+        "name": None,
+    }
+    assert merged["tags"] is not tags
+
+
+def test_configuration_fed_from_layered_mapping():
+    """A ConfigurationObj accepts a layered mapping as value."""
+
+    class DbConfig(ConfigurationObj):
+        host = FieldString(default="localhost")
+        port = FieldInt(default=5432)
+
+    class AppConfig(ConfigurationObj):
+        db = FieldConf(DbConfig)
+        extra = Field(default={})
+
+    view = View(order=["cli", "defaults"])
+    view.add(DictSource("defaults", {"db": {"host": "db1"}, "extra": {"a": 1}}))
+    view.add(DictSource("cli", {"db": {"port": "6543"}, "extra": {"b": 2}}))
+
+    config = AppConfig(value=view.layered())
+    assert config.get_value() == AppConfig(value=view.materialize()).get_value()
+    assert config.db.port == 6543
+    assert type(config.extra) is dict
+
+
+def test_view_path_index_matches_walk():
+    """Indexed dotted lookups match walking the nested data."""
+    view = View(order=["file"])
+    view.add(
+        DictSource(
+            "file",
+            {"db": {"pool": {"size": 5}, "a.b": 1}, "x.y": 2, "items": [{"n": 1}]},
+        )
+    )
+
+    assert view.get("db.pool.size") == 5
+    assert view.get("db.pool") == {"size": 5}
+    assert view.get("items") == [{"n": 1}]
+    for missing in ("db.a.b", "x.y", "items.0.n", "db.pool.size.x"):
+        assert view.get(missing, default=None) is None
+
+
+class SlowSource(DictSource):
+    """DictSource recording the loading thread after a short delay."""
+
+    def __init__(self, name, data, threads):
+        super().__init__(name, data)
+        self.threads = threads
+
+    def load(self):
+        time.sleep(0.05)
+        self.threads.add(threading.get_ident())
+        return super().load()
+
+
+def test_view_parallel_and_async_loading_keep_precedence():
+    """Concurrent loading merges in get_order() precedence."""
+    threads = set()
+    view = View(order=["cli", "env", "file", "defaults"])
+    view.add(SlowSource("defaults", {"name": "defaults", "a": 1}, threads))
+    view.add(SlowSource("file", {"name": "file", "b": 2}, threads))
+    view.add(SlowSource("env", {"name": "env"}, threads))
+    view.add(SlowSource("cli", lambda: {"name": "cli"}, threads))
+    expected = {"name": "cli", "a": 1, "b": 2}
+
+    assert [name for name, _ in view.load_layers(parallel=True)] == view.get_order()
+    assert view.materialize(parallel=True, max_workers=2) == expected
+    assert len(threads) > 1
+    assert asyncio.run(view.amaterialize()) == expected
+    layers = asyncio.run(view.aload_layers())
+    assert [name for name, _ in layers] == view.get_order()
+
+
+class ProjectedDb(ConfigurationObj):
+    """Strict nested schema: only declared keys are read."""
+
+    host = FieldString(default="localhost")
+    port = FieldInt(default=5432)
+
+
+class ProjectedFree(ConfigurationObj):
+    """Nested schema accepting extra keys: read whole."""
+
+    class Meta:
+        """Keep undeclared keys."""
+
+        extra_fields = True
+
+    name = FieldString()
+
+
+class ProjectedApp(ConfigurationObj):
+    """Schema reading a slice of a shared platform config."""
+
+    name = FieldString(default="app")
+    db = FieldConf(ProjectedDb)
+    free = FieldConf(ProjectedFree)
+    tags = Field()
+
+
+def test_projection_trie():
+    """Projections merge covered paths and keep selected subtrees."""
+    projection = Projection(["db.host", "db", "tags.0", "x.y.z"])
+    assert projection.paths == {("db",), ("tags", "0"), ("x", "y", "z")}
+    assert projection == Projection([("x", "y", "z"), "db", "tags.0"])
+    assert len({projection, Projection(["db", "x.y.z", "tags.0"])}) == 1
+    assert projection.child("db") is None
+    assert projection.select(["db", "port"]) is True
+    assert projection.select(["other"]) is False
+    assert projection.select(["x"]) == Projection(["y.z"])
+    data = {"db": {"port": 1}, "x": {"y": {"z": 1, "w": 2}, "v": 3}, "other": 4}
+    assert projection.apply(data) == {"db": {"port": 1}, "x": {"y": {"z": 1}}}
+    with pytest.raises(ValueError):
+        Projection(["db..host"])
+
+
+def test_schema_projection():
+    """Declared paths are derived from the schema, extras keep subtrees."""
+    assert schema_projection(ProjectedApp) == Projection(
+        ["name", "db.host", "db.port", "free", "tags"]
+    )
+    assert schema_projection(ProjectedFree) is None
+
+
+def test_view_materialize_with_projection():
+    """Sources only return the projected slice, layers cache per projection."""
+    platform = {
+        "name": "platform",
+        "db": {"host": "db", "port": 1, "pool": {"size": 10}},
+        "free": {"name": "f", "other": 1},
+        "services": {f"svc{i}": {"port": i} for i in range(100)},
+    }
+    environ = {
+        "APP__DB__PORT": "2",
+        "APP__SERVICES__SVC1__PORT": "9",
+        "APP__TAGS__0": "a",
+    }
+    view = View(order=TWELVE_FACTOR_ORDER)
+    view.add(DictSource("file", platform))
+    view.add(EnvSource("env", prefix="APP", environ=environ))
+
+    merged = view.materialize(projection=ProjectedApp)
+    assert merged == {
+        "name": "platform",
+        "db": {"host": "db", "port": "2"},
+        "free": {"name": "f", "other": 1},
+        "tags": ["a"],
+    }
+    config = ProjectedApp(value=merged)
+    assert config.db.port == 2
+    assert view.materialize(projection=["db.port"]) == {"db": {"port": "2"}}
+    assert asyncio.run(view.amaterialize(projection="name")) == {"name": "platform"}
+    assert "services" in view.materialize()
+
+    view.invalidate("env")
+    assert not [key for key in view._layer_cache if key[0] == "env"]
@@ -1,15 +1,20 @@
 """Unit tests for 12-factor load helpers."""
 
+import os
+
 import pytest
 
 from superconf.configuration import ConfigurationObj
-from superconf.fields import FieldBool, FieldInt, FieldString
+from superconf.exceptions import UndeclaredField
+from superconf.fields import Field, FieldBool, FieldInt, FieldString
+from superconf.lib.snapshot_cache import SnapshotCache
 from superconf.twelve_factor import (
     TwelveFactorError,
     build_12factor_view,
     from_12factor,
     load_12factor,
 )
+from superconf.views import View
 
 pytestmark = pytest.mark.unit
 
@@ -110,3 +115,94 @@ def test_build_12factor_view_explain():
     assert view.get("name") == "cli-name"
     merged = view.materialize()
     assert merged["name"] == "cli-name"
+
+
+def _count_materialize(monkeypatch):
+    """Count View.materialize calls made by load_12factor."""
+    calls = []
+    original = View.materialize
+
+    def counting(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(View, "materialize", counting)
+    return calls
+
+
+def test_snapshot_cache_reuses_merged_data(tmp_path, monkeypatch):
+    """A cache hit skips the layers, any input change is a miss."""
+    calls = _count_materialize(monkeypatch)
+    cache_dir = tmp_path / "cache"
+    config_path = tmp_path / "config.yml"
+    config_path.write_text("name: from-file\ncount: 1\n", encoding="utf-8")
+    environ = {"APP__COUNT": "2", "OTHER": "x"}
+    kwargs = {
+        "env_prefix": "APP",
+        "file": config_path,
+        "cli": {"enabled": False},
+        "cache_dir": cache_dir,
+    }
+
+    config = load_12factor(AppConfig, environ=environ, **kwargs)
+    assert (config.name, config.count, config.enabled) == ("from-file", 2, False)
+    assert len(calls) == 1
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    config = load_12factor(AppConfig, environ=dict(environ, OTHER="y"), **kwargs)
+    assert (config.name, config.count, config.enabled) == ("from-file", 2, False)
+    assert len(calls) == 1
+
+    config = load_12factor(AppConfig, environ=dict(environ, APP__COUNT="3"), **kwargs)
+    assert config.count == 3
+    assert len(calls) == 2
+
+    config_path.write_text("name: edited\ncount: 1\n", encoding="utf-8")
+    os.utime(config_path, ns=(1, 1))
+    config = load_12factor(AppConfig, environ=environ, **kwargs)
+    assert config.name == "edited"
+    assert len(calls) == 3
+
+
+def test_snapshot_cache_ignores_broken_entries(tmp_path):
+    """Unreadable entries are misses and get rewritten."""
+    cache = SnapshotCache(tmp_path)
+    cache.store("key", {"name": "cached"})
+    assert cache.load("key") == {"name": "cached"}
+
+    cache.path_for("key").write_bytes(b"not a pickle")
+    assert cache.load("key", default="miss") == "miss"
+    cache.store("key", {"name": "again"})
+    assert cache.load("key") == {"name": "again"}
+    assert [path.name for path in tmp_path.iterdir()] == ["key.pickle"]
+    assert cache.clear() == 1
+
+
+def test_snapshot_cache_skips_runtime_defaults(tmp_path):
+    """Schemas with callable defaults are never cached."""
+
+    class DynamicConfig(ConfigurationObj):
+        """Schema with a default computed at runtime."""
+
+        name = Field(default=lambda node: "dynamic")
+
+    config = load_12factor(DynamicConfig, cli={}, cache_dir=tmp_path)
+    assert config.name == "dynamic"
+    assert not list(tmp_path.iterdir())
+
+
+def test_project_reads_declared_paths_only(tmp_path):
+    """project=True loads only declared paths from a shared file."""
+    config_path = tmp_path / "platform.yml"
+    config_path.write_text(
+        "name: shared\ncount: 3\nother_service:\n  port: 1\n",
+        encoding="utf-8",
+    )
+    environ = {"APP__COUNT": "4", "APP__UNRELATED__X": "y"}
+    with pytest.raises(UndeclaredField):
+        load_12factor(AppConfig, file=config_path)
+
+    config = load_12factor(
+        AppConfig, env_prefix="APP", file=config_path, environ=environ, project=True
+    )
+    assert (config.name, config.count, config.enabled) == ("shared", 4, True)
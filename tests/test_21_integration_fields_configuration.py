@@ -6,11 +6,12 @@ including field validation, type casting, and complex field structures.
 
 import pytest
 
-from superconf.configuration import ConfigurationObj
+from superconf.configuration import ConfigurationDict, ConfigurationObj
 from superconf.exceptions import (
     CastValueFailure,
     InvalidCastConfiguration,
     InvalidField,
+    UndeclaredField,
 )
 from superconf.fields import (
     Field,
@@ -238,3 +239,43 @@ def test_nested_configuration_validation(nested_config_class):
 
     with pytest.raises(InvalidCastConfiguration):
         nested_config_class(value=invalid_nested_values)
+
+
+def test_lazy_children_materialization():
+    """Lazy containers build child nodes on first access only."""
+
+    class LazyDb(ConfigurationObj):
+        """Nested lazy configuration."""
+
+        host = Field(default="localhost")
+        port = FieldInt(default=5432)
+
+    class LazyApp(ConfigurationObj):
+        """Root lazy configuration."""
+
+        class Meta:
+            lazy = True
+
+        name = Field(default="app")
+        db = FieldConf(LazyDb)
+        tags = FieldConf(ConfigurationDict, lazy=True)
+
+    config = LazyApp(value={"db": {"port": "6000"}, "tags": {"a": 1}})
+    children = config.__node_children__
+    assert list(children) == ["name", "db", "tags"]
+    assert not any(children.is_built(key) for key in children)
+
+    assert config.name == "app"
+    assert children.is_built("name")
+    assert not children.is_built("db")
+
+    assert config.get_value() == {
+        "name": "app",
+        "db": {"host": "localhost", "port": 6000},
+        "tags": {"a": 1},
+    }
+    assert config.db.port == 6000
+
+    # Unknown keys are still rejected upfront
+    with pytest.raises(UndeclaredField):
+        LazyApp(value={"unknown": 1})
@@ -23,7 +23,10 @@ from superconf.merge import (
     MERGE_OTHER_DEFAULT,
     MergeKind,
     MergeStrategy,
+    compile_merge,
     infer_merge_kind,
+    merge_all,
+    merge_all_data,
     merge_data,
     merge_maps,
     prefer_other_scalar,
@@ -103,6 +106,18 @@ def test_merge_data_rejects_override_on_list():
         merge_data(["a"], ["b"], MergeStrategy.OVERRIDE, MergeKind.LIST)
 
 
+def test_compile_merge_is_memoized_per_pair():
+    """Enum and string strategies share one compiled callable."""
+    func = compile_merge(MergeStrategy.APPEND, MergeKind.LIST)
+    assert compile_merge("append", MergeKind.LIST) is func
+    assert func(["a"], ["b"]) == ["a", "b"]
+    assert compile_merge("keep", MergeKind.OTHER)("left", "right") == "left"
+    with pytest.raises(ValueError, match="list merge strategy"):
+        compile_merge("override", MergeKind.LIST)
+    with pytest.raises(ValueError, match="Invalid merge strategy"):
+        compile_merge(["unhashable"], MergeKind.LIST)
+
+
 def test_infer_merge_kind_from_values_and_strategy():
     """Kind inference from strategy and value types."""
     assert infer_merge_kind("append") == MergeKind.LIST
@@ -363,3 +378,240 @@ def test_enum_and_string_merge_meta_are_equivalent():
     assert (
         left_enum.merge(right_enum).get_value() == left_str.merge(right_str).get_value()
     )
+
+
+# ---------------------------------------------------------------------------
+# Structural merge (node reuse)
+# ---------------------------------------------------------------------------
+
+
+def test_structural_merge_builds_independent_tree():
+    """Merge results own their nodes, inputs and result change separately."""
+
+    class Server(ConfigurationObj):
+        host = FieldString(default="localhost")
+        port = FieldInt(default=80)
+
+    class AppConfig(ConfigurationObj):
+        name = FieldString(default="default")
+        server = Field(Server)
+
+    left = AppConfig(value={"name": "left", "server": {"port": 8080}})
+    right = AppConfig(value={"name": "right"})
+    merged = left.merge(right)
+
+    assert merged.get_value() == {
+        "name": "right",
+        "server": {"host": "localhost", "port": 8080},
+    }
+    assert merged.__node_parent__ is None
+    assert merged.server.__node_parent__ is merged
+    assert merged.server.get_child("port").__node_parent__ is merged.server
+    assert merged.get_child("name") is not right.get_child("name")
+
+    merged.server.set_value({"port": 99})
+    merged.name = "merged"
+    assert left.get_value() == {
+        "name": "left",
+        "server": {"host": "localhost", "port": 8080},
+    }
+    assert right.get_value()["name"] == "right"
+
+    left.server.port = 9090
+    right.name = "other"
+    assert merged.get_value() == {
+        "name": "merged",
+        "server": {"host": "localhost", "port": 99},
+    }
+
+
+def test_structural_merge_copies_empty_child_containers():
+    """Empty child containers of a merge result are not shared either."""
+
+    class Inner(ConfigurationDict):
+        pass
+
+    class Outer(ConfigurationDict):
+        class Meta:
+            children_class = Inner
+
+    left = Outer(value={"x": {}})
+    merged = left.merge(Outer(value={"y": {"z": 1}}))
+    assert merged.get_value() == {"x": {}, "y": {"z": 1}}
+
+    merged.get_child("x").set_value({"k": 1})
+    assert left.get_value() == {"x": {}}
+    assert merged.get_value() == {"x": {"k": 1}, "y": {"z": 1}}
+
+
+def test_structural_list_merge_rekeys_children():
+    """List merges clone children under their new index."""
+
+    class Items(ConfigurationList):
+        class Meta:
+            merge = MergeStrategy.APPEND
+
+    left = Items(value=["a", "b"])
+    right = Items(value=["c"])
+    merged = left.merge(right)
+
+    assert merged.get_value() == ["a", "b", "c"]
+    assert merged.get_child(0) is not left.get_child(0)
+    assert merged.get_child(2).__node_key__ == 2
+    assert merged.get_child(2).__node_parent__ is merged
+    assert right.get_child(0).__node_key__ == 0
+
+    merged.get_child(0).set_value("z")
+    left.get_child(1).set_value("y")
+    assert left.get_value() == ["a", "y"]
+    assert merged.get_value() == ["z", "b", "c"]
+
+
+# ---------------------------------------------------------------------------
+# N-way merge
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "values, strategy, kind",
+    [
+        ([["a"], ["b"], ["c"]], MergeStrategy.APPEND, MergeKind.LIST),
+        ([["a"], ["b"], ["c"]], MergeStrategy.PREPEND, MergeKind.LIST),
+        ([["a"], ["b"], ["c"]], MergeStrategy.REPLACE, MergeKind.LIST),
+        ([["a"], ["b"], ["c"]], MergeStrategy.KEEP, MergeKind.LIST),
+        (
+            [{"a": {"x": 1}}, {"a": 2, "b": 1}, {"a": {"y": 3}, "c": {"z": 1}}],
+            MergeStrategy.OVERRIDE,
+            None,
+        ),
+        (
+            [{"a": {"x": 1}}, {"a": {"y": 2}}, {"a": {"z": 3}, "b": 1}],
+            MergeStrategy.OVERRIDE,
+            None,
+        ),
+        ([{"a": 1}, {"a": 2, "b": 2}, {"b": 3}], MergeStrategy.OVERRIDE_PRESENT, None),
+        ([{"a": 1}, {"a": 2, "b": 2}, {"c": 3}], MergeStrategy.OVERRIDE_ABSENT, None),
+        ([{"a": 1}, {"b": 2}, {"c": 3}], MergeStrategy.REPLACE, MergeKind.DICT),
+    ],
+)
+def test_merge_all_data_matches_chained_merge_data(values, strategy, kind):
+    """merge_all_data equals folding merge_data left to right."""
+    expected = values[0]
+    for value in values[1:]:
+        expected = merge_data(expected, value, strategy, kind)
+    assert merge_all_data(values, strategy, kind) == expected
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        MergeStrategy.OVERRIDE,
+        MergeStrategy.OVERRIDE_PRESENT,
+        MergeStrategy.OVERRIDE_ABSENT,
+        MergeStrategy.REPLACE,
+        MergeStrategy.KEEP,
+    ],
+)
+def test_merge_all_nodes_matches_chained_merge(strategy):
+    """Node merge_all builds the same tree as chained merge calls."""
+
+    class Server(ConfigurationObj):
+        host = FieldString(default="localhost")
+        port = FieldInt(default=80)
+        tags = FieldList(default=[])
+
+    class AppConfig(ConfigurationObj):
+        class Meta:
+            merge = strategy
+            extra_fields = True
+
+        name = FieldString(default="default")
+        server = Field(Server)
+
+    layers = [
+        AppConfig(value={"name": "base", "server": {"tags": ["a"]}}),
+        AppConfig(value={"server": {"port": 8080, "tags": ["b"]}, "extra": 1}),
+        AppConfig(value={"name": "host", "server": {"host": "h1"}}),
+        AppConfig(value={"server": {"tags": ["c"]}, "other": 2}),
+    ]
+    chained = layers[0]
+    for layer in layers[1:]:
+        chained = chained.merge(layer)
+
+    assert merge_all(layers).get_value() == chained.get_value()
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        MergeStrategy.APPEND,
+        MergeStrategy.PREPEND,
+        MergeStrategy.REPLACE,
+        MergeStrategy.KEEP,
+    ],
+)
+def test_merge_all_list_matches_chained_merge(strategy):
+    """ConfigurationList merge_all keeps chained merge ordering."""
+
+    class Items(ConfigurationList):
+        class Meta:
+            merge = strategy
+
+    layers = [Items(value=["a", "b"]), Items(value=["c"]), Items(value=["d", "e"])]
+    merged = layers[0].merge_all(layers[1:])
+
+    assert merged.get_value() == layers[0].merge(layers[1]).merge(layers[2]).get_value()
+    assert [child.__node_key__ for child in merged.values()] == list(range(len(merged)))
+
+
+def test_merge_all_result_is_independent_of_inputs():
+    """N-way merge results own their nodes, no input changes with them."""
+
+    class Server(ConfigurationObj):
+        host = FieldString(default="localhost")
+        port = FieldInt(default=80)
+
+    class Items(ConfigurationList):
+        class Meta:
+            merge = MergeStrategy.APPEND
+
+    class AppConfig(ConfigurationObj):
+        name = FieldString(default="default")
+        server = Field(Server)
+        tags = Field(Items)
+
+    layers = [
+        AppConfig(value={"name": "base", "tags": ["a"]}),
+        AppConfig(value={"server": {"port": 8080}}),
+        AppConfig(value={"server": {"host": "h1"}, "tags": ["b"]}),
+    ]
+    before = [layer.get_value() for layer in layers]
+    merged = merge_all(layers)
+
+    assert merged.server.__node_parent__ is merged
+    assert merged.tags.get_child(1).__node_parent__ is merged.tags
+    merged.name = "merged"
+    merged.server.set_value({"port": 99})
+    merged.tags.get_child(0).set_value("z")
+    assert [layer.get_value() for layer in layers] == before
+
+    for layer in layers:
+        layer.name = "changed"
+        layer.server.port = 1
+    assert merged.get_value() == {
+        "name": "merged",
+        "server": {"host": "localhost", "port": 99},
+        "tags": ["z", "b"],
+    }
+
+
+def test_merge_all_single_node_returns_it():
+    """Nothing to merge returns the node itself."""
+
+    class Items(ConfigurationList):
+        pass
+
+    items = Items(value=["a"])
+    assert merge_all([items]) is items
+    with pytest.raises(ValueError):
+        merge_all([])
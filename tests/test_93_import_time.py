@@ -0,0 +1,124 @@
+"""Import-time budget for the superconf package.
+
+Short-lived processes pay the package import on every start. These tests
+run ``python -X importtime`` in a fresh interpreter and check that optional
+parts stay unloaded after ``import superconf``.
+
+Wall-clock timings depend on the host, so the budget is relative: the stdlib
+modules superconf needs are imported first, and the remaining cumulative
+import time of ``superconf`` must stay under ``IMPORT_RATIO`` times theirs,
+measured in the same process. ``SUPERCONF_IMPORT_BUDGET_MS`` adds an absolute
+budget for the whole ``import superconf``, e.g. ``100``.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+IMPORT_BUDGET_MS = os.environ.get("SUPERCONF_IMPORT_BUDGET_MS")
+RUNS = 3
+
+# Stdlib modules imported by superconf, used as the timing reference. Own
+# modules take about a third of their time, the ratio leaves room for noise.
+STDLIB_BASELINE = ("typing", "logging", "inspect", "json", "copy")
+IMPORT_RATIO = 1.0
+
+# Modules only needed once anchors, sources, views or parsers are used
+LAZY_MODULES = (
+    "yaml",
+    "tomllib",
+    "tomli",
+    "superconf.lib.anchors",
+    "superconf.sources",
+    "superconf.twelve_factor",
+    "superconf.views",
+)
+
+
+def _run(code, *args):
+    "Run code in a fresh interpreter, return the completed process"
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def _import_times_us(code):
+    "Return the cumulative import time of top-level imports in microseconds"
+    proc = _run(code, "-X", "importtime")
+    times = {}
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        # Nested imports are indented below the name of their importer
+        if (
+            len(parts) == 3
+            and parts[1].strip().isdigit()
+            and not parts[2].startswith("  ")
+        ):
+            times[parts[2].strip()] = int(parts[1])
+    assert "superconf" in times, f"superconf not in importtime:\n{proc.stderr}"
+    return times
+
+
+def test_import_time_budget():
+    """Own superconf modules import faster than the stdlib they rely on."""
+    ratios = []
+    for _ in range(RUNS):
+        times = _import_times_us(
+            f"import {', '.join(STDLIB_BASELINE)}; import superconf"
+        )
+        # A baseline module loaded by another one is in its cumulative time
+        baseline = sum(times.get(name, 0) for name in STDLIB_BASELINE)
+        ratios.append(times["superconf"] / baseline)
+    assert (
+        min(ratios) < IMPORT_RATIO
+    ), f"superconf imports took {min(ratios):.2f}x the stdlib baseline"
+
+    if IMPORT_BUDGET_MS:
+        budget_ms = float(IMPORT_BUDGET_MS)
+        runs_us = [_import_times_us("import superconf") for _ in range(RUNS)]
+        best_ms = min(times["superconf"] for times in runs_us) / 1000
+        assert (
+            best_ms < budget_ms
+        ), f"import superconf took {best_ms:.1f}ms, budget is {budget_ms}ms"
+
+
+def test_import_keeps_optional_modules_unloaded():
+    """Sources, views and parsers load on first access only."""
+    code = (
+        "import sys, superconf\n"
+        f"print([name for name in {LAZY_MODULES!r} if name in sys.modules])\n"
+        "superconf.View, superconf.YamlSource, superconf.ABS\n"
+        "print(sorted(name for name in ('superconf.views', 'superconf.sources',"
+        " 'superconf.lib.anchors') if name in sys.modules))\n"
+    )
+    before, after = _run(code).stdout.splitlines()
+    assert before == "[]"
+    assert after == (
+        "['superconf.lib.anchors', 'superconf.sources', 'superconf.views']"
+    )
+
+
+def test_lazy_public_names():
+    """Lazy names resolve to the module objects and show in dir()."""
+    # pylint: disable-next=import-outside-toplevel
+    import superconf
+    from superconf.sources import YamlSource
+    from superconf.twelve_factor import load_12factor
+    from superconf.views import View
+
+    assert superconf.View is View
+    assert superconf.YamlSource is YamlSource
+    assert superconf.from_12factor is load_12factor
+    assert {"View", "load_12factor", "FileAnchor"} <= set(dir(superconf))
+    assert set(superconf.__all__) >= {"ConfigurationObj", "View", "EnvSource"}
+    with pytest.raises(AttributeError, match="no_such_name"):
+        getattr(superconf, "no_such_name")